@@ -6,12 +6,27 @@ from pathlib import Path
 from fastapi import FastAPI, status
 from fastapi.staticfiles import StaticFiles
 
-from core import DBPool, get_logger, settings
+from core import (
+    DBPool,
+    GoogleVerifier,
+    NotificationHub,
+    SensorGateway,
+    ShotJournal,
+    get_logger,
+    settings,
+)
+from models import (
+    OpenParticipantsRefresher,
+    OpenSessionCache,
+    RevokedSessionCache,
+    SlotCache,
+)
 from routers.v0 import (
     archer_router,
     auth_router,
     faces_router,
     live_stats_router,
+    metrics_router,
     session_router,
     shot_router,
     slot_router,
@@ -26,11 +41,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         app.state.logger = get_logger()
         app.state.logger.info("Starting Server up...")
         app.state.db_pool = await DBPool.open_db_pool()
+        OpenSessionCache.start()
+        RevokedSessionCache.start()
+        await SensorGateway.start()
+        ShotJournal.start()
         yield
     except CancelledError:
         app.state.logger.error("Shutdown interrupted. Cleaning up...")
     finally:
         app.state.logger.debug("Closing DB...")
+        await SensorGateway.close()
+        await ShotJournal.close()
+        await SlotCache.close()
+        await OpenSessionCache.close()
+        await RevokedSessionCache.close()
+        await GoogleVerifier.close()
+        await NotificationHub.close()
+        await OpenParticipantsRefresher.close()
         await DBPool.close_db_pool()
         app.state.logger.info("Server shutdown complete.")
 
@@ -55,6 +82,7 @@ def run() -> FastAPI:
             {"name": "Shots", "description": "Operations about shots domain"},
             {"name": "Faces", "description": "Operations about target faces domain"},
             {"name": "Stats", "description": "Operations about statistics domain"},
+            {"name": "Metrics", "description": "Per-worker runtime counters and gauges"},
         ],
     )
 
@@ -66,6 +94,7 @@ def run() -> FastAPI:
     app.include_router(shot_router, prefix=f"/api/{mayor_version}")
     app.include_router(faces_router, prefix=f"/api/{mayor_version}")
     app.include_router(live_stats_router, prefix=f"/api/{mayor_version}")
+    app.include_router(metrics_router, prefix=f"/api/{mayor_version}")
 
     @app.api_route(
         "/api/{path:path}",
@@ -3,43 +3,73 @@ from core.authentication import (
     GoogleUserData,
     authenticate_archer,
     build_needs_registration_response,
+    decode_claims,
     decode_token,
     hash_session_token,
+    is_session_revoked,
     login_existing_archer,
     register_archer,
+    session_hash_from_sid,
     verify_google_id_token,
 )
 from core.base_manager import BaseManager
+from core.coalescing_queue import CoalescingQueue, SlowConsumerError
 from core.db_pool import DBPool, DBStateError
+from core.face_catalogue import FACE_JSON, FACE_LIST_JSON, FACES_BY_TYPE, SerializedJSON
 from core.face_data import face_data
+from core.google_verifier import GoogleKeySet, GoogleVerifier, KeySet, StaticKeySet
 from core.live_stats_manager import LiveStatsManager
 from core.logger import get_logger
+from core.metrics import Metrics
+from core.notification_hub import NotificationHub
+from core.scoring import score_arrows
+from core.sensor_gateway import SensorGateway, ShotCorrelator
 from core.session_manager import SessionManager
 from core.settings import settings as settings
+from core.shot_journal import ShotJournal
 from core.shot_manager import ShotManager, ShotManagerError
 from core.slot_manager import SlotManager, SlotManagerError
 
 __all__ = [
+    "FACES_BY_TYPE",
+    "FACE_JSON",
+    "FACE_LIST_JSON",
     "AuthDeps",
     "BaseManager",
+    "CoalescingQueue",
     "DBPool",
     "DBStateError",
+    "GoogleKeySet",
     "GoogleUserData",
+    "GoogleVerifier",
+    "KeySet",
     "LiveStatsManager",
+    "Metrics",
+    "NotificationHub",
     "RegisterArcherRequest",
+    "SensorGateway",
+    "SerializedJSON",
     "SessionManager",
+    "ShotCorrelator",
+    "ShotJournal",
     "ShotManager",
     "ShotManagerError",
     "SlotManager",
     "SlotManagerError",
+    "SlowConsumerError",
+    "StaticKeySet",
     "authenticate_archer",
     "build_needs_registration_response",
+    "decode_claims",
     "decode_token",
     "face_data",
     "get_logger",
     "hash_session_token",
+    "is_session_revoked",
     "login_existing_archer",
     "register_archer",
+    "score_arrows",
+    "session_hash_from_sid",
     "settings",
     "verify_google_id_token",
 ]
@@ -1,18 +1,19 @@
-import asyncio
 import base64
 import hashlib
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import NotRequired, TypedDict, cast
+from typing import Any, Final, NotRequired, TypedDict, cast
 from uuid import UUID
 
 import jwt
-from google.auth.transport import requests as google_auth_requests
-from google.oauth2 import id_token
 
+from core.google_verifier import GoogleVerifier
+from core.metrics import Metrics
 from core.settings import settings
-from models import ArcherModel, AuthModel
+from core.ttl_cache import TTLCache
+from models import ArcherModel, AuthModel, RevokedSessionCache
 from schema import (
     ArcherCreate,
     ArcherFilter,
@@ -24,6 +25,14 @@ from schema import (
     AuthRegistrationRequest,
 )
 
+type TokenClaims = dict[str, Any]
+
+# Claims of already verified tokens, keyed by the token's SHA-256 digest so the
+# raw bearer tokens are never kept in memory.
+_claims_cache: Final[TTLCache[bytes, TokenClaims]] = TTLCache(
+    settings.jwt_claims_cache_size, settings.jwt_claims_cache_ttl
+)
+
 
 # Convenience structure to pass around models together
 @dataclass(frozen=True)
@@ -66,6 +75,57 @@ def hash_session_token(raw: bytes) -> bytes:
     return hashlib.sha256(raw).digest()
 
 
+def session_hash_from_sid(sid_b64: str) -> bytes:
+    """Return the stored hash of the session referenced by a JWT ``sid`` claim.
+
+    Raises:
+        binascii.Error: If ``sid_b64`` is not base64url.
+    """
+    return hash_session_token(base64.urlsafe_b64decode(sid_b64 + "=="))
+
+
+async def is_session_revoked(claims: TokenClaims) -> bool:
+    """Return True if the auth session behind the token's claims was revoked (logged out).
+
+    Checked against this worker's `RevokedSessionCache`, so a token whose claims
+    were served from the claims cache is still refused after logout. Tokens
+    without a ``sid`` claim are not bound to a session and are never revoked.
+    """
+    sid_b64 = claims.get("sid")
+    if not isinstance(sid_b64, str):
+        return False
+    return await RevokedSessionCache.is_revoked(session_hash_from_sid(sid_b64))
+
+
+def decode_claims(token: str) -> TokenClaims:
+    """Verify a JWT once and return all of its claims.
+
+    Verified claims are cached per worker until the token's ``exp`` (at most
+    ``jwt_claims_cache_ttl`` seconds), so repeated requests with the same token
+    skip signature verification. Invalid tokens are never cached.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or verification fails.
+        jwt.ExpiredSignatureError: If the token has expired.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    claims = _claims_cache.get(digest)
+    if claims is None:
+        claims = jwt.decode(
+            token,
+            settings.arch_stats_jwt_secret,
+            algorithms=[settings.arch_stats_jwt_algorithm],
+        )
+        exp = claims.get("exp")
+        ttl = exp - time.time() if isinstance(exp, (int, float)) else None
+        _claims_cache.put(digest, claims, ttl)
+    elif isinstance(exp := claims.get("exp"), (int, float)) and exp <= time.time():
+        # The monotonic TTL and the wall clock may disagree; exp always wins.
+        _claims_cache.invalidate([digest])
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return dict(claims)
+
+
 def decode_token(token: str, attr_name: str) -> str | int | float | None:
     """Decode a JWT token and extract a specific attribute.
 
@@ -80,36 +140,25 @@ def decode_token(token: str, attr_name: str) -> str | int | float | None:
         jwt.InvalidTokenError: If the token is invalid or verification fails.
         jwt.ExpiredSignatureError: If the token has expired.
     """
-    decoded = jwt.decode(
-        token,
-        settings.arch_stats_jwt_secret,
-        algorithms=[settings.arch_stats_jwt_algorithm],
-    )
-    value: str | int | float | None = decoded.get(attr_name, None)
+    value: str | int | float | None = decode_claims(token).get(attr_name, None)
     return value
 
 
 async def verify_google_id_token(credential: str) -> GoogleUserData:
     """Verify a Google One Tap credential and return its ID token claims.
 
-    The verification performs network I/O; run it in a worker thread to avoid
-    blocking the event loop.
+    Verification is local crypto against Google's keys cached by `GoogleVerifier`;
+    the network is only used when those keys need fetching.
 
     Raises ValueError when verification fails.
     """
     try:
-        req = google_auth_requests.Request()
-        verified = await asyncio.to_thread(
-            id_token.verify_oauth2_token,
-            credential,
-            req,
-            settings.arch_stats_google_oauth_client_id,
-        )
-        return cast(GoogleUserData, dict(verified))
+        verified = await GoogleVerifier.verify(credential)
+        return cast(GoogleUserData, verified)
     except Exception as exc:
         # Normalize all verification failures
-        # The google-auth library may raise a variety of exceptions depending on
-        # network conditions or token shape. Normalize to ValueError so routers
+        # Malformed tokens, unknown keys, failed claim checks and key fetch errors
+        # surface as different exceptions. Normalize to ValueError so routers
         # consistently return 401 instead of 500.
         raise ValueError(f"Invalid Google credential: {exc}") from exc
 
@@ -283,3 +332,10 @@ async def register_archer(  # noqa: PLR0913
         user_agent=user_agent,
         ip=ip,
     )
+
+
+for _stat in ("hits", "misses", "evictions", "expirations", "size"):
+    Metrics.register_gauge(
+        f"jwt_claims_cache.{_stat}",
+        lambda stat=_stat: _claims_cache.stats()[stat],
+    )
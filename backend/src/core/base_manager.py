@@ -1,21 +1,57 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from uuid import UUID
 
 from asyncpg import Pool
 from fastapi import HTTPException, status
 
 from models import SessionModel, ShotModel, SlotModel, TargetModel
-from schema import SlotFilter, SlotRead
+from models.parent_model import ParentModel
+from schema import SlotRead
 
 
 class BaseManager:
     """Base manager class that initializes common models and provides shared utilities."""
 
     def __init__(self, db_pool: Pool) -> None:
+        self.db_pool = db_pool
         self.session = SessionModel(db_pool)
         self.target = TargetModel(db_pool)
         self.slot = SlotModel(db_pool)
         self.shot = ShotModel(db_pool)
 
+    @asynccontextmanager
+    async def unit_of_work(self, transaction: bool = True) -> AsyncGenerator[None]:
+        """Pin one pooled connection to every model of this manager.
+
+        All model calls made inside the block share that connection instead of
+        acquiring one per query. With ``transaction=True`` they also run in a
+        single transaction, rolled back if the block raises (HTTPException
+        included). Nested blocks reuse the outer connection and transaction.
+        Callbacks registered with `ParentModel.on_commit` run after the commit.
+        """
+        models = [value for value in vars(self).values() if isinstance(value, ParentModel)]
+        if any(model.connection is not None for model in models):
+            yield
+            return
+
+        async with self.db_pool.acquire() as conn:
+            for model in models:
+                model.connection = conn
+            try:
+                if transaction:
+                    async with conn.transaction():
+                        yield
+                else:
+                    yield
+                for model in models:
+                    for callback in model.commit_callbacks:
+                        callback()
+            finally:
+                for model in models:
+                    model.connection = None
+                    model.commit_callbacks.clear()
+
     def verify_archer_identity(
         self, current_archer_id: UUID, archer_id: UUID, detail: str = "Forbidden"
     ) -> None:
@@ -36,7 +72,7 @@ class BaseManager:
         Verify that the authenticated archer owns the given slot.
         Raises 403 Forbidden if they do not.
         """
-        slot_row = await self.slot.get_one(SlotFilter(slot_id=slot_id))
+        slot_row = await self.slot.get_by_id(slot_id)
         if current_archer_id != slot_row.archer_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,79 @@
+import asyncio
+from collections import deque
+from collections.abc import Callable
+
+from core.metrics import Metrics
+
+
+class SlowConsumerError(Exception):
+    """Raised by `CoalescingQueue.get` once its consumer fell too far behind."""
+
+
+class CoalescingQueue[T]:
+    """Bounded single-consumer queue that merges items instead of growing.
+
+    Up to ``maxsize`` items are buffered. When full, a new item is merged into
+    the newest buffered one with ``merge`` (or replaces it when no merge function
+    is given, keeping only the latest value). Once more than ``max_pending`` raw
+    items are waiting, the consumer is considered too slow: further items are
+    dropped and `get` raises `SlowConsumerError`, so memory stays bounded however
+    slow the consumer is.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        max_pending: int,
+        merge: Callable[[T, T], T] | None = None,
+        metrics_prefix: str = "queue",
+    ) -> None:
+        self.maxsize = max(maxsize, 1)
+        self.max_pending = max_pending
+        self.is_slow = False
+        self._merge = merge
+        self._metrics_prefix = metrics_prefix
+        # Each entry is (item, number of raw items folded into it)
+        self._items: deque[tuple[T, int]] = deque()
+        self._pending = 0
+        self._ready = asyncio.Event()
+
+    def qsize(self) -> int:
+        """Return the number of buffered (possibly merged) items."""
+        return len(self._items)
+
+    def put_nowait(self, item: T) -> None:
+        """Buffer ``item``, merging it into the newest entry when the queue is full."""
+        if self.is_slow:
+            Metrics.increment(f"{self._metrics_prefix}.dropped")
+            return
+
+        if len(self._items) < self.maxsize:
+            self._items.append((item, 1))
+        else:
+            newest, weight = self._items[-1]
+            merged = self._merge(newest, item) if self._merge is not None else item
+            self._items[-1] = (merged, weight + 1)
+            Metrics.increment(f"{self._metrics_prefix}.merged")
+        self._pending += 1
+
+        if self._pending > self.max_pending:
+            self.is_slow = True
+            self._items.clear()
+            self._pending = 0
+            Metrics.increment(f"{self._metrics_prefix}.slow_consumers")
+        self._ready.set()
+
+    async def get(self) -> T:
+        """Return the oldest buffered item, waiting for one if needed.
+
+        Raises:
+            SlowConsumerError: If the consumer fell more than ``max_pending`` items behind.
+        """
+        while not self._items:
+            if self.is_slow:
+                raise SlowConsumerError("Consumer fell too far behind")
+            self._ready.clear()
+            await self._ready.wait()
+        item, weight = self._items.popleft()
+        self._pending -= weight
+        return item
@@ -1,15 +1,37 @@
 import asyncio
-from typing import Any, Self
+from typing import Any, Final, Self
 
-from asyncpg import Pool, create_pool
+from asyncpg import (
+    CannotConnectNowError,
+    Connection,
+    ConnectionDoesNotExistError,
+    InterfaceError,
+    Pool,
+    connect,
+    create_pool,
+)
 
 from core.settings import settings
+from models.prepared_statements import PreparedStatementConnection, PreparedStatementRegistry
+
+# Failures that mean the database could not be reached, not that a statement was rejected.
+CONNECTION_ERRORS: Final = (
+    OSError,
+    InterfaceError,
+    ConnectionDoesNotExistError,
+    CannotConnectNowError,
+)
 
 
 class DBStateError(Exception):
     """DB-related state error."""
 
 
+def is_connection_error(exc: BaseException) -> bool:
+    """Return whether ``exc``, or the database error it wraps, is a connection failure."""
+    return isinstance(exc, CONNECTION_ERRORS) or isinstance(exc.__cause__, CONNECTION_ERRORS)
+
+
 class DBPool:
     """Borg class to manage the PostgreSQL database connection pool."""
 
@@ -26,6 +48,22 @@ class DBPool:
             cls._lock = asyncio.Lock()
         return cls._lock
 
+    @classmethod
+    def _connect_kwargs(cls) -> dict[str, Any]:
+        """Return the connection parameters shared by pooled and standalone connections."""
+        return {
+            "user": settings.postgres_user,
+            "database": settings.postgres_db,
+            "password": settings.postgres_password,
+            "host": settings.postgres_dsn_host,
+            "port": settings.postgres_port,
+        }
+
+    @classmethod
+    async def open_connection(cls) -> Connection:
+        """Open a standalone connection outside the pool (e.g. for a long-lived LISTEN)."""
+        return await connect(**cls._connect_kwargs())
+
     @classmethod
     async def close_db_pool(cls) -> None:
         """Close the database connection pool on shutdown (race-safe)."""
@@ -38,24 +76,26 @@ class DBPool:
 
     @classmethod
     async def open_db_pool(cls) -> Pool:
-        """Return store the database connection pool (race-safe)."""
+        """Return store the database connection pool (race-safe).
+
+        Every new connection (including replacements after ``max_queries`` or idle
+        recycling) eagerly prepares the statements in `PreparedStatementRegistry`.
+        """
 
         if cls._pool is None:
             max_inactive_connection_lifetime = settings.postgres_max_inactive_connection_lifetime
             # We are ignoring a false positive, cls._get_lock() always returns a asyncio.Lock
             async with cls._get_lock():
                 cls._pool = await create_pool(
-                    user=settings.postgres_user,
-                    database=settings.postgres_db,
-                    password=settings.postgres_password,
-                    host=settings.postgres_dsn_host,
-                    port=settings.postgres_port,
+                    **cls._connect_kwargs(),
                     min_size=settings.postgres_pool_min_size,
                     max_size=settings.postgres_pool_max_size,
                     max_queries=settings.postgres_max_queries,
                     max_inactive_connection_lifetime=max_inactive_connection_lifetime,
                     command_timeout=settings.postgres_command_timeout,
                     statement_cache_size=settings.postgres_statement_cache_size,
+                    connection_class=PreparedStatementConnection,
+                    init=PreparedStatementRegistry.prepare_connection,
                 )
         assert isinstance(cls._pool, Pool)
         return cls._pool
@@ -0,0 +1,33 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Final
+
+from pydantic import TypeAdapter
+
+from core.face_data import face_data
+from schema import Face, FaceMinimal, FaceType
+
+
+@dataclass(frozen=True)
+class SerializedJSON:
+    """A JSON response body serialized once, with its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, body: bytes) -> SerializedJSON:
+        return cls(body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+# face_data is static, so the catalogue is compiled once at import.
+FACES_BY_TYPE: Final[dict[FaceType, Face]] = {face.face_type: face for face in face_data}
+FACE_LIST_JSON: Final[SerializedJSON] = SerializedJSON.of(
+    TypeAdapter(list[FaceMinimal]).dump_json(
+        [FaceMinimal(face_type=face.face_type, face_name=face.face_name) for face in face_data]
+    )
+)
+FACE_JSON: Final[dict[FaceType, SerializedJSON]] = {
+    face_type: SerializedJSON.of(face.model_dump_json().encode())
+    for face_type, face in FACES_BY_TYPE.items()
+}
@@ -0,0 +1,215 @@
+import asyncio
+import math
+import re
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, Final, Protocol, Self
+
+import httpx
+import jwt
+
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.settings import settings
+
+GOOGLE_ISSUERS: Final[tuple[str, ...]] = ("accounts.google.com", "https://accounts.google.com")
+_MAX_AGE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE
+)
+
+type JWKS = Mapping[str, Any]
+
+
+def cache_control_max_age(header: str | None) -> float | None:
+    """Return the ``max-age`` of a Cache-Control header in seconds, or None if absent."""
+    if not header:
+        return None
+    match = _MAX_AGE_PATTERN.search(header)
+    return float(match.group(1)) if match else None
+
+
+def _parse_jwks(jwks: JWKS) -> dict[str, jwt.PyJWK]:
+    """Return the signing keys of a JWK set by key id."""
+    key_set = jwt.PyJWKSet.from_dict(dict(jwks))
+    return {key.key_id: key for key in key_set.keys if key.key_id}
+
+
+class KeySet(Protocol):
+    """Source of the public keys Google ID tokens are verified against."""
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        """Return the key with id ``kid``; raise `jwt.PyJWKError` if unknown."""
+        ...
+
+    async def close(self) -> None:
+        """Release whatever the key set holds on shutdown."""
+        ...
+
+
+class StaticKeySet:
+    """Fixed JWK set, e.g. a local stand-in for Google's keys in tests."""
+
+    def __init__(self, jwks: JWKS) -> None:
+        self._keys = _parse_jwks(jwks)
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        try:
+            return self._keys[kid]
+        except KeyError as exc:
+            raise jwt.PyJWKError(f"Unknown signing key {kid!r}") from exc
+
+    async def close(self) -> None:
+        return None
+
+
+class GoogleKeySet:
+    """Google's ID token signing keys, fetched once and shared by every login of the worker.
+
+    Keys are kept for the Cache-Control max-age Google sends with them and are
+    refreshed in the background ``google_certs_refresh_margin`` seconds before
+    they expire, so a login only waits on the network for the very first fetch.
+    A failed refresh keeps the current keys for ``google_certs_retry_interval``
+    more seconds; an unknown key id (Google rotated its keys) triggers at most
+    one refetch per retry interval.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty key set.
+
+        Args:
+            url: JWKS endpoint; defaults to ``google_certs_url``.
+            transport: httpx transport, overridable in tests.
+            clock: Monotonic time source, overridable in tests.
+        """
+        self.url = url or settings.google_certs_url
+        self._transport = transport
+        self._clock = clock
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._expires_at = 0.0
+        self._checked_at = -math.inf
+        self._lock: asyncio.Lock | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Lazily create and return the fetch lock (requires running loop)."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def get_key(self, kid: str) -> jwt.PyJWK:
+        now = self._clock()
+        retry_due = now - self._checked_at >= settings.google_certs_retry_interval
+        if not self._keys or now >= self._expires_at:
+            await self._refresh(now)
+        elif (
+            retry_due
+            and now >= self._expires_at - settings.google_certs_refresh_margin
+            and (self._refresh_task is None or self._refresh_task.done())
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh(now))
+        key = self._keys.get(kid)
+        if key is None and retry_due:
+            await self._refresh(now)
+            key = self._keys.get(kid)
+        if key is None:
+            raise jwt.PyJWKError(f"Unknown signing key {kid!r}")
+        return key
+
+    async def _refresh(self, requested_at: float) -> None:
+        """Fetch the keys unless another caller did so since ``requested_at``."""
+        async with self._get_lock():
+            if self._checked_at >= requested_at:
+                return
+            await self._fetch()
+
+    async def _fetch(self) -> None:
+        """Fetch the keys; keep the current ones for a while if that fails.
+
+        Raises:
+            httpx.HTTPError, ValueError, jwt.PyJWKError: If the fetch fails and no
+                keys were fetched before.
+        """
+        now = self._clock()
+        self._checked_at = now
+        try:
+            async with httpx.AsyncClient(
+                transport=self._transport, timeout=settings.google_certs_fetch_timeout
+            ) as client:
+                response = await client.get(self.url)
+                response.raise_for_status()
+            keys = _parse_jwks(response.json())
+        except (httpx.HTTPError, ValueError, jwt.PyJWKError) as exc:
+            Metrics.increment("google_certs.fetch_failures")
+            if not self._keys:
+                raise
+            get_logger().warning("Refreshing Google certs failed, keeping current keys: %s", exc)
+            self._expires_at = now + settings.google_certs_retry_interval
+            return
+        max_age = cache_control_max_age(response.headers.get("cache-control"))
+        self._keys = keys
+        self._expires_at = now + (settings.google_certs_default_ttl if max_age is None else max_age)
+        Metrics.increment("google_certs.fetches")
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+
+class GoogleVerifier:
+    """Borg class verifying Google ID tokens locally against a shared `KeySet`.
+
+    Only the keys come from the network (see `GoogleKeySet`); the signature,
+    audience, issuer and expiry checks are local crypto. Tests swap in a
+    `StaticKeySet` with `use`.
+    """
+
+    _key_set: KeySet | None = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("GoogleVerifier should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def use(cls, key_set: KeySet | None) -> None:
+        """Verify against ``key_set`` from now on; None restores Google's keys."""
+        cls._key_set = key_set
+
+    @classmethod
+    async def verify(cls, credential: str) -> dict[str, Any]:
+        """Return the claims of a valid Google ID token issued for this app.
+
+        Raises:
+            jwt.PyJWTError: If the token is malformed, its key is unknown, or any
+                signature or claim check fails.
+            httpx.HTTPError: If Google's keys have never been fetched and cannot be.
+        """
+        if cls._key_set is None:
+            cls._key_set = GoogleKeySet()
+        kid = jwt.get_unverified_header(credential).get("kid")
+        if not isinstance(kid, str):
+            raise jwt.InvalidTokenError("ID token has no key id")
+        key = await cls._key_set.get_key(kid)
+        return jwt.decode(
+            credential,
+            key,
+            algorithms=[key.algorithm_name],
+            audience=settings.arch_stats_google_oauth_client_id,
+            issuer=GOOGLE_ISSUERS,
+        )
+
+    @classmethod
+    async def close(cls) -> None:
+        """Release the key set on shutdown."""
+        if cls._key_set is not None:
+            key_set, cls._key_set = cls._key_set, None
+            await key_set.close()
@@ -0,0 +1,98 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+from core.live_stat_accumulator import LiveStatAccumulator
+from schema import LeaderboardEntry, LeaderboardUpdate, ShotScore
+
+
+class SessionLeaderboard:
+    """In-process ranking of a session's participants built from per-slot accumulators.
+
+    Shots are folded in as they are notified; `flush` turns everything that
+    changed since the previous frame into one `LeaderboardUpdate`, so callers
+    decide how often frames are produced.
+    """
+
+    def __init__(self, session_id: UUID) -> None:
+        self.session_id = session_id
+        self._slots: dict[UUID, str] = {}
+        self._accumulators: dict[UUID, LiveStatAccumulator] = {}
+        self._sent: dict[UUID, LeaderboardEntry] = {}
+        self._removed: set[UUID] = set()
+        self._has_flushed = False
+
+    def track(self, slot_id: UUID, slot: str) -> None:
+        """Start (or keep) ranking ``slot_id`` under the slot code ``slot``."""
+        self._slots[slot_id] = slot
+        self._accumulators.setdefault(slot_id, LiveStatAccumulator(slot_id))
+        self._removed.discard(slot_id)
+
+    def untrack(self, slot_id: UUID) -> None:
+        """Stop ranking ``slot_id``; the next frame reports it as removed."""
+        self._slots.pop(slot_id, None)
+        self._accumulators.pop(slot_id, None)
+        if self._sent.pop(slot_id, None) is not None:
+            self._removed.add(slot_id)
+
+    def tracked(self) -> set[UUID]:
+        """Return the slots currently ranked."""
+        return set(self._slots)
+
+    def add(self, slot_id: UUID, shots: Iterable[ShotScore]) -> bool:
+        """Fold shots into a tracked slot. Returns True if any shot was new."""
+        accumulator = self._accumulators.get(slot_id)
+        if accumulator is None:
+            return False
+        return bool(accumulator.add(shots))
+
+    def entries(self) -> list[LeaderboardEntry]:
+        """Return every tracked slot ranked by total score, then X count."""
+        stats = sorted(
+            (accumulator.snapshot() for accumulator in self._accumulators.values()),
+            key=lambda s: (-s.total_score, -s.x_count, self._slots[s.slot_id]),
+        )
+        entries: list[LeaderboardEntry] = []
+        for position, stat in enumerate(stats, start=1):
+            rank = position
+            if entries and (entries[-1].total_score, entries[-1].x_count) == (
+                stat.total_score,
+                stat.x_count,
+            ):
+                rank = entries[-1].rank
+            entries.append(
+                LeaderboardEntry(
+                    slot_id=stat.slot_id,
+                    slot=self._slots[stat.slot_id],
+                    rank=rank,
+                    total_score=stat.total_score,
+                    x_count=stat.x_count,
+                    number_of_shots=stat.number_of_shots,
+                )
+            )
+        return entries
+
+    def flush(self) -> LeaderboardUpdate | None:
+        """Return the changes since the previous frame, or None if there are none.
+
+        The first frame is always a full snapshot.
+        """
+        entries = self.entries()
+        is_snapshot = not self._has_flushed
+        changed = (
+            entries
+            if is_snapshot
+            else [entry for entry in entries if self._sent.get(entry.slot_id) != entry]
+        )
+        if not is_snapshot and not changed and not self._removed:
+            return None
+
+        update = LeaderboardUpdate(
+            session_id=self.session_id,
+            is_snapshot=is_snapshot,
+            entries=changed,
+            removed=sorted(self._removed),
+        )
+        self._sent = {entry.slot_id: entry for entry in entries}
+        self._removed.clear()
+        self._has_flushed = True
+        return update
@@ -0,0 +1,65 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+from schema import ShotScore, Stats
+
+
+class LiveStatAccumulator:
+    """Running aggregate of a slot's shots, updated in O(1) per shot.
+
+    Seeded once from the shots already stored for the slot, then fed the shots
+    carried by each NOTIFY payload, so pushing a live update never re-aggregates
+    the slot in the database.
+    """
+
+    def __init__(self, slot_id: UUID, end_size: int | None = None) -> None:
+        """Initialize an empty aggregate.
+
+        Args:
+            slot_id: Slot the shots belong to.
+            end_size: Shots per end (the slot's `shot_per_round`). Per-end totals
+                are only tracked when it is known.
+        """
+        self.slot_id = slot_id
+        self.end_size = end_size
+        self.number_of_shots = 0
+        self.total_score = 0
+        self.x_count = 0
+        self.end_totals: list[int] = []
+        self._seen: set[UUID] = set()
+
+    def add(self, shots: Iterable[ShotScore]) -> list[ShotScore]:
+        """Fold shots into the aggregate, ignoring shots already counted.
+
+        Returns:
+            The shots that were not seen before, in the given order.
+        """
+        new_shots: list[ShotScore] = []
+        for shot in shots:
+            if shot.shot_id in self._seen:
+                continue
+            self._seen.add(shot.shot_id)
+            new_shots.append(shot)
+            # A miss with no landing is stored without a score.
+            score = shot.score or 0
+
+            if self.end_size and self.number_of_shots % self.end_size == 0:
+                self.end_totals.append(0)
+            if self.end_totals:
+                self.end_totals[-1] += score
+            self.number_of_shots += 1
+            self.total_score += score
+            self.x_count += shot.is_x
+        return new_shots
+
+    def snapshot(self) -> Stats:
+        """Return the current aggregate as `Stats`."""
+        return Stats(
+            slot_id=self.slot_id,
+            number_of_shots=self.number_of_shots,
+            total_score=self.total_score,
+            max_score=self.number_of_shots * 10,
+            mean=self.total_score / self.number_of_shots if self.number_of_shots else 0.0,
+            x_count=self.x_count,
+            end_totals=list(self.end_totals),
+        )
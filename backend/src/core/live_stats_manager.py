@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from uuid import UUID
@@ -5,9 +6,14 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from core.base_manager import BaseManager
+from core.coalescing_queue import SlowConsumerError
+from core.leaderboard import SessionLeaderboard
+from core.live_stat_accumulator import LiveStatAccumulator
+from core.metrics import Metrics
+from core.settings import settings
 from models.live_stats_model import LiveStatsModel
 from models.parent_model import DBNotFound
-from schema.live_stats_schema import LiveStat
+from schema.live_stats_schema import LeaderboardUpdate, LiveStat
 
 
 class LiveStatsManager(BaseManager):
@@ -18,10 +24,11 @@ class LiveStatsManager(BaseManager):
 
     async def get_stats(self, slot_id: UUID, current_archer_id: UUID) -> LiveStat:
         try:
-            await self.verify_slot_ownership(slot_id, current_archer_id)
-            live_stat = await self.live_stats_model.get_live_stat(slot_id)
+            slot = await self.verify_slot_ownership(slot_id, current_archer_id)
             scores = await self.live_stats_model.get_all_scores(slot_id)
-            return LiveStat(scores=scores, stats=live_stat)
+            accumulator = LiveStatAccumulator(slot_id, slot.shot_per_round)
+            accumulator.add(scores)
+            return LiveStat(scores=scores, stats=accumulator.snapshot())
         except DBNotFound as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
         except HTTPException:
@@ -33,5 +40,91 @@ class LiveStatsManager(BaseManager):
             ) from e
 
     async def listen_for_shots(self, slot_id: UUID) -> AsyncGenerator[LiveStat]:
-        async for payload in self.live_stats_model.listen_for_shots(slot_id):
-            yield payload
+        """Yield the slot's updated stats for every batch of newly notified shots.
+
+        Stats come from an in-process accumulator seeded once from the stored
+        shots; notifications never trigger a DB query. Only a reconnect of the
+        LISTEN connection re-reads the stored shots, to catch up on lost ones.
+        """
+        try:
+            end_size = (await self.slot.get_by_id(slot_id)).shot_per_round
+        except DBNotFound:
+            end_size = None
+        accumulator = LiveStatAccumulator(slot_id, end_size)
+
+        async def seed() -> None:
+            accumulator.add(await self.live_stats_model.get_all_scores(slot_id))
+
+        async for shots in self.live_stats_model.listen_for_shots(slot_id, on_listen=seed):
+            new_shots = accumulator.add(shots)
+            if new_shots:
+                yield LiveStat(scores=new_shots, stats=accumulator.snapshot())
+
+    async def listen_for_session(self, session_id: UUID) -> AsyncGenerator[LeaderboardUpdate]:
+        """Yield coalesced leaderboard frames for every open participant of a session.
+
+        Each participant's `shot_insert_{slot_id}` channel is followed through the
+        shared notification hub and folded into a `SessionLeaderboard`. After a
+        score, frames wait `leaderboard_flush_interval` seconds so a burst of
+        arrows produces a single frame. The participant list (open_participants)
+        is re-read every `leaderboard_participants_refresh_interval` seconds.
+        """
+        board = SessionLeaderboard(session_id)
+        changed = asyncio.Event()
+        followers: dict[UUID, asyncio.Task[None]] = {}
+
+        async def follow(slot_id: UUID) -> None:
+            async def seed() -> None:
+                if board.add(slot_id, await self.live_stats_model.get_all_scores(slot_id)):
+                    changed.set()
+
+            try:
+                async for shots in self.live_stats_model.listen_for_shots(slot_id, on_listen=seed):
+                    if board.add(slot_id, shots):
+                        changed.set()
+            except SlowConsumerError:
+                # Re-followed (and re-seeded) on the next participants sync
+                Metrics.increment("leaderboard.followers_restarted")
+            except Exception:
+                # Same recovery; logged here, as nothing awaits the task
+                self.logger.exception("Leaderboard follower of slot %s failed", slot_id)
+                Metrics.increment("leaderboard.followers_restarted")
+
+        async def sync_participants() -> None:
+            participants = {
+                info.slot_id: info.slot
+                for info in await self.slot.get_open_participants(session_id)
+            }
+            for slot_id in board.tracked() - participants.keys():
+                board.untrack(slot_id)
+                followers.pop(slot_id).cancel()
+                changed.set()
+            for slot_id, slot in participants.items():
+                board.track(slot_id, slot)
+                if slot_id not in followers or followers[slot_id].done():
+                    followers[slot_id] = asyncio.create_task(follow(slot_id))
+
+        loop = asyncio.get_running_loop()
+        try:
+            await sync_participants()
+            next_sync = loop.time() + settings.leaderboard_participants_refresh_interval
+            changed.set()  # the first frame is always a snapshot
+            while True:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=next_sync - loop.time())
+                except TimeoutError:
+                    pass
+                if loop.time() >= next_sync:
+                    await sync_participants()
+                    next_sync = loop.time() + settings.leaderboard_participants_refresh_interval
+                if not changed.is_set():
+                    continue
+                await asyncio.sleep(settings.leaderboard_flush_interval)
+                changed.clear()
+                update = board.flush()
+                if update is not None:
+                    yield update
+        finally:
+            for task in followers.values():
+                task.cancel()
+            await asyncio.gather(*followers.values(), return_exceptions=True)
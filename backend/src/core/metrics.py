@@ -0,0 +1,43 @@
+from collections.abc import Callable
+from typing import Any, ClassVar, Self
+
+type MetricValue = int | float
+type Gauge = Callable[[], MetricValue]
+
+
+class Metrics:
+    """Borg registry of in-process counters and gauges.
+
+    Values are per worker process; each `uvicorn --workers` process reports its
+    own numbers. Counters are incremented by the code paths they describe,
+    gauges are read lazily from callables when a snapshot is taken.
+    """
+
+    _counters: ClassVar[dict[str, int]] = {}
+    _gauges: ClassVar[dict[str, Gauge]] = {}
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("Metrics should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def increment(cls, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to the counter ``name`` (created at zero on first use)."""
+        cls._counters[name] = cls._counters.get(name, 0) + amount
+
+    @classmethod
+    def register_gauge(cls, name: str, gauge: Gauge) -> None:
+        """Report the value returned by ``gauge`` as ``name`` in every snapshot."""
+        cls._gauges[name] = gauge
+
+    @classmethod
+    def snapshot(cls) -> dict[str, MetricValue]:
+        """Return every counter and gauge, sorted by name."""
+        values: dict[str, MetricValue] = dict(cls._counters)
+        for name, gauge in cls._gauges.items():
+            values[name] = gauge()
+        return dict(sorted(values.items()))
+
+    @classmethod
+    def reset_counters(cls) -> None:
+        """Zero every counter (gauges are left registered)."""
+        cls._counters.clear()
@@ -0,0 +1,175 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from typing import Any, ClassVar, Final, Self
+
+from asyncpg import Connection, PostgresError
+from asyncpg.pool import PoolConnectionProxy
+
+from core.coalescing_queue import CoalescingQueue
+from core.db_pool import DBPool
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.settings import settings
+
+RECONNECT_MIN_DELAY: Final[float] = 0.5
+RECONNECT_MAX_DELAY: Final[float] = 30.0
+
+
+class NotificationHub:
+    """Borg class multiplexing LISTEN channels over one dedicated connection.
+
+    Every subscriber gets its own bounded `CoalescingQueue` of raw payloads, so a
+    slow consumer can never make the process grow without bound. A channel is LISTENed
+    while it has at least one subscriber, so the number of WebSocket viewers
+    never affects how many pooled connections are in use. The connection lives
+    outside the pool and is re-established (re-LISTENing every active channel)
+    if the server terminates it.
+
+    Notifications sent while the connection is down are lost. Every drop bumps
+    `generation`, so state derived from notifications can tell it may be stale,
+    and subscribers that asked for a ``resync`` payload get it queued once
+    their channel is LISTENed again, to rebuild that state.
+    """
+
+    _conn: Connection | None = None
+    _lock: asyncio.Lock | None = None
+    _subscribers: ClassVar[dict[str, set[CoalescingQueue[str]]]] = {}
+    _resync: ClassVar[dict[CoalescingQueue[str], str]] = {}
+    _reconnect_task: asyncio.Task[None] | None = None
+    _generation: int = 0
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("NotificationHub should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Lazily create and return the class-level lock (requires running loop)."""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    def _dispatch(
+        cls, _: Connection | PoolConnectionProxy, __: int, channel: str, payload: object
+    ) -> None:
+        """Fan a notification out to every subscriber queue of its channel."""
+        payload_str = payload if isinstance(payload, str) else str(payload)
+        for queue in cls._subscribers.get(channel, ()):
+            queue.put_nowait(payload_str)
+
+    @classmethod
+    async def _connection(cls) -> Connection:
+        """Return the LISTEN connection, opening it on first use. Caller holds the lock."""
+        if cls._conn is None or cls._conn.is_closed():
+            cls._conn = await DBPool.open_connection()
+            cls._conn.add_termination_listener(cls._on_termination)
+        return cls._conn
+
+    @classmethod
+    def _on_termination(cls, _: Connection | PoolConnectionProxy) -> None:
+        """Schedule a reconnect when the server drops the LISTEN connection."""
+        cls._conn = None
+        cls._generation += 1
+        if cls._subscribers and (cls._reconnect_task is None or cls._reconnect_task.done()):
+            cls._reconnect_task = asyncio.create_task(cls._reconnect())
+
+    @classmethod
+    async def _reconnect(cls) -> None:
+        """Reopen the connection with exponential backoff and re-LISTEN active channels."""
+        logger = get_logger()
+        delay = RECONNECT_MIN_DELAY
+        while cls._subscribers:
+            try:
+                async with cls._get_lock():
+                    conn = await cls._connection()
+                    for channel in cls._subscribers:
+                        await conn.add_listener(channel, cls._dispatch)
+                    for queue, payload in cls._resync.items():
+                        queue.put_nowait(payload)
+                logger.info("Notification hub reconnected (%d channels)", len(cls._subscribers))
+                return
+            except (OSError, TimeoutError, PostgresError) as exc:
+                logger.warning("Notification hub reconnect failed, retrying: %s", exc)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    @classmethod
+    @asynccontextmanager
+    async def subscribe(
+        cls,
+        channel: str,
+        merge: Callable[[str, str], str] | None = None,
+        resync: str | None = None,
+    ) -> AsyncGenerator[CoalescingQueue[str]]:
+        """Subscribe to ``channel`` for the duration of the block.
+
+        Args:
+            channel: Channel to LISTEN on.
+            merge: Folds two pending payloads into one when the subscriber's queue
+                is full. Without it only the latest pending payload is kept.
+            resync: Payload queued after a reconnect, telling the subscriber that
+                notifications were lost.
+
+        Yields:
+            Queue receiving the payloads notified on the channel. Its `get` raises
+            `SlowConsumerError` if the consumer falls too far behind.
+        """
+        queue = CoalescingQueue[str](
+            maxsize=settings.notification_queue_size,
+            max_pending=settings.notification_max_pending,
+            merge=merge,
+            metrics_prefix="notification_hub",
+        )
+        async with cls._get_lock():
+            if channel not in cls._subscribers:
+                conn = await cls._connection()
+                await conn.add_listener(channel, cls._dispatch)
+                cls._subscribers[channel] = set()
+            subscribers = cls._subscribers[channel]
+            subscribers.add(queue)
+            if resync is not None:
+                cls._resync[queue] = resync
+        try:
+            yield queue
+        finally:
+            async with cls._get_lock():
+                subscribers.discard(queue)
+                cls._resync.pop(queue, None)
+                if not subscribers and cls._subscribers.get(channel) is subscribers:
+                    cls._subscribers.pop(channel, None)
+                    if cls._conn is not None and not cls._conn.is_closed():
+                        await cls._conn.remove_listener(channel, cls._dispatch)
+
+    @classmethod
+    def generation(cls) -> int:
+        """Return how many times the LISTEN connection was lost."""
+        return cls._generation
+
+    @classmethod
+    def channel_count(cls) -> int:
+        """Return how many channels are currently LISTENed."""
+        return len(cls._subscribers)
+
+    @classmethod
+    def subscriber_count(cls) -> int:
+        """Return how many subscriptions are open across all channels."""
+        return sum(len(subscribers) for subscribers in cls._subscribers.values())
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the LISTEN connection and drop every subscription on shutdown."""
+        if cls._reconnect_task is not None:
+            cls._reconnect_task.cancel()
+            cls._reconnect_task = None
+        cls._subscribers.clear()
+        cls._resync.clear()
+        if cls._conn is not None:
+            conn, cls._conn = cls._conn, None
+            conn.remove_termination_listener(cls._on_termination)
+            await conn.close()
+        cls._lock = None
+
+
+Metrics.register_gauge("notification_hub.channels", NotificationHub.channel_count)
+Metrics.register_gauge("notification_hub.subscribers", NotificationHub.subscriber_count)
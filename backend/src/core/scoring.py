@@ -0,0 +1,114 @@
+import functools
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+
+from core.face_catalogue import FACES_BY_TYPE
+from core.settings import settings
+from schema import Face, FaceType, ShotCreate
+
+MISS: Final[int] = 0
+
+type FloatArray = npt.NDArray[np.float64]
+type IntArray = npt.NDArray[np.int64]
+type BoolArray = npt.NDArray[np.bool_]
+
+
+@dataclass(frozen=True)
+class CompiledFace:
+    """A target face reduced to the arrays scoring needs.
+
+    Coordinates use the face's SVG frame, as recorded by the frontend: millimeters
+    from the top-left corner of the ``viewBox``, so the face center is at
+    ``(viewBox / 2, viewBox / 2)``.
+
+    Attributes:
+        centers: ``(spots, 2)`` spot centers.
+        limits: Squared outer radius of every ring widened by the arrow radius,
+            ascending (innermost ring first).
+        scores: Score of each ring in ``limits`` order, followed by `MISS`.
+        has_x_ring: Whether the innermost ring is the X ring.
+    """
+
+    centers: FloatArray
+    limits: FloatArray
+    scores: IntArray
+    has_x_ring: bool
+
+
+def compile_face(face: Face, arrow_diameter: float) -> CompiledFace:
+    """Precompute the scoring arrays of ``face`` for arrows of ``arrow_diameter`` mm.
+
+    Widening each ring by the arrow radius applies the line-cutter rule: an arrow
+    whose shaft touches a ring's outer line scores that ring.
+    """
+    half = face.viewBox / 2
+    centers = np.array(
+        [(half + spot.x_offset, half + spot.y_offset) for spot in face.spots], dtype=np.float64
+    ).reshape(-1, 2)
+    rings = sorted(face.rings, key=lambda ring: ring.r)
+    radii = np.array([ring.r for ring in rings], dtype=np.float64) + arrow_diameter / 2
+    scores = np.array([ring.data_score for ring in rings] + [MISS], dtype=np.int64)
+    return CompiledFace(centers, radii**2, scores, face.render_cross and bool(rings))
+
+
+@functools.cache
+def compiled_face(face_type: FaceType, arrow_diameter: float) -> CompiledFace:
+    """Return the compiled face of ``face_type``, compiling it on first use."""
+    face = FACES_BY_TYPE.get(face_type)
+    if face is None:
+        raise ValueError(f"Unknown face type {face_type}")
+    return compile_face(face, arrow_diameter)
+
+
+def score_arrows(
+    face_type: FaceType,
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    arrow_diameter: float | None = None,
+) -> tuple[IntArray, BoolArray]:
+    """Score a batch of arrow coordinates on ``face_type``.
+
+    Each arrow is scored against its nearest spot: its squared distance to that
+    spot's center is located among the ring limits with one binary search.
+
+    Args:
+        face_type: Face the arrows were shot at.
+        x: Arrow x coordinates (mm, SVG frame, see `CompiledFace`).
+        y: Arrow y coordinates, same length as ``x``.
+        arrow_diameter: Shaft diameter in mm; defaults to ``shot_arrow_diameter``.
+
+    Returns:
+        ``(scores, is_x)`` arrays, one entry per arrow.
+
+    Raises:
+        ValueError: If the face has no scoring zones.
+    """
+    face = compiled_face(face_type, arrow_diameter or settings.shot_arrow_diameter)
+    if not len(face.limits) or not len(face.centers):
+        raise ValueError(f"Face {face_type} has no scoring zones")
+    points = np.column_stack((np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)))
+    offsets = points[:, np.newaxis, :] - face.centers[np.newaxis, :, :]
+    distances = np.einsum("nsk,nsk->ns", offsets, offsets).min(axis=1)
+    rings = np.searchsorted(face.limits, distances, side="left")
+    is_x = rings == 0 if face.has_x_ring else np.zeros(len(rings), dtype=np.bool_)
+    return face.scores[rings], is_x
+
+
+def score_shots(face_type: FaceType, shots: list[ShotCreate]) -> None:
+    """Fill in score and is_x of the shots posted with coordinates only.
+
+    Raises:
+        ValueError: If there is something to score and the face has no scoring zones.
+    """
+    unscored = [shot for shot in shots if shot.needs_scoring]
+    if not unscored:
+        return
+    scores, is_x = score_arrows(
+        face_type, [shot.x for shot in unscored], [shot.y for shot in unscored]
+    )
+    for shot, score, x_ring in zip(unscored, scores.tolist(), is_x.tolist(), strict=True):
+        shot.score = score
+        shot.is_x = x_ring
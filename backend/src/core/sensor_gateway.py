@@ -0,0 +1,343 @@
+import asyncio
+import itertools
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar, Final, Self
+from uuid import UUID
+
+from asyncpg import Pool, PostgresError
+from pydantic import TypeAdapter, ValidationError
+
+from core.db_pool import DBPool, is_connection_error
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.scoring import score_shots
+from core.settings import settings
+from core.timer_wheel import TimerWheel
+from models import DBException, DBNotFound, SessionModel, ShotModel, SlotModel
+from schema import BowEvent, SensorEvent, ShotCreate, TargetEvent
+
+_event_adapter: Final[TypeAdapter[BowEvent | TargetEvent]] = TypeAdapter(SensorEvent)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Return ``moment`` in UTC, reading a naive sensor timestamp as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+class ShotCorrelator:
+    """Pairs bow and target sensor events into shots.
+
+    A landing (target event) is paired with the oldest pending release (bow
+    event) of the same slot made within ``window`` before it, preferring the
+    release of the same arrow when both sensors read one. A landing without a
+    release is a shot on its own; a release no landing claims within ``window``
+    becomes a miss. Release timeouts live in one `TimerWheel` advanced by
+    `expire`, so a full field of archers costs no timers on the event loop.
+    """
+
+    def __init__(self, window: timedelta, tick: float) -> None:
+        """Initialize an empty correlator.
+
+        Args:
+            window: How long a release waits for its landing.
+            tick: Resolution of the release timeouts, in seconds.
+        """
+        self.window = window
+        self.timeout_lag = 0.0
+        # slot_id -> sequence number -> (released_at, event), oldest first
+        self._pending: dict[UUID, dict[int, tuple[datetime, BowEvent]]] = defaultdict(dict)
+        self._timeouts: TimerWheel[tuple[UUID, int]] = TimerWheel(tick)
+        self._sequence = itertools.count()
+
+    def add(self, event: BowEvent | TargetEvent, received_at: datetime) -> ShotCreate | None:
+        """Record ``event``; return the shot it completes, if any.
+
+        Sensor timestamps without a timezone are taken as UTC.
+        """
+        if isinstance(event, BowEvent):
+            released_at = _as_utc(event.released_at or received_at)
+            sequence = next(self._sequence)
+            self._pending[event.slot_id][sequence] = (released_at, event)
+            self._timeouts.schedule(
+                (event.slot_id, sequence), (released_at + self.window).timestamp()
+            )
+            return None
+        landed_at = _as_utc(event.landed_at or received_at)
+        bow = self._claim(event, landed_at)
+        return ShotCreate(
+            slot_id=event.slot_id,
+            x=event.x,
+            y=event.y,
+            arrow_id=event.arrow_id or (bow.arrow_id if bow else None),
+            created_at=landed_at,
+        )
+
+    def _claim(self, target: TargetEvent, landed_at: datetime) -> BowEvent | None:
+        """Remove and return the release ``target`` lands from, if one is pending."""
+        pending = self._pending.get(target.slot_id)
+        if not pending:
+            return None
+        matches = [
+            (sequence, bow)
+            for sequence, (released_at, bow) in pending.items()
+            if landed_at - self.window <= released_at <= landed_at
+            and (target.arrow_id is None or bow.arrow_id in (None, target.arrow_id))
+        ]
+        if not matches:
+            return None
+        sequence, bow = next(
+            (match for match in matches if target.arrow_id and match[1].arrow_id), matches[0]
+        )
+        self._forget(target.slot_id, sequence)
+        self._timeouts.cancel((target.slot_id, sequence))
+        return bow
+
+    def _forget(self, slot_id: UUID, sequence: int) -> tuple[datetime, BowEvent]:
+        pending = self._pending[slot_id]
+        entry = pending.pop(sequence)
+        if not pending:
+            del self._pending[slot_id]
+        return entry
+
+    def expire(self, now: datetime) -> list[ShotCreate]:
+        """Turn the releases unclaimed for longer than the window into misses.
+
+        ``timeout_lag`` is set to how late, in seconds, the most overdue of them
+        was turned into a miss.
+        """
+        timestamp = now.timestamp()
+        misses: list[ShotCreate] = []
+        lag = 0.0
+        for (slot_id, sequence), deadline in self._timeouts.advance(timestamp):
+            released_at, bow = self._forget(slot_id, sequence)
+            misses.append(
+                ShotCreate(slot_id=slot_id, arrow_id=bow.arrow_id, created_at=released_at)
+            )
+            lag = max(lag, timestamp - deadline)
+        if misses:
+            self.timeout_lag = lag
+        return misses
+
+    def pending_count(self) -> int:
+        """Return how many releases are waiting for a landing."""
+        return len(self._timeouts)
+
+
+async def _accepted_shots(pool: Pool, shots: list[ShotCreate]) -> list[ShotCreate]:
+    """Keep the shots of existing slots in open sessions, scored on their slot's face."""
+    by_slot: dict[UUID, list[ShotCreate]] = defaultdict(list)
+    for shot in shots:
+        by_slot[shot.slot_id].append(shot)
+    slots, sessions = SlotModel(pool), SessionModel(pool)
+    accepted: list[ShotCreate] = []
+    for slot_id, slot_shots in by_slot.items():
+        try:
+            slot = await slots.get_by_id(slot_id)
+            if not await sessions.does_open_session_exist(slot.session_id):
+                raise ValueError("session is closed")
+            score_shots(slot.face_type, slot_shots)
+        except (DBNotFound, ValueError) as exc:
+            get_logger().warning(
+                "Dropping %d sensor shots of slot %s: %s", len(slot_shots), slot_id, exc
+            )
+            Metrics.increment("sensor_gateway.dropped", len(slot_shots))
+            continue
+        accepted.extend(slot_shots)
+    return accepted
+
+
+class _SensorProtocol(asyncio.DatagramProtocol):
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        SensorGateway.feed(data)
+
+
+class SensorGateway:
+    """Borg UDP ingestion endpoint for target and bow sensor events.
+
+    Sensors send datagrams of newline-separated JSON events (`BowEvent`,
+    `TargetEvent`) to ``sensor_gateway_host:sensor_gateway_port``. Events are
+    paired into shots by `ShotCorrelator` and written to ``shot`` with COPY
+    every ``sensor_gateway_flush_interval`` seconds, or as soon as
+    ``sensor_gateway_batch_size`` shots are waiting. Shots with coordinates are
+    scored on their slot's face. Shots of unknown slots, closed sessions or
+    unscorable faces are dropped and counted. Sensors are trusted: the socket
+    is meant to be bound to the Pi's loopback or sensor network only. Only one
+    worker binds the port, so all events of a slot meet in the same correlator.
+    """
+
+    _transport: asyncio.DatagramTransport | None = None
+    _flusher: asyncio.Task[None] | None = None
+    _wake: asyncio.Event | None = None
+    _correlator: ShotCorrelator | None = None
+    _ready: ClassVar[list[ShotCreate]] = []
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("SensorGateway should not be instantiated. Use class methods only.")
+
+    @classmethod
+    async def start(cls) -> None:
+        """Bind the UDP socket and start flushing, if enabled and not running yet."""
+        if not settings.sensor_gateway_enabled or cls._transport is not None:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            cls._transport, _ = await loop.create_datagram_endpoint(
+                _SensorProtocol,
+                local_addr=(settings.sensor_gateway_host, settings.sensor_gateway_port),
+            )
+        except OSError as exc:
+            # With several workers the first one to bind owns the gateway.
+            get_logger().info("Sensor gateway not started in this worker: %s", exc)
+            return
+        cls._correlator = ShotCorrelator(
+            timedelta(seconds=settings.sensor_gateway_match_window),
+            settings.sensor_gateway_flush_interval,
+        )
+        cls._wake = asyncio.Event()
+        cls._flusher = asyncio.create_task(cls._run(cls._wake))
+        get_logger().info("Sensor gateway listening on %s:%d", *cls.address())
+
+    @classmethod
+    def address(cls) -> tuple[str, int]:
+        """Return the bound (host, port); the port is the real one if 0 was configured."""
+        if cls._transport is None:
+            raise RuntimeError("Sensor gateway is not running")
+        host, port = cls._transport.get_extra_info("sockname")[:2]
+        return host, port
+
+    @classmethod
+    def feed(cls, data: bytes, received_at: datetime | None = None) -> None:
+        """Parse one datagram and queue the shots its events complete."""
+        if cls._correlator is None or cls._wake is None:
+            return
+        received_at = received_at or datetime.now(UTC)
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                event = _event_adapter.validate_json(line)
+            except ValidationError:
+                Metrics.increment("sensor_gateway.invalid_events")
+                continue
+            Metrics.increment("sensor_gateway.events")
+            shot = cls._correlator.add(event, received_at)
+            if shot is not None:
+                cls._ready.append(shot)
+        if len(cls._ready) >= settings.sensor_gateway_batch_size:
+            cls._wake.set()
+
+    @classmethod
+    async def _run(cls, wake: asyncio.Event) -> None:
+        """Flush every interval, or early when a full batch is waiting, until cancelled."""
+        while True:
+            try:
+                async with asyncio.timeout(settings.sensor_gateway_flush_interval):
+                    await wake.wait()
+            except TimeoutError:
+                pass
+            wake.clear()
+            await cls.flush()
+
+    @classmethod
+    async def flush(cls) -> int:
+        """Write the completed shots and expired misses; return how many were written.
+
+        If the database cannot be reached the shots are kept for the next flush,
+        up to ``sensor_gateway_max_pending``. If it rejects the batch, the shots
+        are written one by one and only those it rejects are dropped.
+        """
+        if cls._correlator is not None:
+            misses = cls._correlator.expire(datetime.now(UTC))
+            if misses:
+                Metrics.increment("sensor_gateway.misses", len(misses))
+                cls._ready.extend(misses)
+        if not cls._ready:
+            return 0
+        shots, cls._ready = cls._ready, []
+        model: ShotModel | None = None
+        accepted: list[ShotCreate] = []
+        try:
+            pool = await DBPool.open_db_pool()
+            accepted = await _accepted_shots(pool, shots)
+            model = ShotModel(pool)
+            written = await model.copy_shots(accepted)
+        except (DBException, OSError, PostgresError) as exc:
+            if model is None or is_connection_error(exc):
+                cls._keep(shots, exc)
+                return 0
+            get_logger().warning(
+                "Writing %d sensor shots failed, writing them one by one: %s", len(accepted), exc
+            )
+            written = await cls._write_one_by_one(model, accepted)
+        Metrics.increment("sensor_gateway.shots", written)
+        return written
+
+    @classmethod
+    async def _write_one_by_one(cls, model: ShotModel, shots: list[ShotCreate]) -> int:
+        """Write ``shots`` singly, dropping the rejected ones; return how many were written.
+
+        On a connection failure the shots not written yet are kept for the next flush.
+        """
+        written = 0
+        for i, shot in enumerate(shots):
+            try:
+                written += await model.copy_shots([shot])
+            except (DBException, OSError, PostgresError) as exc:
+                if is_connection_error(exc):
+                    cls._keep(shots[i:], exc)
+                    break
+                get_logger().warning("Dropping sensor shot of slot %s: %s", shot.slot_id, exc)
+                Metrics.increment("sensor_gateway.rejected")
+        return written
+
+    @classmethod
+    def _keep(cls, shots: list[ShotCreate], exc: BaseException) -> None:
+        """Keep unwritten ``shots`` for the next flush, up to ``sensor_gateway_max_pending``."""
+        get_logger().warning("Writing %d sensor shots failed, retrying: %s", len(shots), exc)
+        kept = (shots + cls._ready)[-settings.sensor_gateway_max_pending :]
+        Metrics.increment("sensor_gateway.dropped", len(shots) + len(cls._ready) - len(kept))
+        cls._ready = kept
+
+    @classmethod
+    def pending_count(cls) -> int:
+        """Return how many events wait for a pairing or a write."""
+        return cls.releases_pending() + len(cls._ready)
+
+    @classmethod
+    def releases_pending(cls) -> int:
+        """Return how many bow releases wait for a landing or their timeout."""
+        return cls._correlator.pending_count() if cls._correlator is not None else 0
+
+    @classmethod
+    def timeout_lag_ms(cls) -> float:
+        """Return how late the last expired releases were turned into misses, in ms."""
+        return cls._correlator.timeout_lag * 1000 if cls._correlator is not None else 0.0
+
+    @classmethod
+    async def close(cls) -> None:
+        """Stop receiving, write the completed shots and stop flushing on shutdown.
+
+        Releases still waiting for a landing are dropped.
+        """
+        if cls._transport is not None:
+            cls._transport.close()
+            cls._transport = None
+        if cls._flusher is not None:
+            cls._flusher.cancel()
+            try:
+                await cls._flusher
+            except asyncio.CancelledError:
+                pass
+            cls._flusher = None
+        await cls.flush()
+        cls._correlator = None
+        cls._wake = None
+        cls._ready = []
+
+
+Metrics.register_gauge("sensor_gateway.pending", SensorGateway.pending_count)
+Metrics.register_gauge("sensor_gateway.releases_pending", SensorGateway.releases_pending)
+Metrics.register_gauge("sensor_gateway.timeout_lag_ms", SensorGateway.timeout_lag_ms)
@@ -3,8 +3,8 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from core.base_manager import BaseManager
-from models.parent_model import DBException, DBNotFound
-from schema import SessionCreate, SessionFilter, SessionId, SessionRead
+from models.parent_model import DBException, DBNotFound, Page
+from schema import PageRequest, SessionCreate, SessionFilter, SessionId, SessionRead
 
 
 class SessionManager(BaseManager):
@@ -18,10 +18,10 @@ class SessionManager(BaseManager):
         return SessionId(session_id=session_id)
 
     async def get_closed_session_for_archer(
-        self, current_archer_id: UUID, archer_id: UUID
-    ) -> list[SessionRead]:
+        self, current_archer_id: UUID, archer_id: UUID, page: PageRequest
+    ) -> Page[SessionRead]:
         self.verify_archer_identity(current_archer_id, archer_id)
-        return await self.session.get_all_closed_sessions_owned_by(archer_id)
+        return await self.session.get_all_closed_sessions_owned_by(archer_id, page)
 
     async def get_participating_session_for_archer(
         self, current_archer_id: UUID, archer_id: UUID
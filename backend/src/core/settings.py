@@ -7,7 +7,7 @@ from pathlib import Path
 from pydantic import Field, computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from schema import JWTAlgorithm
+from schema import JWTAlgorithm, OpenParticipantsMode
 
 _ENV_FILE = Path(__file__).resolve().parent / ".env"
 _ENV_FILE_STR = str(_ENV_FILE) if _ENV_FILE.exists() else None
@@ -60,6 +60,153 @@ class Settings(BaseSettings):
         default=200,
         description="Statement cache size for asyncpg connections",
     )
+    sql_statement_cache_size: int = Field(
+        default=512,
+        description=(
+            "Maximum number of generated SQL statement texts cached per process by the models "
+            "(0 disables the cache)"
+        ),
+    )
+    open_participants_mode: OpenParticipantsMode = Field(
+        default=OpenParticipantsMode.LIVE,
+        description=(
+            "'live' derives open participants from the base tables on read, so joining or "
+            "leaving a session costs no view refresh; 'view' keeps the materialized view, "
+            "refreshed inline; 'debounced' refreshes it in the background"
+        ),
+    )
+    open_participants_refresh_window: float = Field(
+        default=0.25,
+        description=(
+            "Seconds the debounced open_participants refresher waits after a request so a "
+            "burst of joins and leaves costs a single refresh"
+        ),
+    )
+    open_participants_wait_timeout: float = Field(
+        default=5.0,
+        description="Seconds a reader waits for a pending debounced open_participants refresh",
+    )
+    slot_cache_size: int = Field(
+        default=1024, description="Slots cached per worker for ownership checks (0 disables)"
+    )
+    slot_cache_ttl: float = Field(
+        default=30.0,
+        description="Seconds a cached slot stays valid even if no update notification arrives",
+    )
+    shot_single_round_trip: bool = Field(
+        default=True,
+        description=(
+            "Check slot ownership and session state, assign timestamps and insert shots in a "
+            "single SQL statement instead of one query per step"
+        ),
+    )
+    shot_arrow_diameter: float = Field(
+        default=5.5,
+        description=(
+            "Arrow shaft diameter (mm) used when scoring coordinates; an arrow touching a "
+            "ring's line scores that ring"
+        ),
+    )
+    notification_queue_size: int = Field(
+        default=8,
+        description=(
+            "Payloads buffered per live-stats subscriber before new ones are merged into the "
+            "newest pending one"
+        ),
+    )
+    notification_max_pending: int = Field(
+        default=500,
+        description=(
+            "Unread notifications after which a live-stats subscriber is treated as a slow "
+            "consumer and disconnected"
+        ),
+    )
+    leaderboard_flush_interval: float = Field(
+        default=0.5,
+        description=(
+            "Seconds the session leaderboard stream waits after a score before sending a frame, "
+            "so bursts of shots are coalesced"
+        ),
+    )
+    leaderboard_participants_refresh_interval: float = Field(
+        default=10.0,
+        description="Seconds between re-reads of a streamed session's participants",
+    )
+    list_page_size: int = Field(
+        default=500, description="Rows returned by a paginated list endpoint when no limit is given"
+    )
+    list_page_max_size: int = Field(
+        default=1000, description="Largest limit a client may request from a list endpoint"
+    )
+    shot_export_batch_size: int = Field(
+        default=500,
+        description=(
+            "Rows fetched per round-trip by the shot export cursor, and rows written per "
+            "response chunk"
+        ),
+    )
+    faces_cache_max_age: int = Field(
+        default=86_400,
+        description=(
+            "Seconds clients may reuse a face catalogue response before revalidating it with "
+            "its ETag"
+        ),
+    )
+    sensor_gateway_enabled: bool = Field(
+        default=False, description="Listen for target and bow sensor events over UDP"
+    )
+    sensor_gateway_host: str = Field(
+        default="127.0.0.1", description="Address the sensor gateway binds its UDP socket to"
+    )
+    sensor_gateway_port: int = Field(default=9750, description="UDP port of the sensor gateway")
+    sensor_gateway_flush_interval: float = Field(
+        default=0.05, description="Seconds between writes of correlated sensor shots"
+    )
+    sensor_gateway_batch_size: int = Field(
+        default=500, description="Correlated sensor shots that trigger a write before the interval"
+    )
+    sensor_gateway_match_window: float = Field(
+        default=2.0,
+        description=(
+            "Seconds after a bow release within which a target landing is paired with it; "
+            "a release left unpaired after that is stored as a miss"
+        ),
+    )
+    sensor_gateway_max_pending: int = Field(
+        default=10_000,
+        description="Sensor shots kept while the database is unreachable; older ones are dropped",
+    )
+    shot_idempotency_cache_size: int = Field(
+        default=4096,
+        description="Recently submitted idempotency keys remembered per worker (0 disables)",
+    )
+    shot_idempotency_cache_ttl: float = Field(
+        default=600.0,
+        description=(
+            "Seconds a resubmitted idempotency key is answered from memory; later retries are "
+            "still deduplicated by the database"
+        ),
+    )
+    shot_journal_dir: str = Field(
+        default="",
+        description=(
+            "Directory of the write-ahead shot journal; when set, posted shots are acknowledged "
+            "once journaled and written to the database in the background"
+        ),
+    )
+    shot_journal_batch_size: int = Field(
+        default=1000, description="Journaled shots written to the database per statement"
+    )
+    shot_journal_retry_interval: float = Field(
+        default=1.0, description="Seconds between attempts to drain the journal to the database"
+    )
+    shot_journal_max_attempts: int = Field(
+        default=3,
+        description=(
+            "Times the database may reject a journaled shot before it is moved to the "
+            "journal's quarantine file"
+        ),
+    )
     # App runtime
     arch_stats_dev_mode: bool = Field(
         default=False, description="Enable development mode for Archy Stats"
@@ -92,6 +239,35 @@ class Settings(BaseSettings):
     arch_stats_jwt_ttl_minutes: int = Field(
         default=60, description="JWT access token lifetime (minutes)"
     )
+    jwt_claims_cache_size: int = Field(
+        default=1024, description="Verified JWTs whose claims are cached per worker (0 disables)"
+    )
+    jwt_claims_cache_ttl: float = Field(
+        default=300.0,
+        description=(
+            "Seconds a verified JWT is trusted without re-checking its signature; never past "
+            "the token's own exp"
+        ),
+    )
+    google_certs_url: str = Field(
+        default="https://www.googleapis.com/oauth2/v3/certs",
+        description="JWKS endpoint holding the keys Google signs ID tokens with",
+    )
+    google_certs_default_ttl: float = Field(
+        default=3600.0,
+        description="Seconds Google's keys are kept when the response has no Cache-Control max-age",
+    )
+    google_certs_refresh_margin: float = Field(
+        default=300.0,
+        description="Seconds before Google's keys expire that a background refresh is started",
+    )
+    google_certs_retry_interval: float = Field(
+        default=30.0,
+        description="Seconds the current keys keep being served after a failed refresh",
+    )
+    google_certs_fetch_timeout: float = Field(
+        default=5.0, description="Timeout (seconds) for fetching Google's keys"
+    )
 
     @computed_field
     @property
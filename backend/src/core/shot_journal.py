@@ -0,0 +1,383 @@
+import asyncio
+import fcntl
+import itertools
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, ClassVar, Final, Self
+from uuid import UUID, uuid4
+
+from asyncpg import PostgresError
+
+from core.db_pool import DBPool, is_connection_error
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.settings import settings
+from core.ttl_cache import TTLCache
+from models import DBException, ShotModel
+from schema import ShotCreate
+
+# Every record is its payload length and CRC-32, then the JSON payload.
+_HEADER: Final[struct.Struct] = struct.Struct("<II")
+# Seconds the latest journaled shot of a slot is remembered; longer than any
+# batch's timing window.
+LATEST_SHOT_TTL: Final[float] = 3600.0
+
+type JournalEntry = tuple[UUID, ShotCreate]
+
+
+def encode_record(shot_id: UUID, shot: ShotCreate) -> bytes:
+    """Serialize one journaled shot."""
+    payload = json.dumps({"shot_id": str(shot_id), "shot": shot.model_dump(mode="json")}).encode()
+    return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_records(data: bytes | mmap.mmap) -> tuple[list[JournalEntry], int]:
+    """Parse the records at the start of ``data``; return them and how many bytes they span.
+
+    Parsing stops at the first torn or corrupt record: a crash while it was
+    written means it was never acknowledged.
+    """
+    entries: list[JournalEntry] = []
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        length, crc = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        payload = bytes(data[start : start + length])
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        record = json.loads(payload)
+        entries.append((UUID(record["shot_id"]), ShotCreate.model_validate(record["shot"])))
+        offset = start + length
+    return entries, offset
+
+
+def _lock_journal(directory: Path) -> tuple[int, Path]:
+    """Open and lock the first journal file of ``directory`` no other worker holds."""
+    directory.mkdir(parents=True, exist_ok=True)
+    index = 0
+    while True:
+        path = directory / f"shots-{index}.journal"
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            index += 1
+            continue
+        return fd, path
+
+
+def _read_journal(fd: int, path: Path) -> tuple[list[JournalEntry], bytes]:
+    """Return the records of a locked journal file and their bytes, cutting off a torn tail."""
+    size = os.fstat(fd).st_size
+    if not size:
+        return [], b""
+    with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as view:
+        entries, valid = decode_records(view)
+        data = view[:valid]
+    if valid < size:
+        get_logger().warning("Cutting %d torn bytes off %s", size - valid, path)
+        os.ftruncate(fd, valid)
+    return entries, data
+
+
+def _adopt_orphans(fd: int, path: Path) -> list[JournalEntry]:
+    """Move the records of every journal no running worker holds into the locked ``fd``.
+
+    A file is emptied only once its records are synced into ``fd``, so a crash
+    in between replays them twice at worst, which their ids make harmless.
+    """
+    adopted: list[JournalEntry] = []
+    for other in sorted(path.parent.glob("shots-*.journal")):
+        if other == path:
+            continue
+        other_fd = os.open(other, os.O_RDWR)
+        try:
+            try:
+                fcntl.flock(other_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+            entries, data = _read_journal(other_fd, other)
+            if not entries:
+                continue
+            os.write(fd, data)
+            os.fsync(fd)
+            os.ftruncate(other_fd, 0)
+            get_logger().info("Adopted %d journaled shots from %s", len(entries), other)
+            adopted.extend(entries)
+        finally:
+            os.close(other_fd)
+    return adopted
+
+
+class ShotJournal:
+    """Borg write-ahead journal for posted shots.
+
+    `append` writes shots to an append-only file and returns once an fsync
+    covers them; appends made while an fsync runs share the next one. A
+    background task then writes the journaled shots to ``shot`` in order, with
+    the id they were acknowledged with, retrying every
+    ``shot_journal_retry_interval`` seconds while the database is unreachable.
+    The file is emptied whenever everything in it is stored.
+
+    Each worker locks its own file in ``shot_journal_dir``. On start, the file
+    it locks and every other file no running worker holds are replayed (read
+    through ``mmap``); shots already stored are skipped by their id, and a torn
+    last record is cut off. A shot the database rejects
+    ``shot_journal_max_attempts`` times is moved to a ``.quarantine`` file
+    beside the journal, so it cannot hold back the shots after it.
+    """
+
+    _fd: int | None = None
+    _path: Path | None = None
+    _syncer: asyncio.Task[None] | None = None
+    _drainer: asyncio.Task[None] | None = None
+    _dirty: asyncio.Event | None = None
+    _wake: asyncio.Event | None = None
+    # Journaled and synced, oldest first, waiting to be stored.
+    _entries: ClassVar[deque[JournalEntry]] = deque()
+    # Written but not synced yet, with the future their `append` waits on.
+    _unsynced: ClassVar[list[tuple[list[JournalEntry], asyncio.Future[None]]]] = []
+    # shot_id -> times the database rejected it.
+    _rejections: ClassVar[dict[UUID, int]] = {}
+    # slot_id -> created_at of its latest shot journaled by this worker.
+    _latest: ClassVar[TTLCache[UUID, datetime]] = TTLCache(
+        settings.slot_cache_size, LATEST_SHOT_TTL
+    )
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("ShotJournal should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def start(cls) -> None:
+        """Open the journal, queue what a previous run left in it and start draining."""
+        if not settings.shot_journal_dir or cls._fd is not None:
+            return
+        fd, path = _lock_journal(Path(settings.shot_journal_dir))
+        entries, _ = _read_journal(fd, path)
+        entries.extend(_adopt_orphans(fd, path))
+        cls._fd, cls._path = fd, path
+        cls._entries = deque(entries)
+        cls._dirty = asyncio.Event()
+        cls._wake = asyncio.Event()
+        cls._syncer = asyncio.create_task(cls._sync(fd, cls._dirty, cls._wake))
+        cls._drainer = asyncio.create_task(cls._drain(cls._wake))
+        if entries:
+            cls._wake.set()
+        get_logger().info("Shot journal %s opened with %d shots to replay", path, len(entries))
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """Return whether posted shots go through the journal."""
+        return cls._fd is not None
+
+    @classmethod
+    def latest_shot_time(cls, slot_id: UUID) -> datetime | None:
+        """Return when the latest shot of the slot this worker journaled was made, if known.
+
+        Journaled shots may not be stored yet, so while the journal runs this
+        stands in for asking the database.
+        """
+        return cls._latest.get(slot_id)
+
+    @classmethod
+    async def append(
+        cls, shots: list[ShotCreate], shot_ids: list[UUID] | None = None
+    ) -> list[UUID]:
+        """Journal ``shots`` durably and return their ids.
+
+        The ids are ``shot_ids`` if given, else new random ones. A missing
+        created_at is stamped with the current time, since the shots may reach
+        the database much later.
+
+        Raises:
+            RuntimeError: If the journal is not running.
+            OSError: If the journal could not be synced to disk.
+        """
+        if cls._fd is None or cls._dirty is None:
+            raise RuntimeError("Shot journal is not running")
+        now = datetime.now(UTC)
+        entries: list[JournalEntry] = []
+        for i, shot in enumerate(shots):
+            if shot.created_at is None:
+                shot.created_at = now
+            entries.append((shot_ids[i] if shot_ids is not None else uuid4(), shot))
+            latest = cls._latest.get(shot.slot_id)
+            if latest is None or shot.created_at > latest:
+                cls._latest.put(shot.slot_id, shot.created_at)
+        os.write(cls._fd, b"".join(encode_record(*entry) for entry in entries))
+        synced = asyncio.get_running_loop().create_future()
+        cls._unsynced.append((entries, synced))
+        cls._dirty.set()
+        await synced
+        Metrics.increment("shot_journal.appended", len(entries))
+        return [shot_id for shot_id, _ in entries]
+
+    @classmethod
+    async def _sync(cls, fd: int, dirty: asyncio.Event, wake: asyncio.Event) -> None:
+        """Fsync the appended records in groups and hand them to the drainer."""
+        while True:
+            await dirty.wait()
+            dirty.clear()
+            # Left in _unsynced until synced, so the file is not emptied under them.
+            batch = cls._unsynced[:]
+            try:
+                await asyncio.to_thread(os.fsync, fd)
+            except OSError as exc:
+                get_logger().error("Syncing the shot journal failed: %s", exc)
+                del cls._unsynced[: len(batch)]
+                for _, synced in batch:
+                    if not synced.done():
+                        synced.set_exception(exc)
+                continue
+            del cls._unsynced[: len(batch)]
+            for entries, synced in batch:
+                cls._entries.extend(entries)
+                if not synced.done():
+                    synced.set_result(None)
+            Metrics.increment("shot_journal.fsyncs")
+            wake.set()
+
+    @classmethod
+    async def _drain(cls, wake: asyncio.Event) -> None:
+        """Store journaled shots as they are synced, or after a retry interval, until cancelled."""
+        while True:
+            try:
+                async with asyncio.timeout(settings.shot_journal_retry_interval):
+                    await wake.wait()
+            except TimeoutError:
+                pass
+            wake.clear()
+            await cls.drain()
+            if cls._entries:
+                await asyncio.sleep(settings.shot_journal_retry_interval)
+
+    @classmethod
+    async def drain(cls) -> int:
+        """Store the journaled shots in order; return how many were stored.
+
+        Stops at the first connection failure, keeping the remaining shots for
+        the next attempt. A batch the database rejects is stored shot by shot.
+        """
+        stored = 0
+        while cls._entries:
+            batch = list(itertools.islice(cls._entries, settings.shot_journal_batch_size))
+            model: ShotModel | None = None
+            try:
+                model = ShotModel(await DBPool.open_db_pool())
+                await model.insert_with_ids(batch)
+            except (DBException, OSError, PostgresError) as exc:
+                if model is None or is_connection_error(exc):
+                    cls._drain_failed(exc)
+                    return stored
+                count, complete = await cls._drain_one_by_one(model, batch)
+                stored += count
+                if not complete:
+                    return stored
+                continue
+            for _ in batch:
+                cls._entries.popleft()
+            stored += len(batch)
+            Metrics.increment("shot_journal.drained", len(batch))
+        if cls._fd is not None and not cls._unsynced:
+            os.ftruncate(cls._fd, 0)
+        return stored
+
+    @classmethod
+    async def _drain_one_by_one(
+        cls, model: ShotModel, batch: list[JournalEntry]
+    ) -> tuple[int, bool]:
+        """Store ``batch`` shot by shot; return how many were stored and whether all were handled.
+
+        A rejected shot is retried on later drains, then quarantined once it
+        was rejected ``shot_journal_max_attempts`` times.
+        """
+        stored = 0
+        for entry in batch:
+            shot_id = entry[0]
+            try:
+                await model.insert_with_ids([entry])
+            except (DBException, OSError, PostgresError) as exc:
+                if is_connection_error(exc):
+                    cls._drain_failed(exc)
+                    return stored, False
+                rejections = cls._rejections.get(shot_id, 0) + 1
+                if rejections < settings.shot_journal_max_attempts:
+                    cls._rejections[shot_id] = rejections
+                    get_logger().warning("Journaled shot %s rejected, retrying: %s", shot_id, exc)
+                    Metrics.increment("shot_journal.drain_failures")
+                    return stored, False
+                cls._quarantine(entry, exc)
+            else:
+                stored += 1
+                Metrics.increment("shot_journal.drained")
+            cls._rejections.pop(shot_id, None)
+            cls._entries.popleft()
+        return stored, True
+
+    @classmethod
+    def _drain_failed(cls, exc: BaseException) -> None:
+        get_logger().warning(
+            "Storing %d journaled shots failed, retrying: %s", len(cls._entries), exc
+        )
+        Metrics.increment("shot_journal.drain_failures")
+
+    @classmethod
+    def _quarantine(cls, entry: JournalEntry, exc: BaseException) -> None:
+        """Set a shot the database keeps rejecting aside in the quarantine file."""
+        if cls._path is not None:
+            fd = os.open(
+                cls._path.with_suffix(".quarantine"), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600
+            )
+            try:
+                os.write(fd, encode_record(*entry))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        get_logger().error("Quarantined journaled shot %s: %s", entry[0], exc)
+        Metrics.increment("shot_journal.quarantined")
+
+    @classmethod
+    def pending_count(cls) -> int:
+        """Return how many journaled shots are not stored yet."""
+        unsynced = sum(len(entries) for entries, _ in cls._unsynced)
+        return len(cls._entries) + unsynced
+
+    @classmethod
+    async def close(cls) -> None:
+        """Stop the background tasks, store what can be stored and release the file.
+
+        Shots that cannot be stored stay in the file for the next start.
+        """
+        for task in (cls._syncer, cls._drainer):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        cls._syncer = cls._drainer = None
+        if cls._fd is None:
+            return
+        os.fsync(cls._fd)
+        for entries, synced in cls._unsynced:
+            cls._entries.extend(entries)
+            if not synced.done():
+                synced.set_result(None)
+        cls._unsynced = []
+        await cls.drain()
+        os.close(cls._fd)
+        cls._fd = cls._path = None
+        cls._dirty = cls._wake = None
+        cls._entries = deque()
+        cls._rejections = {}
+
+
+Metrics.register_gauge("shot_journal.pending", ShotJournal.pending_count)
@@ -1,16 +1,45 @@
+import csv
+import io
+from collections.abc import AsyncGenerator, Callable
 from datetime import UTC, datetime, timedelta
 from enum import Enum, auto
 from typing import Final
-from uuid import UUID
+from uuid import UUID, uuid4, uuid5
 
 from fastapi import HTTPException, status
 
 from core.base_manager import BaseManager
-from models.parent_model import DBNotFound
-from schema import ShotCreate, ShotFilter, ShotId, ShotRead, SlotRead
+from core.metrics import Metrics
+from core.scoring import score_shots
+from core.settings import settings
+from core.shot_journal import ShotJournal
+from core.ttl_cache import TTLCache
+from models.parent_model import DBNotFound, Page
+from schema import (
+    ExportFormat,
+    PageRequest,
+    ShotCreate,
+    ShotFilter,
+    ShotId,
+    ShotRead,
+    SlotRead,
+)
 
 MIN_BATCH_SIZE: Final[int] = 3
 MAX_BATCH_SIZE: Final[int] = 10
+# Namespace of the shot ids derived from client idempotency keys.
+SHOT_ID_NAMESPACE: Final[UUID] = UUID("0b8e5d3c-51f4-4a8e-9c2f-7d6a1e4b9f30")
+
+# (archer_id, idempotency key) -> shot id of recent submissions, so retries
+# answer without touching the database.
+_recent_shot_ids: Final[TTLCache[tuple[UUID, str], UUID]] = TTLCache(
+    settings.shot_idempotency_cache_size, settings.shot_idempotency_cache_ttl
+)
+
+
+def idempotent_shot_id(archer_id: UUID, idempotency_key: str) -> UUID:
+    """Return the id every submission of ``idempotency_key`` by the archer gets."""
+    return uuid5(SHOT_ID_NAMESPACE, f"{archer_id}:{idempotency_key}")
 
 
 class TimingScenario(Enum):
@@ -62,11 +91,43 @@ def deal_with_compress_scenario(
     return window_start
 
 
+def _ndjson_line(shot: ShotRead) -> str:
+    return shot.model_dump_json() + "\n"
+
+
+def _csv_line(values: list[object]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def _csv_row(shot: ShotRead) -> str:
+    return _csv_line(list(shot.model_dump(mode="json").values()))
+
+
 class ShotManagerError(Exception):
     """Custom exception for shot assignment manager errors."""
 
 
 class ShotManager(BaseManager):
+    async def _submit_shots(
+        self, shots: list[ShotCreate], current_archer_id: UUID, assign_timestamps: bool
+    ) -> list[UUID]:
+        """Single round-trip ingestion with the same errors as the step-by-step path."""
+        shot_ids = self._keyed_shot_ids(shots, current_archer_id)
+        submission = await self.shot.submit(shots, current_archer_id, assign_timestamps, shot_ids)
+        if current_archer_id != submission.archer_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+        if not submission.is_session_opened:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Cannot add shots to a closed session",
+            )
+        if shot_ids is None:
+            return submission.shot_ids
+        self._remember_keys(shots, shot_ids, current_archer_id)
+        return shot_ids
+
     async def _assign_dynamic_timestamps(self, shots: list[ShotCreate], slot: SlotRead) -> None:
         """Dynamically assigns created_at backward from now() for a batch of shots."""
 
@@ -79,7 +140,11 @@ class ShotManager(BaseManager):
         window_start = now_time - timedelta(seconds=default_duration)
 
         # 2. Adjust boundaries based on constraints (The Scenarios)
-        latest_shot_time = await self.shot.get_latest_shot_time(shots[0].slot_id)
+        if ShotJournal.is_running():
+            # Journaled shots may not be stored yet, and the journal must not wait on the DB.
+            latest_shot_time = ShotJournal.latest_shot_time(shots[0].slot_id)
+        else:
+            latest_shot_time = await self.shot.get_latest_shot_time(shots[0].slot_id)
 
         actions = {
             TimingScenario.COMPRESSED: deal_with_compress_scenario,
@@ -99,7 +164,91 @@ class ShotManager(BaseManager):
         for i, shot in enumerate(shots):
             shot.created_at = window_start + timedelta(seconds=actual_interval * i)
 
+    async def _score_shots(self, shots: list[ShotCreate]) -> None:
+        """Score the shots posted with coordinates only, on their slot's target face.
+
+        All shots must belong to the same slot.
+        """
+        if not any(shot.needs_scoring for shot in shots):
+            return
+        slot = await self.slot.get_by_id(shots[0].slot_id)
+        try:
+            score_shots(slot.face_type, shots)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
+            ) from e
+
+    @staticmethod
+    def _can_submit_in_one_trip() -> bool:
+        """Whether shots can be checked and inserted by `ShotModel.submit`."""
+        return settings.shot_single_round_trip and not ShotJournal.is_running()
+
+    @staticmethod
+    def _keyed_shot_ids(shots: list[ShotCreate], current_archer_id: UUID) -> list[UUID] | None:
+        """Return the ids to insert ``shots`` with if any has an idempotency key, else None.
+
+        A keyed shot gets the id derived from its key, the others a random one.
+        """
+        if all(shot.idempotency_key is None for shot in shots):
+            return None
+        return [
+            uuid4()
+            if shot.idempotency_key is None
+            else idempotent_shot_id(current_archer_id, shot.idempotency_key)
+            for shot in shots
+        ]
+
+    @staticmethod
+    def _remember_keys(
+        shots: list[ShotCreate], shot_ids: list[UUID], current_archer_id: UUID
+    ) -> None:
+        """Cache the ids of the keyed shots, so a retry is answered from memory."""
+        for shot, shot_id in zip(shots, shot_ids, strict=True):
+            if shot.idempotency_key is not None:
+                _recent_shot_ids.put((current_archer_id, shot.idempotency_key), shot_id)
+
+    @staticmethod
+    def _resubmitted_ids(shots: list[ShotCreate], current_archer_id: UUID) -> list[UUID] | None:
+        """Return the ids of ``shots`` if all of them were submitted recently, else None."""
+        shot_ids: list[UUID] = []
+        for shot in shots:
+            if shot.idempotency_key is None:
+                return None
+            shot_id = _recent_shot_ids.get((current_archer_id, shot.idempotency_key))
+            if shot_id is None:
+                return None
+            shot_ids.append(shot_id)
+        Metrics.increment("shot.resubmissions", len(shot_ids))
+        return shot_ids
+
+    async def _store_shots(self, shots: list[ShotCreate], current_archer_id: UUID) -> list[UUID]:
+        """Insert checked shots, or journal them when the journal runs.
+
+        A shot with an idempotency key gets the id derived from it, and is not
+        inserted again if that id is already stored.
+        """
+        shot_ids = self._keyed_shot_ids(shots, current_archer_id)
+        if ShotJournal.is_running():
+            shot_ids = await ShotJournal.append(shots, shot_ids)
+        elif shot_ids is not None:
+            await self.shot.insert_with_ids(list(zip(shot_ids, shots, strict=True)))
+        elif len(shots) == 1:
+            return [await self.shot.insert_one(shots[0])]
+        else:
+            return await self.shot.insert_many(shots)
+        self._remember_keys(shots, shot_ids, current_archer_id)
+        return shot_ids
+
     async def create_single_shot(self, shot: ShotCreate, current_archer_id: UUID) -> UUID:
+        resubmitted = self._resubmitted_ids([shot], current_archer_id)
+        if resubmitted is not None:
+            return resubmitted[0]
+        await self._score_shots([shot])
+        if self._can_submit_in_one_trip():
+            (shot_id,) = await self._submit_shots([shot], current_archer_id, False)
+            return shot_id
+
         # Verify that the slot belongs to the archer
         slot = await self.verify_slot_ownership(shot.slot_id, current_archer_id)
 
@@ -110,7 +259,8 @@ class ShotManager(BaseManager):
                 detail="Cannot add shots to a closed session",
             )
 
-        return await self.shot.insert_one(shot)
+        (shot_id,) = await self._store_shots([shot], current_archer_id)
+        return shot_id
 
     async def create_batch_shots(
         self, shots: list[ShotCreate], current_archer_id: UUID
@@ -125,6 +275,14 @@ class ShotManager(BaseManager):
                 detail="All shots must belong to the same slot",
             )
 
+        resubmitted = self._resubmitted_ids(shots, current_archer_id)
+        if resubmitted is not None:
+            return resubmitted
+
+        await self._score_shots(shots)
+        if self._can_submit_in_one_trip():
+            return await self._submit_shots(shots, current_archer_id, True)
+
         slot_id = slot_ids.pop()
         slot = await self.verify_slot_ownership(slot_id, current_archer_id)
 
@@ -138,7 +296,7 @@ class ShotManager(BaseManager):
         # --- Dynamic created_at calculation ---
         await self._assign_dynamic_timestamps(shots, slot)
 
-        return await self.shot.insert_many(shots)
+        return await self._store_shots(shots, current_archer_id)
 
     async def create(
         self, shots: ShotCreate | list[ShotCreate], current_archer_id: UUID
@@ -155,16 +313,69 @@ class ShotManager(BaseManager):
         except TypeError:  # Original `else` block for invalid input type
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid input")
 
-    async def get_shots_by_slot(self, slot_id: UUID, current_archer_id: UUID) -> list[ShotRead]:
+    async def get_shots_by_slot(
+        self, slot_id: UUID, current_archer_id: UUID, page: PageRequest
+    ) -> Page[ShotRead]:
         try:
             await self.verify_slot_ownership(slot_id, current_archer_id)
-            return await self.shot.get_all(ShotFilter(slot_id=slot_id), [])
+            return await self.shot.get_page(ShotFilter(slot_id=slot_id), page)
         except DBNotFound as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
+    async def export_shots(
+        self,
+        current_archer_id: UUID,
+        export_format: ExportFormat,
+        slot_id: UUID | None = None,
+        session_id: UUID | None = None,
+    ) -> AsyncGenerator[str]:
+        """Return the archer's shots serialized as response chunks.
+
+        Access checks run before this returns, so errors surface as a normal HTTP
+        status rather than a truncated stream. Without ``slot_id``/``session_id``
+        the archer's whole history is exported.
+        """
+        if slot_id is not None:
+            try:
+                await self.verify_slot_ownership(slot_id, current_archer_id)
+            except DBNotFound as e:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+        serialize: Callable[[ShotRead], str] = _ndjson_line
+        header = ""
+        if export_format is ExportFormat.CSV:
+            serialize = _csv_row
+            header = _csv_line(list(ShotRead.model_fields))
+        shots = self.shot.stream_for_archer(current_archer_id, slot_id, session_id)
+        return self._chunks(shots, serialize, header)
+
+    @staticmethod
+    async def _chunks(
+        shots: AsyncGenerator[ShotRead], serialize: Callable[[ShotRead], str], header: str
+    ) -> AsyncGenerator[str]:
+        """Group serialized shots so each response write carries a whole cursor batch."""
+        lines = [header] if header else []
+        try:
+            async for shot in shots:
+                lines.append(serialize(shot))
+                if len(lines) >= settings.shot_export_batch_size:
+                    yield "".join(lines)
+                    lines.clear()
+            if lines:
+                yield "".join(lines)
+        finally:
+            await shots.aclose()
+
     async def get_shots_count_by_slot(self, slot_id: UUID, current_archer_id: UUID) -> int:
         try:
             await self.verify_slot_ownership(slot_id, current_archer_id)
             return await self.shot.count_by_slot(slot_id)
         except DBNotFound as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
+for _stat in ("hits", "misses", "evictions", "expirations", "size"):
+    Metrics.register_gauge(
+        f"shot_idempotency_cache.{_stat}",
+        lambda stat=_stat: _recent_shot_ids.stats()[stat],
+    )
@@ -79,7 +79,6 @@ class SlotManager(BaseManager):
             shot_per_round=shot_per_round,
             interval_seconds=interval_seconds,
         )
-        await self.slot.refresh_open_participants()
         return new_slot_id
 
     async def assign_archer_to_slot(
@@ -87,62 +86,65 @@ class SlotManager(BaseManager):
     ) -> SlotJoinResponse:
         """Assigns an archer to a target slot within a session."""
         try:
-            self.verify_archer_identity(current_archer_id, req_data.archer_id)
-            exists = await self.session.does_open_session_exist(req_data.session_id)
+            async with self.unit_of_work():
+                self.verify_archer_identity(current_archer_id, req_data.archer_id)
+                exists = await self.session.does_open_session_exist(req_data.session_id)
 
-            if not exists:
-                raise SessionClosedOrMissingError(
-                    "ERROR: Session either doesn't exist or it was already closed"
-                )
-
-            # Prevent duplicate participation
-            current_participation = await self.session.is_archer_participating(req_data.archer_id)
-            if current_participation is not None:
-                if current_participation == req_data.session_id:
-                    raise ArcherAlreadyJoinedSessionError(
-                        "ERROR: archer already joined this session"
+                if not exists:
+                    raise SessionClosedOrMissingError(
+                        "ERROR: Session either doesn't exist or it was already closed"
                     )
-                raise ArcherParticipatingError(
-                    "ERROR: archer already participating in an open session"
+
+                # Prevent duplicate participation
+                current_participation = await self.session.is_archer_participating(
+                    req_data.archer_id
                 )
+                if current_participation is not None:
+                    if current_participation == req_data.session_id:
+                        raise ArcherAlreadyJoinedSessionError(
+                            "ERROR: archer already joined this session"
+                        )
+                    raise ArcherParticipatingError(
+                        "ERROR: archer already participating in an open session"
+                    )
 
-            available_targets = await self.slot.get_available_targets(req_data)
-            lane = 1
-            if available_targets:
-                target_id = available_targets[0].get_id()
-                lane = available_targets[0].lane
-                used_letters = await self.slot.get_assigned_letters(target_id)
-                for opt in [
-                    SlotLetterType.A,
-                    SlotLetterType.B,
-                    SlotLetterType.C,
-                    SlotLetterType.D,
-                ]:
-                    if opt not in used_letters:
-                        letter = opt
-                        break
+                available_targets = await self.slot.get_available_targets(req_data)
+                lane = 1
+                if available_targets:
+                    target_id = available_targets[0].get_id()
+                    lane = available_targets[0].lane
+                    used_letters = await self.slot.get_assigned_letters(target_id)
+                    for opt in [
+                        SlotLetterType.A,
+                        SlotLetterType.B,
+                        SlotLetterType.C,
+                        SlotLetterType.D,
+                    ]:
+                        if opt not in used_letters:
+                            letter = opt
+                            break
+                    else:
+                        raise TargetFullError("ERROR: selected target is full")
                 else:
-                    raise TargetFullError("ERROR: selected target is full")
-            else:
-                lane = await self.target.get_next_empty_lane(req_data.session_id)
-                target_id = await self.create_target(
-                    session_id=req_data.session_id, distance=req_data.distance, lane=lane
+                    lane = await self.target.get_next_empty_lane(req_data.session_id)
+                    target_id = await self.create_target(
+                        session_id=req_data.session_id, distance=req_data.distance, lane=lane
+                    )
+                    letter = SlotLetterType.A
+
+                slot_id = await self.create_slotassignment(
+                    session_id=req_data.session_id,
+                    target_id=target_id,
+                    archer_id=req_data.archer_id,
+                    face_type=req_data.face_type,
+                    slot_letter=letter,
+                    bowstyle=req_data.bowstyle,
+                    draw_weight=req_data.draw_weight,
+                    club_id=req_data.club_id,
+                    shot_per_round=req_data.shot_per_round,
+                    interval_seconds=req_data.interval_seconds,
                 )
-                letter = SlotLetterType.A
-
-            slot_id = await self.create_slotassignment(
-                session_id=req_data.session_id,
-                target_id=target_id,
-                archer_id=req_data.archer_id,
-                face_type=req_data.face_type,
-                slot_letter=letter,
-                bowstyle=req_data.bowstyle,
-                draw_weight=req_data.draw_weight,
-                club_id=req_data.club_id,
-                shot_per_round=req_data.shot_per_round,
-                interval_seconds=req_data.interval_seconds,
-            )
-            return SlotJoinResponse(slot_id=slot_id, slot=f"{lane}{letter.value}")
+                return SlotJoinResponse(slot_id=slot_id, slot=f"{lane}{letter.value}")
         except SessionClosedOrMissingError as e:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
@@ -160,28 +162,29 @@ class SlotManager(BaseManager):
     async def re_join_session(self, slot_id: UUID, current_archer_id: UUID) -> SlotJoinResponse:
         """Re-activate a previously inactive slot assignment."""
         try:
-            slot_row = await self.verify_slot_ownership(
-                slot_id, current_archer_id, detail="ERROR: user not allowed to re-join"
-            )
-
-            if slot_row.is_shooting:
-                raise ArcherNotAllowedToRejoinError(
-                    "ERROR: the archer is either not allowed to re-join or they are already in"
+            async with self.unit_of_work():
+                slot_row = await self.verify_slot_ownership(
+                    slot_id, current_archer_id, detail="ERROR: user not allowed to re-join"
                 )
 
-            exists = await self.session.does_open_session_exist(slot_row.session_id)
-            if not exists:
-                raise SessionClosedOrMissingError(
-                    "ERROR: The session doesn't exist or it was already closed"
-                )
+                if slot_row.is_shooting:
+                    raise ArcherNotAllowedToRejoinError(
+                        "ERROR: the archer is either not allowed to re-join or they are already in"
+                    )
 
-            where = SlotFilter(slot_id=slot_id)
-            await self.slot.update(SlotSet(is_shooting=True), where)
-            await self.slot.refresh_open_participants()
-            slot_row = await self.slot.get_slot_with_lane(slot_id)
-            if slot_row.slot is None:
-                raise SlotManagerError("ERROR: slot is unexpectedly None")
-            return SlotJoinResponse(slot_id=slot_row.slot_id, slot=slot_row.slot)
+                exists = await self.session.does_open_session_exist(slot_row.session_id)
+                if not exists:
+                    raise SessionClosedOrMissingError(
+                        "ERROR: The session doesn't exist or it was already closed"
+                    )
+
+                where = SlotFilter(slot_id=slot_id)
+                await self.slot.update(SlotSet(is_shooting=True), where)
+                await self.slot.refresh_open_participants()
+                slot_row = await self.slot.get_slot_with_lane(slot_id)
+                if slot_row.slot is None:
+                    raise SlotManagerError("ERROR: slot is unexpectedly None")
+                return SlotJoinResponse(slot_id=slot_row.slot_id, slot=slot_row.slot)
         except SessionClosedOrMissingError as e:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
@@ -203,23 +206,24 @@ class SlotManager(BaseManager):
     async def leave_session(self, slot_id: UUID, current_archer_id: UUID) -> None:
         """Deactivate an active slot assignment (leave the session)."""
         try:
-            slot_row = await self.verify_slot_ownership(
-                slot_id, current_archer_id, detail="ERROR: user not allowed to leave"
-            )
-
-            if not slot_row.is_shooting:
-                raise ArcherNotParticipatingError(
-                    "ERROR: archer is not participating in this session"
+            async with self.unit_of_work():
+                slot_row = await self.verify_slot_ownership(
+                    slot_id, current_archer_id, detail="ERROR: user not allowed to leave"
                 )
 
-            exists = await self.session.does_open_session_exist(slot_row.session_id)
-            if not exists:
-                raise SessionClosedOrMissingError(
-                    "ERROR: Session either doesn't exist or it was already closed"
-                )
+                if not slot_row.is_shooting:
+                    raise ArcherNotParticipatingError(
+                        "ERROR: archer is not participating in this session"
+                    )
+
+                exists = await self.session.does_open_session_exist(slot_row.session_id)
+                if not exists:
+                    raise SessionClosedOrMissingError(
+                        "ERROR: Session either doesn't exist or it was already closed"
+                    )
 
-            req = SlotLeaveRequest(session_id=slot_row.session_id, archer_id=slot_row.archer_id)
-            await self.slot.leave_session(req)
+                req = SlotLeaveRequest(session_id=slot_row.session_id, archer_id=slot_row.archer_id)
+                await self.slot.leave_session(req)
         except SessionClosedOrMissingError as e:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
@@ -0,0 +1,71 @@
+import math
+from collections.abc import Hashable
+
+
+class TimerWheel[K: Hashable]:
+    """Hashed timer wheel: O(1) schedule and cancel, expiry driven by one periodic tick.
+
+    Deadlines are hashed into ``size`` buckets of ``tick`` seconds each. Advancing
+    the wheel only visits the buckets of the ticks that elapsed, so thousands of
+    outstanding timers cost nothing until they are due, and the event loop never
+    holds more than the single task that calls `advance`. A deadline more than
+    one turn of the wheel away simply stays in its bucket for later turns.
+    """
+
+    def __init__(self, tick: float, size: int = 256) -> None:
+        """Initialize an empty wheel.
+
+        Args:
+            tick: Seconds covered by each bucket; the expiry resolution.
+            size: Number of buckets.
+        """
+        self.tick = tick
+        self.size = size
+        self._buckets: list[dict[K, float]] = [{} for _ in range(size)]
+        self._bucket_of: dict[K, int] = {}
+        self._last_tick: int | None = None
+
+    def _tick_of(self, when: float) -> int:
+        return math.floor(when / self.tick)
+
+    def schedule(self, key: K, deadline: float) -> None:
+        """Expire ``key`` once the wheel is advanced past ``deadline``; replaces any earlier timer."""
+        self.cancel(key)
+        tick = self._tick_of(deadline)
+        if self._last_tick is not None:
+            # Already due: file it under the tick the next advance starts from.
+            tick = max(tick, self._last_tick)
+        bucket = tick % self.size
+        self._buckets[bucket][key] = deadline
+        self._bucket_of[key] = bucket
+
+    def cancel(self, key: K) -> bool:
+        """Drop the timer of ``key``; return False if there was none."""
+        bucket = self._bucket_of.pop(key, None)
+        if bucket is None:
+            return False
+        del self._buckets[bucket][key]
+        return True
+
+    def advance(self, now: float) -> list[tuple[K, float]]:
+        """Remove and return ``(key, deadline)`` of every timer whose deadline is before ``now``, earliest first."""
+        now_tick = self._tick_of(now)
+        # The first advance, or one after a gap longer than a turn, visits every bucket once.
+        first = now_tick - self.size + 1
+        if self._last_tick is not None:
+            first = max(first, self._last_tick)
+        ticks = range(first, now_tick + 1)
+        self._last_tick = now_tick
+        expired: list[tuple[K, float]] = []
+        for tick in ticks:
+            bucket = self._buckets[tick % self.size]
+            due = [(key, deadline) for key, deadline in bucket.items() if deadline < now]
+            for key, _ in due:
+                del bucket[key]
+                del self._bucket_of[key]
+            expired.extend(due)
+        expired.sort(key=lambda item: item[1])
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
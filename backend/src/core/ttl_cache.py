@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded LRU cache whose entries also expire ``ttl`` seconds after being stored.
+
+    Meant for per-worker caches of rows that rarely change: the size bound keeps
+    memory flat, the TTL bounds how stale an entry can get if an invalidation is
+    ever missed. Hits, misses, evictions and expirations are counted for metrics.
+    """
+
+    def __init__(
+        self, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries. Least recently used entries are
+                evicted first. A value <= 0 disables caching.
+            ttl: Seconds an entry stays valid after `put`.
+            clock: Monotonic time source, overridable in tests.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (expires_at, value)
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for ``key``, or None on a miss or once expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (the cache's TTL by default).
+
+        A per-entry ``ttl`` can only shorten the cache's TTL, never extend it.
+        """
+        if self.max_size <= 0:
+            return
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+        self._entries[key] = (self._clock() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, keys: Iterable[K]) -> None:
+        """Drop ``keys`` from the cache; unknown keys are ignored."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters and the current number of entries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
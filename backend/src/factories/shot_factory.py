@@ -99,32 +99,27 @@ async def create_shots(
         if not valid_slot_ids:
             return shot_ids
 
-        # Insert shots one by one with RETURNING shot_id
+        # Insert every shot in one statement, passing one array per column.
+        shots: list[tuple[UUID, float, float, int, bool, UUID | None]] = []
         for _ in range(qty):
-            slot_id = random.choice(tuple(valid_slot_ids))
             x, y = _random_xy()
             score = _random_score()
             # Mark some 10s as inner-10 (X) for realism. Keep others FALSE.
             is_x = bool(score == PERFECT_SCORE and random.random() < X_RING_PROBABILITY)
-            arrow_id: UUID | None = None
-            if arrow_ids:
-                arrow_id = random.choice(list(arrow_ids))
-
-            rec = await conn.fetchrow(
-                """
-                INSERT INTO shot (slot_id, x, y, score, is_x, arrow_id)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                RETURNING shot_id
-                """,
-                slot_id,
-                x,
-                y,
-                score,
-                is_x,
-                arrow_id,
+            arrow_id = random.choice(list(arrow_ids)) if arrow_ids else None
+            shots.append((random.choice(tuple(valid_slot_ids)), x, y, score, is_x, arrow_id))
+
+        recs = await conn.fetch(
+            """
+            INSERT INTO shot (slot_id, x, y, score, is_x, arrow_id)
+            SELECT * FROM unnest(
+                $1::uuid[], $2::double precision[], $3::double precision[],
+                $4::integer[], $5::boolean[], $6::uuid[]
             )
-            if rec is None or "shot_id" not in rec:
-                continue
-            shot_ids.append(rec["shot_id"])  # UUID
+            RETURNING shot_id
+            """,
+            *(list(column) for column in zip(*shots, strict=True)),
+        )
+        shot_ids.extend(rec["shot_id"] for rec in recs)
 
     return shot_ids
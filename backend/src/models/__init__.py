@@ -1,20 +1,29 @@
 from models.archer_model import ArcherModel
 from models.auth_model import AuthModel
 from models.live_stats_model import LiveStatsModel
-from models.parent_model import DBException, DBNotFound
+from models.open_participants import OpenParticipantsRefresher
+from models.open_session_cache import OpenSessionCache
+from models.parent_model import DBException, DBNotFound, Page
+from models.revoked_session_cache import RevokedSessionCache
 from models.session_model import SessionModel
 from models.shot_model import ShotModel
+from models.slot_cache import SlotCache
 from models.slot_model import SlotModel
 from models.target_model import TargetModel
 
 __all__ = [
     "ArcherModel",
     "AuthModel",
-    "DBNotFound",
     "DBException",
+    "DBNotFound",
     "LiveStatsModel",
+    "OpenParticipantsRefresher",
+    "OpenSessionCache",
+    "Page",
+    "RevokedSessionCache",
     "SessionModel",
-    "SlotModel",
     "ShotModel",
+    "SlotCache",
+    "SlotModel",
     "TargetModel",
 ]
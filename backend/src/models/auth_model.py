@@ -3,6 +3,7 @@ from datetime import datetime
 from asyncpg import Pool
 
 from models.parent_model import ParentModel
+from models.revoked_session_cache import AUTH_REVOKED_CHANNEL, RevokedSessionCache
 from schema import AuthCreate, AuthFilter, AuthRead, AuthSet
 
 
@@ -11,6 +12,9 @@ class AuthModel(ParentModel[AuthCreate, AuthSet, AuthRead, AuthFilter]):
         super().__init__("auth", db_pool, AuthRead)
 
     async def revoke_by_hash(self, token_hash: bytes, revoked_at: datetime) -> None:
+        """Revoke the session and tell every worker's `RevokedSessionCache` about it."""
         data = AuthSet(revoked_at=revoked_at)
         where = AuthFilter(session_token_hash=token_hash, revoked_at=None)
         await self.update(data, where=where)
+        await self.execute("SELECT pg_notify($1, $2);", (AUTH_REVOKED_CHANNEL, token_hash.hex()))
+        RevokedSessionCache.mark(token_hash)
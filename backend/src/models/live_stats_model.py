@@ -1,13 +1,28 @@
-import asyncio
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Final
 from uuid import UUID
 
-from asyncpg import Connection, Pool
-from asyncpg.pool import PoolConnectionProxy
+from asyncpg import Pool
 
+from core.notification_hub import NotificationHub
 from models.parent_model import DBNotFound, ParentModel
-from schema import LiveStat, ShotFilter, ShotScore, Stats
+from models.prepared_statements import PreparedStatementRegistry
+from models.sql_statement_builder import SQLStatementBuilder
+from schema import ShotFilter, ShotScore, Stats
+
+# Queued by the hub after a reconnect: shots may have been missed, re-read them.
+RESYNC: Final[str] = "*"
+LIVE_STAT_BY_SLOT_ID_STM: Final[str] = PreparedStatementRegistry.register(
+    "live_stat_by_slot_id",
+    SQLStatementBuilder("shot").build_select_view(
+        view_name="live_stat_by_slot_id",
+        columns=["*"],
+        conditions=["slot_id = $1"],
+        order_by="",
+        limit=1,
+    ),
+)
 
 
 class LiveStatsModel(ParentModel):
@@ -21,17 +36,9 @@ class LiveStatsModel(ParentModel):
         shots per slot. If no row exists for the provided slot (no shots yet),
         returns zeros.
         """
-        where = ShotFilter(slot_id=slot_id)
-        query, params = self.build_select_view_sql_stm(
-            view_name="live_stat_by_slot_id",
-            where=where,
-            columns=["*"],
-            limit=1,
-            is_desc=False,
-        )
         result: Stats
         try:
-            row = await self.fetchrow((query, params))
+            row = await self.fetchrow_named(LIVE_STAT_BY_SLOT_ID_STM, (slot_id,))
         except DBNotFound:
             row = None
 
@@ -74,75 +81,80 @@ class LiveStatsModel(ParentModel):
             for row in rows
         ]
 
-    async def listen_for_shots(self, slot_id: UUID) -> AsyncIterator[LiveStat]:
+    async def listen_for_shots(
+        self,
+        slot_id: UUID,
+        on_listen: Callable[[], Awaitable[None]] | None = None,
+    ) -> AsyncGenerator[list[ShotScore]]:
         """Yield shot notifications for a specific slot.
 
         Contract:
-        - Input: slot_id (UUID) identifies the slot to listen on.
-        - Output: async iterator yielding parsed payloads (JSON-decoded when possible,
-          otherwise raw strings) coming from the LISTEN/NOTIFY channel
-          f"{self.name}_insert_{slot_id}".
-        - Cleanup: listener is removed when the consumer stops iterating or on
-          cancellation; no global state is left behind.
+        - Input: slot_id (UUID) identifies the slot to listen on. `on_listen`, if
+          given, is awaited once the listener is registered, so state loaded there
+          cannot miss a notification (it may overlap with one instead).
+        - Output: async iterator yielding the shots carried by each payload of the
+          LISTEN/NOTIFY channel f"{self.name}_insert_{slot_id}". Payloads that pile
+          up while the consumer is busy are merged, so one batch may hold the
+          shots of several notifications. After the LISTEN connection reconnects,
+          every shot of the slot is re-read and yielded, as notifications sent
+          while it was down are lost; consumers skip the shots they already have.
+        - Errors: raises `SlowConsumerError` if the consumer falls too far behind.
+        - Cleanup: the subscription is dropped when the consumer stops iterating
+          or on cancellation. Channels are multiplexed by `NotificationHub` over a
+          single dedicated connection, so no pooled connection is held.
         """
 
         channel_name = f"{self.name}_insert_{slot_id}"
-        queue: asyncio.Queue[list[ShotScore]] = asyncio.Queue()
-
-        def _listener(
-            _: Connection | PoolConnectionProxy,
-            __: int,
-            ___: str,
-            payload: object,
-        ) -> None:
-            """
-            Push incoming payloads into an async queue for consumption.
-
-            The `payload` from asyncpg notifications is a string. We attempt to
-            JSON-decode it; if it looks like a dict containing `shot_id` and
-            `score`.
-            """
-
-            payload_str = payload if isinstance(payload, str) else str(payload)
-            try:
-                parsed = json.loads(payload_str)
-            except json.JSONDecodeError:
-                self.logger.warning("Invalid JSON payload received: %s", payload_str)
-                return
-
-            if isinstance(parsed, list):
-                shots = [
-                    ShotScore(
-                        shot_id=item["shot_id"],
-                        score=item["score"],
-                        is_x=item["is_x"],
-                        created_at=item["created_at"],
-                    )
-                    for item in parsed
-                ]
-            elif isinstance(parsed, dict):
-                shots = [
-                    ShotScore(
-                        shot_id=parsed["shot_id"],
-                        score=parsed["score"],
-                        is_x=parsed["is_x"],
-                        created_at=parsed["created_at"],
-                    )
-                ]
-
-            queue.put_nowait(shots)
-
-        async with self.db_pool.acquire() as conn:
-            await conn.add_listener(channel_name, _listener)
-            try:
-                while True:
-                    scores: list[ShotScore] = await queue.get()
-                    # Now we are in the main loop, we can safely await async calls
-                    current_stats = await self.get_live_stat(slot_id)
-                    stats = LiveStat(
-                        scores=scores,
-                        stats=current_stats,
-                    )
-                    yield stats
-            finally:
-                await conn.remove_listener(channel_name, _listener)
+        async with NotificationHub.subscribe(
+            channel_name, merge=self._merge_payloads, resync=RESYNC
+        ) as payloads:
+            if on_listen is not None:
+                await on_listen()
+            while True:
+                payload = await payloads.get()
+                if payload == RESYNC:
+                    shots = await self.get_all_scores(slot_id)
+                else:
+                    shots = self._parse_shots(payload)
+                if shots:
+                    yield shots
+
+    @staticmethod
+    def _merge_payloads(older: str, newer: str) -> str:
+        """Fold two pending `shot_insert` payloads into one JSON list of shots.
+
+        A pending `RESYNC` absorbs the other payload, since it re-reads every
+        shot. Otherwise, if either payload is not valid JSON, the newer one wins.
+        """
+        if RESYNC in (older, newer):
+            return RESYNC
+        try:
+            merged = [json.loads(older), json.loads(newer)]
+        except json.JSONDecodeError:
+            return newer
+        return json.dumps(
+            [shot for part in merged for shot in (part if isinstance(part, list) else [part])]
+        )
+
+    def _parse_shots(self, payload: str) -> list[ShotScore]:
+        """Decode a `shot_insert` payload (one shot object or a list of them).
+
+        Invalid JSON is logged and yields no shots.
+        """
+        try:
+            parsed = json.loads(payload)
+        except json.JSONDecodeError:
+            self.logger.warning("Invalid JSON payload received: %s", payload)
+            return []
+
+        items = parsed if isinstance(parsed, list) else [parsed]
+        return [
+            ShotScore(
+                shot_id=item["shot_id"],
+                score=item["score"],
+                is_x=item["is_x"],
+                created_at=item["created_at"],
+            )
+            for item in items
+            if isinstance(item, dict)
+        ]
@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import zlib
+from typing import Any, Final, Self
+
+from asyncpg import PostgresError
+
+from core.db_pool import DBPool
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.settings import settings
+from models.parent_model import ParentModel
+from models.prepared_statements import AnyConnection
+from schema import OpenParticipantsMode
+
+OPEN_PARTICIPANTS_VIEW: Final[str] = "open_participants"
+
+# Session-level advisory locks electing one refresh per generation across workers.
+REFRESH_QUEUE_LOCK: Final[int] = zlib.crc32(b"open_participants.refresh.queue")
+REFRESH_RUN_LOCK: Final[int] = zlib.crc32(b"open_participants.refresh.run")
+REFRESH_POLL_INTERVAL: Final[float] = 0.05
+# Keys below 2**32 are stored with classid 0 and objid = key.
+ADVISORY_LOCK_HELD_SQL: Final[str] = """
+    SELECT EXISTS (
+        SELECT 1 FROM pg_locks
+        WHERE locktype = 'advisory' AND granted
+            AND database = (SELECT oid FROM pg_database WHERE datname = current_database())
+            AND classid = 0 AND objid = $1::bigint::oid AND objsubid = 1
+    );
+"""
+
+# Same rows and columns as the materialized view, derived on read. Every lookup
+# goes through the slot's own indexes, so it costs the same however many archers
+# are in open sessions, and a join/leave is visible as soon as it commits.
+OPEN_PARTICIPANTS_LIVE: Final[str] = """(
+    SELECT
+        sl.slot_id,
+        sl.archer_id,
+        sl.session_id,
+        sl.target_id,
+        sl.face_type,
+        sl.slot_letter,
+        sl.is_shooting,
+        sl.created_at,
+        sl.bowstyle,
+        sl.draw_weight,
+        sl.club_id,
+        sl.shot_per_round,
+        sl.interval_seconds,
+        t.lane,
+        t.distance,
+        t.lane::text || sl.slot_letter::text AS slot
+    FROM slot AS sl
+    JOIN target AS t ON t.target_id = sl.target_id
+    JOIN session AS se ON se.session_id = sl.session_id
+    WHERE sl.is_shooting AND se.is_opened
+) AS open_participants"""
+
+
+def open_participants_relation() -> str:
+    """Return the FROM item to read open participants from in the configured mode."""
+    if settings.open_participants_mode is OpenParticipantsMode.LIVE:
+        return OPEN_PARTICIPANTS_LIVE
+    return OPEN_PARTICIPANTS_VIEW
+
+
+async def _rebuild_view(conn: AnyConnection, logger: logging.Logger) -> None:
+    """Refresh the materialized view, concurrently when the view allows it.
+
+    The concurrent attempt runs in its own (sub)transaction so a failure does
+    not abort a surrounding unit of work.
+    """
+    try:
+        async with conn.transaction():
+            await conn.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {OPEN_PARTICIPANTS_VIEW};")
+        return
+    except PostgresError as exc:
+        logger.debug(
+            "Concurrent refresh failed for open_participants, falling back. Reason: %s", exc
+        )
+    await conn.execute(f"REFRESH MATERIALIZED VIEW {OPEN_PARTICIPANTS_VIEW};")
+
+
+async def _wait_for_queued_refresh(conn: AnyConnection) -> None:
+    """Return once the refresh queued by another worker has completed.
+
+    The queued refresher releases the queue lock only after taking the run lock,
+    so once the queue lock is free, a shared run lock is granted when that
+    refresh ends. Polling pg_locks leaves the queue lock alone, so no other
+    worker mistakes this waiter for a queued refresher.
+    """
+    while await conn.fetchval(ADVISORY_LOCK_HELD_SQL, REFRESH_QUEUE_LOCK):
+        await asyncio.sleep(REFRESH_POLL_INTERVAL)
+    await conn.execute("SELECT pg_advisory_lock_shared($1);", REFRESH_RUN_LOCK)
+    await conn.execute("SELECT pg_advisory_unlock_shared($1);", REFRESH_RUN_LOCK)
+
+
+async def _refresh_view(conn: AnyConnection, logger: logging.Logger) -> bool:
+    """Refresh the view at most once per generation across all workers.
+
+    At most one refresh runs (run lock) and at most one waits to run next
+    (queue lock). A caller that finds the queue taken has committed before that
+    queued refresh starts, so it waits for it instead of rebuilding again.
+    Callers inside a transaction cannot defer: their rows are not visible to the
+    other worker yet. They wait for the running refresh and then rebuild.
+
+    Returns:
+        True if this call rebuilt the view, False if it waited on another worker's.
+    """
+    in_transaction = conn.is_in_transaction()
+    if not in_transaction and not await conn.fetchval(
+        "SELECT pg_try_advisory_lock($1);", REFRESH_QUEUE_LOCK
+    ):
+        Metrics.increment("open_participants.refresh_deferred")
+        await _wait_for_queued_refresh(conn)
+        return False
+    try:
+        await conn.execute("SELECT pg_advisory_lock($1);", REFRESH_RUN_LOCK)
+    finally:
+        if not in_transaction:
+            await conn.execute("SELECT pg_advisory_unlock($1);", REFRESH_QUEUE_LOCK)
+    try:
+        await _rebuild_view(conn, logger)
+    finally:
+        await conn.execute("SELECT pg_advisory_unlock($1);", REFRESH_RUN_LOCK)
+    return True
+
+
+class OpenParticipantsRefresher:
+    """Borg class coalescing open_participants refresh requests per process.
+
+    Every request bumps a version counter and wakes one background task. The task
+    waits ``open_participants_refresh_window`` seconds so a burst of joins and
+    leaves is folded into a single refresh, which then completes every version
+    requested before it started. Readers that must see their own write wait on
+    the version returned by `request`.
+    """
+
+    _requested: int = 0
+    _completed: int = 0
+    _wake: asyncio.Event | None = None
+    _progress: asyncio.Condition | None = None
+    _task: asyncio.Task[None] | None = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError(
+            "OpenParticipantsRefresher should not be instantiated. Use class methods only."
+        )
+
+    @classmethod
+    def _get_progress(cls) -> asyncio.Condition:
+        """Lazily create and return the completion condition (requires running loop)."""
+        if cls._progress is None:
+            cls._progress = asyncio.Condition()
+        return cls._progress
+
+    @classmethod
+    def request(cls) -> int:
+        """Ask for a refresh and return the version to pass to `wait_for`."""
+        cls._requested += 1
+        Metrics.increment("open_participants.refresh_requests")
+        if cls._wake is None:
+            cls._wake = asyncio.Event()
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._run(cls._wake))
+        cls._wake.set()
+        return cls._requested
+
+    @classmethod
+    async def wait_for(cls, version: int, timeout: float | None = None) -> bool:
+        """Wait until a refresh covering ``version`` has completed.
+
+        Args:
+            version: Value returned by `request`.
+            timeout: Seconds to wait; defaults to ``open_participants_wait_timeout``.
+
+        Returns:
+            False if the refresh did not complete in time.
+        """
+        progress = cls._get_progress()
+        try:
+            async with asyncio.timeout(timeout or settings.open_participants_wait_timeout):
+                async with progress:
+                    await progress.wait_for(lambda: cls._completed >= version)
+        except TimeoutError:
+            return False
+        return True
+
+    @classmethod
+    async def _run(cls, wake: asyncio.Event) -> None:
+        """Refresh once per burst of requests until cancelled."""
+        logger = get_logger()
+        while True:
+            await wake.wait()
+            await asyncio.sleep(settings.open_participants_refresh_window)
+            wake.clear()
+            version = cls._requested
+            try:
+                pool = await DBPool.open_db_pool()
+                async with pool.acquire() as conn:
+                    await _refresh_view(conn, logger)
+            except (OSError, PostgresError) as exc:
+                # Requests stay pending and are retried after the next window.
+                logger.warning("open_participants refresh failed, retrying: %s", exc)
+                Metrics.increment("open_participants.refresh_failures")
+                wake.set()
+                continue
+            Metrics.increment("open_participants.refreshes")
+            cls._completed = version
+            progress = cls._get_progress()
+            async with progress:
+                progress.notify_all()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Stop the background task on shutdown; pending requests are dropped."""
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        cls._wake = None
+        cls._progress = None
+        cls._completed = cls._requested
+
+
+async def refresh_open_participants(model: ParentModel) -> None:
+    """Bring open_participants up to date after a slot or session mutation.
+
+    A no-op in live mode. In debounced mode the refresh is handed to
+    `OpenParticipantsRefresher` once the model's transaction commits, so it sees
+    the mutation. In view mode it runs inline on the model's connection.
+    """
+    mode = settings.open_participants_mode
+    if mode is OpenParticipantsMode.LIVE:
+        return
+    if mode is OpenParticipantsMode.DEBOUNCED:
+        model.on_commit(OpenParticipantsRefresher.request)
+        return
+    async with model.acquire() as conn:
+        await _refresh_view(conn, model.logger)
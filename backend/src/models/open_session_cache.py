@@ -0,0 +1,144 @@
+import asyncio
+from typing import Any, ClassVar, Final, Self
+from uuid import UUID
+
+from asyncpg import PostgresError
+
+from core.coalescing_queue import SlowConsumerError
+from core.db_pool import DBPool
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.notification_hub import NotificationHub
+
+SESSION_UPDATE_CHANNEL: Final[str] = "session_update"
+OPENED: Final[str] = "open"
+CLOSED: Final[str] = "closed"
+# Queued by the hub after a reconnect: changes may have been missed, reload.
+RELOAD: Final[str] = "*"
+OPEN_SESSION_IDS_SQL: Final[str] = "SELECT session_id FROM session WHERE is_opened IS TRUE;"
+
+
+def session_update_payload(session_id: UUID, is_opened: bool) -> str:
+    """Return the ``session_update`` payload announcing a session state change."""
+    return f"{OPENED if is_opened else CLOSED}:{session_id}"
+
+
+def _merge_payloads(older: str, newer: str) -> str:
+    if RELOAD in (older, newer):
+        return RELOAD
+    return f"{older},{newer}"
+
+
+class OpenSessionCache:
+    """Borg per-worker set of the ids of open sessions.
+
+    Loaded once the ``session_update`` listener is subscribed, then kept current
+    by the notifications `SessionModel` sends when it opens or closes a session.
+    Only a hit is trusted: a miss may be a session opened by another worker whose
+    notification is still in flight, so callers fall back to the database. Once
+    the LISTEN connection drops, nothing is trusted until the set is reloaded
+    after the reconnect, as a ``closed`` notification may have been lost.
+    """
+
+    _ids: ClassVar[set[UUID]] = set()
+    _listener: asyncio.Task[None] | None = None
+    _listening: bool = False
+    # NotificationHub generation the set was loaded in.
+    _generation: int = -1
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("OpenSessionCache should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def start(cls) -> None:
+        """Subscribe and load the open sessions in the background, if not running yet."""
+        if cls._listener is None or cls._listener.done():
+            cls._listener = asyncio.create_task(cls._listen())
+
+    @classmethod
+    def contains(cls, session_id: UUID) -> bool:
+        """Return True if the session is known to be open; False means "ask the database"."""
+        if not cls.is_listening():
+            cls.start()
+            Metrics.increment("open_session_cache.misses")
+            return False
+        if session_id in cls._ids:
+            Metrics.increment("open_session_cache.hits")
+            return True
+        Metrics.increment("open_session_cache.misses")
+        return False
+
+    @classmethod
+    def mark(cls, session_id: UUID, is_opened: bool) -> None:
+        """Record a session state change made by this worker."""
+        if is_opened:
+            if cls._listening:
+                cls._ids.add(session_id)
+        else:
+            cls._ids.discard(session_id)
+
+    @classmethod
+    def handle_payload(cls, payload: str) -> None:
+        """Apply a ``session_update`` payload (``open:<id>``/``closed:<id>``, comma-joined)."""
+        for change in payload.split(","):
+            state, _, session_id = change.partition(":")
+            cls.mark(UUID(session_id), state == OPENED)
+
+    @classmethod
+    async def _load(cls) -> None:
+        """(Re)load the open sessions; the set is distrusted until this returns."""
+        cls._listening = False
+        generation = NotificationHub.generation()
+        pool = await DBPool.open_db_pool()
+        rows = await pool.fetch(OPEN_SESSION_IDS_SQL)
+        cls._ids = {row["session_id"] for row in rows}
+        cls._generation = generation
+        cls._listening = True
+
+    @classmethod
+    async def _listen(cls) -> None:
+        """Load the open sessions, then apply session_update notifications until cancelled."""
+        logger = get_logger()
+        try:
+            async with NotificationHub.subscribe(
+                SESSION_UPDATE_CHANNEL, _merge_payloads, resync=RELOAD
+            ) as queue:
+                # Subscribed before loading, so no change between the two is lost.
+                await cls._load()
+                while True:
+                    payload = await queue.get()
+                    if payload == RELOAD:
+                        await cls._load()
+                    else:
+                        cls.handle_payload(payload)
+        except (SlowConsumerError, OSError, PostgresError) as exc:
+            logger.warning("Open session cache listener stopped: %s", exc)
+        finally:
+            cls._listening = False
+            cls._ids = set()
+
+    @classmethod
+    def size(cls) -> int:
+        """Return how many open sessions are known."""
+        return len(cls._ids)
+
+    @classmethod
+    def is_listening(cls) -> bool:
+        """Return True while the set is loaded and kept current."""
+        return cls._listening and cls._generation == NotificationHub.generation()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Stop the listener and forget every session on shutdown."""
+        if cls._listener is not None:
+            cls._listener.cancel()
+            try:
+                await cls._listener
+            except asyncio.CancelledError:
+                pass
+            cls._listener = None
+        cls._listening = False
+        cls._ids = set()
+
+
+Metrics.register_gauge("open_session_cache.size", OpenSessionCache.size)
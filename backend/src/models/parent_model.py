@@ -1,23 +1,44 @@
 import logging
 from abc import ABC
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Protocol
+from typing import ClassVar, Final, Protocol
 from uuid import UUID
 
-from asyncpg import Pool, Record
+from asyncpg import Pool, PostgresError, Record
 from pydantic import BaseModel
 
 # NOTE: Import get_logger directly from its module to avoid importing the
 # core package __init__ (which re-exports SessionManager and other modules),
 # preventing cyclic imports with models -> parent_model -> core -> session_manager -> models
 from core.logger import get_logger
+from core.metrics import Metrics
+from core.settings import settings
+from models.prepared_statements import AnyConnection, PreparedStatementRegistry
 from models.sql_statement_builder import SQLStatementBuilder
+from models.statement_cache import StatementCache
+from schema.pagination_schema import PageCursor, PageRequest
 
 type SimpleValues = str | float | bool | int
-type Values = SimpleValues | UUID | datetime | bytes | None | Sequence[int] | Sequence[float]
+type ArrayValues = Sequence[SimpleValues | UUID | datetime | None]
+type Values = SimpleValues | UUID | datetime | bytes | None | ArrayValues
 type ValuesTuple = Sequence[Values]
 
+COLUMNS_STM: Final[str] = PreparedStatementRegistry.register(
+    "table_columns",
+    """
+        SELECT
+            a.attname AS column_name,
+            format_type(a.atttypid, a.atttypmod) AS column_type,
+            pg_get_expr(d.adbin, d.adrelid) AS column_default
+        FROM pg_attribute a
+        LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+        WHERE a.attrelid = $1::text::regclass AND a.attnum > 0 AND NOT a.attisdropped;
+    """,
+)
+
 
 class HasId(Protocol):
     def get_id(self) -> UUID: ...
@@ -31,6 +52,28 @@ class DBNotFound(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class Column:
+    """Catalog facts about a table column that bulk inserts need.
+
+    ``default`` is the column's DEFAULT expression, or None if it has none.
+    """
+
+    type: str
+    default: str | None
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """One page of a keyset-paginated listing.
+
+    ``next_cursor`` is None on the last page.
+    """
+
+    items: list[T]
+    next_cursor: PageCursor | None
+
+
 class ParentModel[
     CREATETYPE: BaseModel,
     SETTYPE: BaseModel,
@@ -46,6 +89,11 @@ class ParentModel[
 
     # Ensure subclasses have a known logger attribute for type checkers
     logger: logging.Logger
+    # Shared by every model instance in the process: models are created per request,
+    # but the SQL text for a given statement shape never changes.
+    statement_cache: ClassVar[StatementCache] = StatementCache(settings.sql_statement_cache_size)
+    # table -> column name -> Column, read from the catalog on first bulk insert.
+    table_columns: ClassVar[dict[str, dict[str, Column]]] = {}
 
     def __init__(self, table_name: str, db_pool: Pool, read_schema: type[READTYPE]) -> None:
         """Initialize model metadata and database connection pool.
@@ -59,28 +107,76 @@ class ParentModel[
         self.read_schema = read_schema
         self.pk = f"{self.name}_id"
         self.db_pool = db_pool
+        # Pinned by BaseManager.unit_of_work; None means acquire per query.
+        self.connection: AnyConnection | None = None
+        # Deferred by on_commit until the pinned transaction commits.
+        self.commit_callbacks: list[Callable[[], object]] = []
         self.logger = get_logger()
         # SQL builder scoped to this model's primary table. Use for safe SQL assembly.
         self.sql_builder = SQLStatementBuilder(self.name)
 
+    @staticmethod
+    def _equality_conditions(keys: Sequence[str], start: int = 1) -> list[str]:
+        """Return ``key = $n`` conditions numbered from ``start``."""
+        return [f"{key} = ${i}" for i, key in enumerate(keys, start=start)]
+
     def build_select_sql_stm(
         self,
         where: FILTERTYPE,
         columns: list[str],
         limit: int = 1,
         is_desc: bool = False,
+        *,
+        page: PageRequest | None = None,
     ) -> tuple[str, ValuesTuple]:
         """Assemble a parameterized SELECT using SQLStatementBuilder.
 
         Builds conditions from the provided filter model and returns the
-        SQL string along with a tuple of values in placeholder order.
+        SQL string along with a tuple of values in placeholder order. Filter
+        keys are sorted so every filter with the same set of keys maps to the
+        same cached statement.
+
+        With ``page`` the rows are ordered by ``(created_at, <pk>)``, start right
+        after ``page.cursor`` if set, and ``page.limit`` replaces ``limit``. Unlike
+        OFFSET, the cost of a page does not grow with how deep into the listing it is.
         """
         dump = where.model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-        keys = list(dump.keys())
-        values: ValuesTuple = tuple(dump.values()) if dump else ()
-
-        conditions = [f"{key} = ${i}" for i, key in enumerate(keys, start=1)]
-        sql_stm = self.sql_builder.build_select_with_conditions(columns, conditions, limit, is_desc)
+        keys = tuple(sorted(dump))
+        values: ValuesTuple = tuple(dump[key] for key in keys)
+
+        if page is not None:
+            after = page.cursor
+            after_placeholder = len(keys) + 1 if after is not None else None
+            if after is not None:
+                values = (*values, after.created_at, after.id)
+            cache_key = (
+                "select_keyset",
+                self.name,
+                keys,
+                tuple(columns),
+                page.limit,
+                is_desc,
+                after_placeholder,
+            )
+            sql_stm = self.statement_cache.get_or_build(
+                cache_key,
+                lambda: self.sql_builder.build_select_keyset(
+                    columns,
+                    self._equality_conditions(keys),
+                    after_placeholder,
+                    page.limit,
+                    is_desc,
+                ),
+            )
+            return (sql_stm, values)
+
+        cache_key = ("select", self.name, keys, tuple(columns), limit, is_desc)
+        sql_stm = self.statement_cache.get_or_build(
+            cache_key,
+            lambda: self.sql_builder.build_select_with_conditions(
+                columns, self._equality_conditions(keys), limit, is_desc
+            ),
+        )
         return (sql_stm, values)
 
     def build_update_sql_stm(self, data: SETTYPE, where: FILTERTYPE) -> tuple[str, ValuesTuple]:
@@ -90,18 +186,20 @@ class ParentModel[
         clause to match the bound values order.
         """
         set_dump = data.model_dump(by_alias=False, exclude_unset=True, exclude_none=True)
-        set_keys = list(set_dump.keys())
+        set_keys = tuple(set_dump)
         set_values = tuple(set_dump.values())
 
-        set_data = [(key, f"${i}") for i, key in enumerate(set_keys, start=1)]
-
         where_dump = where.model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-        where_keys = list(where_dump.keys())
-        where_values = tuple(where_dump.values())
+        where_keys = tuple(sorted(where_dump))
+        where_values = tuple(where_dump[key] for key in where_keys)
 
-        conditions = [f"{key} = ${i}" for i, key in enumerate(where_keys, start=len(set_keys) + 1)]
+        def build() -> str:
+            set_data = [(key, f"${i}") for i, key in enumerate(set_keys, start=1)]
+            conditions = self._equality_conditions(where_keys, start=len(set_keys) + 1)
+            return self.sql_builder.build_update(set_data, conditions)
 
-        sql_statement = self.sql_builder.build_update(set_data, conditions)
+        cache_key = ("update", self.name, set_keys, where_keys)
+        sql_statement = self.statement_cache.get_or_build(cache_key, build)
         values: ValuesTuple = (*set_values, *where_values)
         return (sql_statement, values)
 
@@ -121,7 +219,7 @@ class ParentModel[
 
         # Assume all items have the same keys (Pydantic ensures this for same model type)
         first_dump = data_list[0].model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-        keys = list(first_dump.keys())
+        keys = tuple(first_dump)
 
         all_values: list[Values] = []
         for item in data_list:
@@ -130,16 +228,59 @@ class ParentModel[
             for key in keys:
                 all_values.append(dump[key])
 
-        sql_stm = self.sql_builder.build_insert(keys, num_rows=len(data_list))
+        num_rows = len(data_list)
+        cache_key = ("insert", self.name, keys, num_rows)
+        sql_stm = self.statement_cache.get_or_build(
+            cache_key, lambda: self.sql_builder.build_insert(list(keys), num_rows=num_rows)
+        )
         return (sql_stm, all_values)
 
+    def build_bulk_insert_sql_stm(
+        self, data: Sequence[CREATETYPE], columns: dict[str, Column]
+    ) -> tuple[str, ValuesTuple]:
+        """Assemble an ``unnest`` bulk INSERT binding one array per column.
+
+        Columns are the fields set on any item; items lacking one of them get
+        the column's DEFAULT there, as a single insert would. The SQL only
+        depends on the column set, so batches of any size share one cached
+        statement and never approach the parameter limit.
+
+        Args:
+            data: Items to insert.
+            columns: Every column of the table.
+
+        Raises:
+            ValueError: If ``data`` is empty or sets a column the table lacks.
+        """
+        if not data:
+            raise ValueError("No data provided for insert")
+        dumps = [
+            item.model_dump(by_alias=True, exclude_unset=True, exclude_none=True) for item in data
+        ]
+        keys = tuple(dict.fromkeys(key for dump in dumps for key in dump))
+        unknown = [key for key in keys if key not in columns]
+        if unknown:
+            raise ValueError(f"{self.name} has no column(s) {', '.join(unknown)}")
+
+        values: ValuesTuple = tuple([dump.get(key) for dump in dumps] for key in keys)
+        cache_key = ("insert_unnest", self.name, keys)
+        sql_stm = self.statement_cache.get_or_build(
+            cache_key,
+            lambda: self.sql_builder.build_insert_unnest(
+                list(keys),
+                [columns[key].type for key in keys],
+                [columns[key].default for key in keys],
+            ),
+        )
+        return (sql_stm, values)
+
     def build_delete_sql_stm(self, where: FILTERTYPE) -> tuple[str, ValuesTuple]:
         """Assemble a parameterized DELETE using SQLStatementBuilder."""
         dump = where.model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
         keys = list(dump.keys())
         values = tuple(dump.values()) if dump else ()
 
-        conditions = [f"{key} = ${i}" for i, key in enumerate(keys, start=1)]
+        conditions = self._equality_conditions(keys)
         sql_stm = self.sql_builder.build_delete(conditions)
         return (sql_stm, values)
 
@@ -153,19 +294,20 @@ class ParentModel[
     ) -> tuple[str, ValuesTuple]:
         """Assemble a parameterized SELECT from a VIEW using SQLStatementBuilder."""
         dump = where.model_dump(by_alias=True, exclude_unset=True, exclude_none=True)
-        keys = list(dump.keys())
-        values = tuple(dump.values()) if dump else ()
-
-        conditions = [f"{key} = ${i}" for i, key in enumerate(keys, start=1)]
-        order_by = "ORDER BY created_at DESC" if is_desc else ""
-
-        sql_stm = self.sql_builder.build_select_view(
-            view_name=view_name,
-            columns=columns,
-            conditions=conditions,
-            order_by=order_by,
-            limit=limit,
-        )
+        keys = tuple(sorted(dump))
+        values = tuple(dump[key] for key in keys)
+
+        def build() -> str:
+            return self.sql_builder.build_select_view(
+                view_name=view_name,
+                columns=columns,
+                conditions=self._equality_conditions(keys),
+                order_by="ORDER BY created_at DESC" if is_desc else "",
+                limit=limit,
+            )
+
+        cache_key = ("select_view", view_name, keys, tuple(columns), limit, is_desc)
+        sql_stm = self.statement_cache.get_or_build(cache_key, build)
         return (sql_stm, values)
 
     def build_select_function_sql_stm(
@@ -175,6 +317,25 @@ class ParentModel[
         sql_stm = self.sql_builder.build_select_function(function_name, len(args))
         return (sql_stm, tuple(args))
 
+    def on_commit(self, callback: Callable[[], object]) -> None:
+        """Run ``callback`` once the pinned transaction commits, or now if there is none.
+
+        Callbacks of a unit of work that rolls back are discarded.
+        """
+        if self.connection is not None and self.connection.is_in_transaction():
+            self.commit_callbacks.append(callback)
+        else:
+            callback()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[AnyConnection]:
+        """Yield the pinned connection, or acquire one from the pool for this call."""
+        if self.connection is not None:
+            yield self.connection
+            return
+        async with self.db_pool.acquire() as conn:
+            yield conn
+
     async def fetch(self, query_data: tuple[str, ValuesTuple]) -> list[Record]:
         """Execute a SELECT query and return a list of records.
 
@@ -185,7 +346,7 @@ class ParentModel[
             List of asyncpg.Record objects. Returns empty list if no results.
         """
         sql_statement, values = query_data
-        async with self.db_pool.acquire() as conn:
+        async with self.acquire() as conn:
             self.logger.debug("Fetching: %s", sql_statement)
             rows = await conn.fetch(sql_statement, *values)
         return rows
@@ -203,13 +364,48 @@ class ParentModel[
             DBNotFound: If no record is found.
         """
         sql_statement, values = query_data
-        async with self.db_pool.acquire() as conn:
+        async with self.acquire() as conn:
             self.logger.debug("Fetching: %s", sql_statement)
             row = await conn.fetchrow(sql_statement, *values)
         if not row:
             raise DBNotFound(f"{self.name}: No record found")
         return row
 
+    async def fetch_named(self, name: str, values: ValuesTuple) -> list[Record]:
+        """Execute a statement from `PreparedStatementRegistry` and return all records.
+
+        Args:
+            name: Registered statement name.
+            values: Positional parameters to bind.
+
+        Returns:
+            List of asyncpg.Record objects. Returns empty list if no results.
+        """
+        async with self.acquire() as conn:
+            self.logger.debug("Fetching named statement: %s", name)
+            rows = await PreparedStatementRegistry.fetch(conn, name, tuple(values))
+        return rows
+
+    async def fetchrow_named(self, name: str, values: ValuesTuple) -> Record:
+        """Execute a statement from `PreparedStatementRegistry` and return a single record.
+
+        Args:
+            name: Registered statement name.
+            values: Positional parameters to bind.
+
+        Returns:
+            asyncpg.Record object.
+
+        Raises:
+            DBNotFound: If no record is found.
+        """
+        async with self.acquire() as conn:
+            self.logger.debug("Fetching named statement: %s", name)
+            row = await PreparedStatementRegistry.fetchrow(conn, name, tuple(values))
+        if not row:
+            raise DBNotFound(f"{self.name}: No record found")
+        return row
+
     async def execute(self, sql_statement: str, values: ValuesTuple | None = None) -> int:
         """Execute a single SQL statement.
 
@@ -223,7 +419,7 @@ class ParentModel[
         Raises:
             DBException: If execution fails for any reason.
         """
-        async with self.db_pool.acquire() as conn:
+        async with self.acquire() as conn:
             try:
                 self.logger.debug("Executing SQL: %s", sql_statement)
                 if values is None or not values:
@@ -311,9 +507,26 @@ class ParentModel[
         if affected == 0:
             raise DBNotFound(f"{self.name}: No record(s) found")
 
+    async def get_columns(self) -> dict[str, Column]:
+        """Return the type and default of every column of the table, cached per process."""
+        columns = self.table_columns.get(self.name)
+        if columns is None:
+            rows = await self.fetch_named(COLUMNS_STM, (self.name,))
+            columns = {
+                row["column_name"]: Column(row["column_type"], row["column_default"])
+                for row in rows
+            }
+            self.table_columns[self.name] = columns
+        return columns
+
     async def insert_many(self, data: list[CREATETYPE]) -> list[UUID]:
-        """Insert multiple records at once."""
-        sql_statement, values = self.build_insert_sql_stm(data)
+        """Insert multiple records in one statement and return their ids in order.
+
+        Raises:
+            ValueError: If ``data`` is empty.
+            DBNotFound: If no record was created.
+        """
+        sql_statement, values = self.build_bulk_insert_sql_stm(data, await self.get_columns())
 
         rows = await self.fetch((sql_statement, values))
 
@@ -322,6 +535,32 @@ class ParentModel[
 
         return [r[self.pk] for r in rows]
 
+    async def copy_many(self, columns: Sequence[str], records: Iterable[ValuesTuple]) -> int:
+        """Bulk insert rows with COPY, the fastest path when no ids are needed.
+
+        COPY does not apply column defaults to the columns it is given, so
+        ``records`` must carry a value for each of ``columns``.
+
+        Args:
+            columns: Columns every record holds a value for, in record order.
+            records: Rows to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            DBException: If the copy fails; no row is inserted then.
+        """
+        try:
+            async with self.acquire() as conn:
+                result = await conn.copy_records_to_table(
+                    self.name, records=records, columns=list(columns)
+                )
+        except PostgresError as e:
+            raise DBException(e) from e
+        # result is a string like 'COPY 42'
+        return int(result.split()[-1])
+
     async def get_all(self, where: FILTERTYPE, columns: list[str]) -> list[READTYPE]:
         """Fetch all records matching optional filters.
 
@@ -336,6 +575,31 @@ class ParentModel[
 
         return [self.read_schema(**row) for row in rows]
 
+    async def get_page(
+        self, where: FILTERTYPE, page: PageRequest, is_desc: bool = False
+    ) -> Page[READTYPE]:
+        """Fetch one page of records in ``(created_at, <pk>)`` order.
+
+        One extra row is fetched to know whether another page follows without
+        issuing a COUNT.
+
+        Args:
+            where: Filter model; unset fields are ignored.
+            page: Page size, and the cursor returned with the previous page.
+            is_desc: Walk from the newest record to the oldest.
+
+        Returns:
+            The page, with a cursor to the next one if more records exist.
+        """
+        probe = PageRequest(limit=page.limit + 1, cursor=page.cursor)
+        rows = await self.fetch(self.build_select_sql_stm(where, [], is_desc=is_desc, page=probe))
+
+        next_cursor = None
+        if len(rows) > page.limit:
+            rows = rows[: page.limit]
+            next_cursor = PageCursor(created_at=rows[-1]["created_at"], id=rows[-1][self.pk])
+        return Page([self.read_schema(**row) for row in rows], next_cursor)
+
     async def get_by_session_id(self, session_id: UUID) -> list[READTYPE]:
         """Fetch records scoped by a session id.
 
@@ -344,3 +608,10 @@ class ParentModel[
                 session scoping.
         """
         raise NotImplementedError("Error: get_by_session_id method not implemented in child class")
+
+
+for _stat in ("hits", "misses", "size"):
+    Metrics.register_gauge(
+        f"sql_statement_cache.{_stat}",
+        lambda stat=_stat: ParentModel.statement_cache.stats()[stat],
+    )
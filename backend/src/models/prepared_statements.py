@@ -0,0 +1,128 @@
+"""Named hot-path statements prepared eagerly on every pooled connection.
+
+asyncpg prepares statements lazily, so the first request served by a fresh
+connection (including the ones created after ``max_queries`` recycling) pays a
+parse/plan round-trip. Models register the statements they run on hot paths
+here; the pool ``init`` hook prepares all of them as soon as a connection is
+opened, and models execute them by name.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar, Self
+
+from asyncpg import Connection, Record
+from asyncpg.exceptions import (
+    InvalidCachedStatementError,
+    OutdatedSchemaCacheError,
+    PostgresError,
+)
+from asyncpg.pool import PoolConnectionProxy
+from asyncpg.prepared_stmt import PreparedStatement
+
+from core.logger import get_logger
+
+type AnyConnection = Connection | PoolConnectionProxy
+
+
+class PreparedStatementConnection(Connection):
+    """asyncpg connection that keeps the registry's prepared statements by name."""
+
+    __slots__ = ("named_statements",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.named_statements: dict[str, PreparedStatement] = {}
+
+
+class PreparedStatementRegistry:
+    """Borg registry of named SQL statements shared by all pooled connections."""
+
+    _statements: ClassVar[dict[str, str]] = {}
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("PreparedStatementRegistry should not be instantiated.")
+
+    @classmethod
+    def register(cls, name: str, sql: str) -> str:
+        """Register ``sql`` under ``name`` and return the name.
+
+        Raises:
+            ValueError: If ``name`` is already registered with a different SQL text.
+        """
+        existing = cls._statements.get(name)
+        if existing is not None and existing != sql:
+            raise ValueError(f"Prepared statement '{name}' is already registered")
+        cls._statements[name] = sql
+        return name
+
+    @classmethod
+    def names(cls) -> list[str]:
+        """Return the names of every registered statement."""
+        return list(cls._statements)
+
+    @classmethod
+    async def prepare_connection(cls, conn: Connection) -> None:
+        """Pool ``init`` hook: prepare every registered statement on ``conn``.
+
+        A statement that fails to prepare is logged and left to be prepared
+        lazily, so a missing relation never prevents the pool from starting.
+        """
+        for name in cls._statements:
+            try:
+                await cls._prepare(conn, name)
+            except PostgresError as exc:
+                get_logger().warning("Could not prepare statement '%s': %s", name, exc)
+
+    @classmethod
+    async def _prepare(cls, conn: AnyConnection, name: str) -> PreparedStatement:
+        statement = await conn.prepare(cls._statements[name])
+        named_statements: dict[str, PreparedStatement] | None = getattr(
+            conn, "named_statements", None
+        )
+        if named_statements is not None:
+            named_statements[name] = statement
+        return statement
+
+    @classmethod
+    async def get(cls, conn: AnyConnection, name: str) -> PreparedStatement:
+        """Return the statement registered as ``name`` prepared on ``conn``.
+
+        Raises:
+            KeyError: If no statement is registered under ``name``.
+        """
+        if name not in cls._statements:
+            raise KeyError(f"Unknown prepared statement '{name}'")
+        named_statements: dict[str, PreparedStatement] | None = getattr(
+            conn, "named_statements", None
+        )
+        statement = named_statements.get(name) if named_statements is not None else None
+        if statement is None:
+            statement = await cls._prepare(conn, name)
+        return statement
+
+    @classmethod
+    async def _run[T](
+        cls,
+        conn: AnyConnection,
+        name: str,
+        call: Callable[[PreparedStatement], Awaitable[T]],
+    ) -> T:
+        """Run ``call`` on the named statement, re-preparing it once if it went stale."""
+        statement = await cls.get(conn, name)
+        try:
+            return await call(statement)
+        except InvalidCachedStatementError, OutdatedSchemaCacheError:
+            statement = await cls._prepare(conn, name)
+            return await call(statement)
+
+    @classmethod
+    async def fetch(cls, conn: AnyConnection, name: str, values: tuple[Any, ...]) -> list[Record]:
+        """Execute the named statement and return all rows."""
+        return await cls._run(conn, name, lambda statement: statement.fetch(*values))
+
+    @classmethod
+    async def fetchrow(
+        cls, conn: AnyConnection, name: str, values: tuple[Any, ...]
+    ) -> Record | None:
+        """Execute the named statement and return the first row, if any."""
+        return await cls._run(conn, name, lambda statement: statement.fetchrow(*values))
@@ -0,0 +1,163 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar, Final, Self
+
+from asyncpg import PostgresError
+
+from core.coalescing_queue import SlowConsumerError
+from core.db_pool import DBPool
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.notification_hub import NotificationHub
+from core.settings import settings
+
+AUTH_REVOKED_CHANNEL: Final[str] = "auth_revoked"
+# Queued by the hub after a reconnect: revocations may have been missed, reload.
+RELOAD: Final[str] = "*"
+# How often hashes of expired sessions are dropped from the set.
+PRUNE_INTERVAL: Final[timedelta] = timedelta(minutes=1)
+# Sessions past expires_at are rejected by the JWT exp check already.
+REVOKED_SESSION_HASHES_SQL: Final[str] = """
+    SELECT session_token_hash, expires_at FROM auth
+    WHERE revoked_at IS NOT NULL AND expires_at > now();
+"""
+SESSION_REVOKED_SQL: Final[str] = """
+    SELECT EXISTS (
+        SELECT 1 FROM auth WHERE session_token_hash = $1 AND revoked_at IS NOT NULL
+    );
+"""
+
+
+def _merge_payloads(older: str, newer: str) -> str:
+    if RELOAD in (older, newer):
+        return RELOAD
+    return f"{older},{newer}"
+
+
+class RevokedSessionCache:
+    """Borg per-worker set of the token hashes of revoked auth sessions.
+
+    Loaded once the ``auth_revoked`` listener is subscribed, then kept current by
+    the notification `AuthModel.revoke_by_hash` sends on logout, so a request is
+    checked against it without a round trip. Until the set is loaded, and from a
+    drop of the LISTEN connection until it is reloaded after the reconnect, the
+    database is asked instead. A hash is forgotten once its session expires, as
+    the JWT exp check rejects the session from then on.
+    """
+
+    # Token hash -> expiry of its session.
+    _hashes: ClassVar[dict[bytes, datetime]] = {}
+    _listener: asyncio.Task[None] | None = None
+    _listening: bool = False
+    # NotificationHub generation the set was loaded in.
+    _generation: int = -1
+    _next_prune: datetime = datetime.min.replace(tzinfo=UTC)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("RevokedSessionCache should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def start(cls) -> None:
+        """Subscribe and load the revoked sessions in the background, if not running yet."""
+        if cls._listener is None or cls._listener.done():
+            cls._listener = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def is_revoked(cls, token_hash: bytes) -> bool:
+        """Return True if the auth session with ``token_hash`` was revoked."""
+        if cls.is_listening():
+            Metrics.increment("revoked_session_cache.hits")
+            return token_hash in cls._hashes
+        cls.start()
+        Metrics.increment("revoked_session_cache.misses")
+        pool = await DBPool.open_db_pool()
+        return bool(await pool.fetchval(SESSION_REVOKED_SQL, token_hash))
+
+    @classmethod
+    def mark(cls, token_hash: bytes) -> None:
+        """Record a revoked session.
+
+        Its expiry is not known here, so it is kept for as long as a session
+        issued now could live.
+        """
+        now = datetime.now(UTC)
+        cls._prune(now)
+        cls._hashes[token_hash] = now + timedelta(minutes=settings.arch_stats_jwt_ttl_minutes)
+
+    @classmethod
+    def _prune(cls, now: datetime) -> None:
+        """Drop the hashes of expired sessions, at most once per `PRUNE_INTERVAL`."""
+        if now < cls._next_prune:
+            return
+        cls._next_prune = now + PRUNE_INTERVAL
+        expired = [
+            token_hash for token_hash, expires_at in cls._hashes.items() if expires_at <= now
+        ]
+        for token_hash in expired:
+            del cls._hashes[token_hash]
+
+    @classmethod
+    def handle_payload(cls, payload: str) -> None:
+        """Apply an ``auth_revoked`` payload (comma-joined hex token hashes)."""
+        for token_hex in payload.split(","):
+            cls.mark(bytes.fromhex(token_hex))
+
+    @classmethod
+    async def _load(cls) -> None:
+        """(Re)load the revoked sessions; the set is distrusted until this returns."""
+        cls._listening = False
+        generation = NotificationHub.generation()
+        pool = await DBPool.open_db_pool()
+        rows = await pool.fetch(REVOKED_SESSION_HASHES_SQL)
+        cls._hashes = {bytes(row["session_token_hash"]): row["expires_at"] for row in rows}
+        cls._next_prune = datetime.now(UTC) + PRUNE_INTERVAL
+        cls._generation = generation
+        cls._listening = True
+
+    @classmethod
+    async def _listen(cls) -> None:
+        """Load the revoked sessions, then apply auth_revoked notifications until cancelled."""
+        logger = get_logger()
+        try:
+            async with NotificationHub.subscribe(
+                AUTH_REVOKED_CHANNEL, _merge_payloads, resync=RELOAD
+            ) as queue:
+                # Subscribed before loading, so no revocation between the two is lost.
+                await cls._load()
+                while True:
+                    payload = await queue.get()
+                    if payload == RELOAD:
+                        await cls._load()
+                    else:
+                        cls.handle_payload(payload)
+        except (SlowConsumerError, OSError, PostgresError) as exc:
+            logger.warning("Revoked session cache listener stopped: %s", exc)
+        finally:
+            cls._listening = False
+            cls._hashes = {}
+
+    @classmethod
+    def size(cls) -> int:
+        """Return how many revoked sessions are known."""
+        return len(cls._hashes)
+
+    @classmethod
+    def is_listening(cls) -> bool:
+        """Return True while the set is loaded and kept current."""
+        return cls._listening and cls._generation == NotificationHub.generation()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Stop the listener and forget every revocation on shutdown."""
+        if cls._listener is not None:
+            cls._listener.cancel()
+            try:
+                await cls._listener
+            except asyncio.CancelledError:
+                pass
+            cls._listener = None
+        cls._listening = False
+        cls._hashes = {}
+
+
+Metrics.register_gauge("revoked_session_cache.size", RevokedSessionCache.size)
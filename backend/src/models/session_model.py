@@ -1,10 +1,20 @@
 from datetime import UTC, datetime
+from typing import Final
 from uuid import UUID
 
 from asyncpg import Pool
 
-from models.parent_model import DBException, DBNotFound, ParentModel
+from models.open_participants import open_participants_relation, refresh_open_participants
+from models.open_session_cache import (
+    SESSION_UPDATE_CHANNEL,
+    OpenSessionCache,
+    session_update_payload,
+)
+from models.parent_model import DBException, DBNotFound, Page, ParentModel
+from models.prepared_statements import PreparedStatementRegistry
+from models.sql_statement_builder import SQLStatementBuilder
 from schema import (
+    PageRequest,
     SessionCreate,
     SessionFilter,
     SessionId,
@@ -13,6 +23,13 @@ from schema import (
 )
 from schema.archer_schema import ArcherFilter
 
+OPEN_SESSION_BY_ID_STM: Final[str] = PreparedStatementRegistry.register(
+    "open_session_by_id",
+    SQLStatementBuilder("session").build_select_with_conditions(
+        ["session_id"], ["session_id = $1", "is_opened IS TRUE"], 1, False
+    ),
+)
+
 
 class SessionModelError(Exception):
     """Base exception for Session model errors."""
@@ -53,10 +70,12 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
         where = SessionFilter(is_opened=True)
         return await self.get_all(where, [])
 
-    async def get_all_closed_sessions_owned_by(self, archer_id: UUID) -> list[SessionRead]:
-        """Return all closed sessions owned by the given archer."""
+    async def get_all_closed_sessions_owned_by(
+        self, archer_id: UUID, page: PageRequest
+    ) -> Page[SessionRead]:
+        """Return one page of the closed sessions owned by the given archer."""
         where = SessionFilter(owner_archer_id=archer_id, is_opened=False)
-        return await self.get_all(where, [])
+        return await self.get_page(where, page)
 
     async def is_archer_participating(self, archer_id: UUID) -> UUID | None:
         """
@@ -65,7 +84,7 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
         """
         where = ArcherFilter(archer_id=archer_id)
         sql, params = self.build_select_view_sql_stm(
-            view_name="open_participants",
+            view_name=open_participants_relation(),
             where=where,
             columns=["session_id"],
             limit=1,
@@ -79,11 +98,30 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
             session_id = None
         return session_id
 
+    async def announce_session_state(self, session_id: UUID, is_opened: bool) -> None:
+        """Tell every worker's `OpenSessionCache` that a session was opened or closed.
+
+        The notification is delivered when the surrounding transaction commits. A
+        close is applied to this worker's cache right away, an open only once
+        committed, so the cache never reports a session open too early.
+        """
+        payload = session_update_payload(session_id, is_opened)
+        await self.execute("SELECT pg_notify($1, $2);", (SESSION_UPDATE_CHANNEL, payload))
+        if is_opened:
+            self.on_commit(lambda: OpenSessionCache.mark(session_id, True))
+        else:
+            OpenSessionCache.mark(session_id, False)
+
     async def does_open_session_exist(self, session: UUID) -> bool:
-        """Return True if a session with the given ID and is_opened status exists."""
-        where = SessionFilter(session_id=session, is_opened=True)
+        """Return True if a session with the given ID and is_opened status exists.
+
+        Answered from `OpenSessionCache` when the session is known to be open,
+        from the database otherwise.
+        """
+        if OpenSessionCache.contains(session):
+            return True
         try:
-            _ = await self.get_one(where)
+            _ = await self.fetchrow_named(OPEN_SESSION_BY_ID_STM, (session,))
             result = True
         except DBNotFound:
             result = False
@@ -106,7 +144,9 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
                 f"ERROR: archer '{session_data.owner_archer_id}' is already participating "
                 "in an open session"
             )
-        return await self.insert_one(session_data)
+        session_id = await self.insert_one(session_data)
+        await self.announce_session_state(session_id, True)
+        return session_id
 
     async def close_session(self, session: SessionId, archer_id: UUID) -> None:
         """Close session after ensuring no other participants are actively shooting."""
@@ -132,6 +172,7 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
 
         data = SessionSet(is_opened=False, closed_at=datetime.now(UTC))
         await self.update(data, where)
+        await self.announce_session_state(session.session_id, False)
         await self.refresh_open_participants()
 
     async def has_active_participants(self, session_id: UUID) -> bool:
@@ -141,7 +182,7 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
         """
         where = SessionFilter(session_id=session_id)
         sql, params = self.build_select_view_sql_stm(
-            view_name="open_participants",
+            view_name=open_participants_relation(),
             where=where,
             columns=["1"],
             limit=1,
@@ -167,15 +208,9 @@ class SessionModel(ParentModel[SessionCreate, SessionSet, SessionRead, SessionFi
             raise ValueError("Archer already has an opened session")
         set_sql = SessionSet(is_opened=True, closed_at=None)
         await self.update(set_sql, where)
+        await self.announce_session_state(session.session_id, True)
         await self.refresh_open_participants()
 
     async def refresh_open_participants(self) -> None:
-        """Refresh the materialized view that backs open participants lists."""
-        try:
-            await self.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY open_participants;")
-        except Exception as exc:  # DBException or asyncpg errors
-            self.logger.debug(
-                "Concurrent refresh failed for open_participants, falling back. Reason: %s",
-                exc,
-            )
-            await self.execute("REFRESH MATERIALIZED VIEW open_participants;")
+        """Bring open_participants up to date (see `models.open_participants`)."""
+        await refresh_open_participants(self)
@@ -1,11 +1,170 @@
-from datetime import datetime
+from collections.abc import AsyncGenerator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Final
 from uuid import UUID
 
 from asyncpg import Pool
 
-from models.parent_model import DBNotFound, ParentModel
+from core.settings import settings
+from models.parent_model import DBException, DBNotFound, ParentModel
+from models.prepared_statements import PreparedStatementRegistry
+from models.sql_statement_builder import SQLStatementBuilder
 from schema import ShotCreate, ShotFilter, ShotRead, ShotSet
 
+LATEST_SHOT_TIME_STM: Final[str] = PreparedStatementRegistry.register(
+    "latest_shot_time",
+    SQLStatementBuilder("shot").build_select_with_conditions(
+        ["created_at"], ["slot_id = $1"], 1, True
+    ),
+)
+# Shots of one archer across every slot they were assigned, in the same order as
+# the paginated listing. Extra conditions narrow it to one slot or one session.
+SHOT_EXPORT_TEMPLATE: Final[str] = """
+    SELECT sh.*
+    FROM shot AS sh
+    JOIN slot AS sl ON sl.slot_id = sh.slot_id
+    WHERE sl.archer_id = $1 {conditions}
+    ORDER BY sh.created_at, sh.shot_id;
+"""
+# Every column is bound so a single statement serves all shot shapes; a NULL
+# created_at falls back to the server clock like the column default.
+SHOT_INSERT_STM: Final[str] = PreparedStatementRegistry.register(
+    "shot_insert",
+    """
+        INSERT INTO shot (slot_id, x, y, score, is_x, arrow_id, created_at)
+        VALUES ($1, $2, $3, $4, $5, $6, COALESCE($7, now()))
+        RETURNING shot_id;
+    """,
+)
+# Shots whose id is chosen by the caller: journaled shots and shots submitted
+# with an idempotency key. An id already stored is skipped, so replaying a
+# journal or retrying a submission inserts (and notifies) each shot once.
+SHOT_INSERT_WITH_IDS_STM: Final[str] = PreparedStatementRegistry.register(
+    "shot_insert_with_ids",
+    """
+        INSERT INTO shot (shot_id, slot_id, x, y, score, is_x, arrow_id, created_at)
+        SELECT
+            u.shot_id,
+            u.slot_id,
+            u.x,
+            u.y,
+            u.score,
+            u.is_x,
+            u.arrow_id,
+            COALESCE(u.created_at, now())
+        FROM unnest(
+            $1::uuid[], $2::uuid[], $3::float8[], $4::float8[],
+            $5::int4[], $6::bool[], $7::uuid[], $8::timestamptz[]
+        ) AS u(shot_id, slot_id, x, y, score, is_x, arrow_id, created_at)
+        ON CONFLICT (shot_id) DO NOTHING
+        RETURNING shot_id;
+    """,
+)
+# Ownership check, open-session check, timestamp windowing and insert in one
+# round-trip. Rows are only inserted when the slot belongs to $2 and its session
+# is open; the context row is always returned so the caller can tell why not.
+# When $9 is true, created_at is spread over a window ending at now() exactly
+# like ShotManager._assign_dynamic_timestamps; otherwise it is taken from $8.
+SHOT_SUBMIT_STM: Final[str] = PreparedStatementRegistry.register(
+    "shot_submit",
+    """
+        WITH slot_ctx AS (
+            SELECT sl.archer_id, se.is_opened, sl.interval_seconds
+            FROM slot AS sl
+            JOIN session AS se ON se.session_id = sl.session_id
+            WHERE sl.slot_id = $1
+        ),
+        latest AS (
+            SELECT max(created_at) AS latest_shot_time
+            FROM shot
+            WHERE slot_id = $1
+        ),
+        window_size AS (
+            SELECT
+                cardinality($3::float8[]) AS num_shots,
+                make_interval(
+                    secs => COALESCE(NULLIF(c.interval_seconds, 0), 20)
+                        * cardinality($3::float8[])
+                ) AS default_duration
+            FROM slot_ctx AS c
+        ),
+        bounds AS (
+            SELECT
+                s.num_shots,
+                CASE
+                    WHEN l.latest_shot_time > now() - s.default_duration THEN
+                        CASE
+                            WHEN l.latest_shot_time + interval '1 second' >= now()
+                                THEN now() - make_interval(secs => s.num_shots)
+                            ELSE l.latest_shot_time + interval '1 second'
+                        END
+                    ELSE now() - s.default_duration
+                END AS window_start
+            FROM window_size AS s
+            CROSS JOIN latest AS l
+        ),
+        submitted AS (
+            -- Ids are fixed here, once per row, so the inserted ones can be listed in input order.
+            SELECT COALESCE(u.given_id, uuid_generate_v4()) AS shot_id, u.*
+            FROM unnest(
+                $3::float8[], $4::float8[], $5::int4[], $6::bool[], $7::uuid[], $8::timestamptz[],
+                $10::uuid[]
+            ) WITH ORDINALITY AS u(x, y, score, is_x, arrow_id, created_at, given_id, ord)
+        ),
+        inserted AS (
+            INSERT INTO shot (shot_id, slot_id, x, y, score, is_x, arrow_id, created_at)
+            SELECT
+                s.shot_id,
+                $1,
+                s.x,
+                s.y,
+                s.score,
+                s.is_x,
+                s.arrow_id,
+                CASE
+                    WHEN $9::boolean THEN
+                        b.window_start
+                        + (now() - b.window_start) / GREATEST(b.num_shots - 1, 1) * (s.ord - 1)
+                    ELSE COALESCE(s.created_at, now())
+                END
+            FROM submitted AS s
+            CROSS JOIN bounds AS b
+            WHERE EXISTS (SELECT 1 FROM slot_ctx WHERE archer_id = $2 AND is_opened)
+            ON CONFLICT (shot_id) DO NOTHING
+            RETURNING shot_id
+        )
+        SELECT
+            c.archer_id,
+            c.is_opened,
+            ARRAY(
+                SELECT s.shot_id FROM submitted AS s JOIN inserted AS i USING (shot_id) ORDER BY s.ord
+            ) AS shot_ids
+        FROM (VALUES (1)) AS one(x)
+        LEFT JOIN slot_ctx AS c ON TRUE;
+    """,
+)
+
+
+SHOT_COPY_COLUMNS: Final[tuple[str, ...]] = (
+    "slot_id",
+    "x",
+    "y",
+    "score",
+    "is_x",
+    "arrow_id",
+    "created_at",
+)
+
+
+@dataclass(frozen=True)
+class ShotSubmission:
+    """Outcome of `ShotModel.submit`: the slot context and the inserted shot ids, in input order."""
+
+    archer_id: UUID
+    is_session_opened: bool
+    shot_ids: list[UUID]
+
 
 class ShotModel(ParentModel[ShotCreate, ShotSet, ShotRead, ShotFilter]):
     """Model for shot-related DB access and notifications."""
@@ -13,6 +172,158 @@ class ShotModel(ParentModel[ShotCreate, ShotSet, ShotRead, ShotFilter]):
     def __init__(self, db_pool: Pool) -> None:
         super().__init__("shot", db_pool, ShotRead)
 
+    async def insert_one(self, data: ShotCreate) -> UUID:
+        """Insert a single shot through the prepared `shot_insert` statement.
+
+        Raises:
+            DBException: If insertion fails or no id is returned.
+        """
+        values = (
+            data.slot_id,
+            data.x,
+            data.y,
+            data.score,
+            data.is_x,
+            data.arrow_id,
+            data.created_at,
+        )
+        try:
+            row = await self.fetchrow_named(SHOT_INSERT_STM, values)
+        except Exception as e:
+            raise DBException(e) from e
+        shot_id: UUID = row[self.pk]
+        return shot_id
+
+    async def insert_with_ids(self, entries: Sequence[tuple[UUID, ShotCreate]]) -> int:
+        """Insert ``(shot_id, shot)`` pairs in order, skipping ids already stored.
+
+        No ownership or session check is made; callers vouch for the slots. A
+        missing created_at falls back to the server clock.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            DBException: If the insert fails; no row is inserted then.
+        """
+        values = (
+            [shot_id for shot_id, _ in entries],
+            [shot.slot_id for _, shot in entries],
+            [shot.x for _, shot in entries],
+            [shot.y for _, shot in entries],
+            [shot.score for _, shot in entries],
+            [shot.is_x for _, shot in entries],
+            [shot.arrow_id for _, shot in entries],
+            [shot.created_at for _, shot in entries],
+        )
+        try:
+            rows = await self.fetch_named(SHOT_INSERT_WITH_IDS_STM, values)
+        except Exception as e:
+            raise DBException(e) from e
+        return len(rows)
+
+    async def copy_shots(self, shots: Sequence[ShotCreate]) -> int:
+        """Bulk insert shots with COPY, skipping the per-row statement overhead.
+
+        No ownership or session check is made; callers vouch for the slots. A
+        missing created_at is stamped with the current time, as COPY does not
+        apply column defaults to the columns it is given.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            DBException: If the copy fails; no row is inserted then.
+        """
+        now = datetime.now(UTC)
+        records = [
+            (
+                shot.slot_id,
+                shot.x,
+                shot.y,
+                shot.score,
+                shot.is_x,
+                shot.arrow_id,
+                shot.created_at or now,
+            )
+            for shot in shots
+        ]
+        return await self.copy_many(SHOT_COPY_COLUMNS, records)
+
+    async def submit(
+        self,
+        shots: list[ShotCreate],
+        archer_id: UUID,
+        assign_timestamps: bool,
+        shot_ids: list[UUID] | None = None,
+    ) -> ShotSubmission:
+        """Check and insert shots of a single slot in one round-trip.
+
+        Nothing is inserted unless the slot belongs to `archer_id` and its session
+        is open; `shot_ids` is empty in that case. A shot whose given id is
+        already stored is skipped, and its id is left out of `shot_ids`.
+
+        Args:
+            shots: Shots to insert; all must share the same slot_id.
+            archer_id: Archer that must own the slot.
+            assign_timestamps: Spread created_at over the dynamic shooting window
+                instead of using each shot's own created_at.
+            shot_ids: Ids to insert the shots with, in order; generated if omitted.
+
+        Raises:
+            DBNotFound: If the slot does not exist.
+        """
+        values = (
+            shots[0].slot_id,
+            archer_id,
+            [shot.x for shot in shots],
+            [shot.y for shot in shots],
+            [shot.score for shot in shots],
+            [shot.is_x for shot in shots],
+            [shot.arrow_id for shot in shots],
+            [shot.created_at for shot in shots],
+            assign_timestamps,
+            shot_ids,
+        )
+        row = await self.fetchrow_named(SHOT_SUBMIT_STM, values)
+        if row["archer_id"] is None:
+            raise DBNotFound("slot: No record found")
+        return ShotSubmission(
+            archer_id=row["archer_id"],
+            is_session_opened=bool(row["is_opened"]),
+            shot_ids=list(row["shot_ids"]),
+        )
+
+    async def stream_for_archer(
+        self,
+        archer_id: UUID,
+        slot_id: UUID | None = None,
+        session_id: UUID | None = None,
+    ) -> AsyncGenerator[ShotRead]:
+        """Yield an archer's shots through a server-side cursor.
+
+        Rows are fetched ``settings.shot_export_batch_size`` at a time inside a
+        transaction, so memory stays flat however many shots the archer has.
+        The connection is held until the generator is exhausted or closed.
+
+        Args:
+            archer_id: Archer whose slots the shots belong to.
+            slot_id: Only export this slot.
+            session_id: Only export slots of this session.
+        """
+        values: list[UUID] = [archer_id]
+        conditions = ""
+        for column, value in (("sl.slot_id", slot_id), ("sl.session_id", session_id)):
+            if value is not None:
+                values.append(value)
+                conditions += f" AND {column} = ${len(values)}"
+        sql = SHOT_EXPORT_TEMPLATE.format(conditions=conditions)
+
+        async with self.acquire() as conn, conn.transaction():
+            cursor = conn.cursor(sql, *values, prefetch=settings.shot_export_batch_size)
+            async for row in cursor:
+                yield self.read_schema(**row)
+
     async def count_by_slot(self, slot_id: UUID) -> int:
         """Retrieve all shots (count only) for a given slot."""
         sql = f"SELECT COUNT(*) FROM {self.name} WHERE slot_id = $1"
@@ -21,14 +332,8 @@ class ShotModel(ParentModel[ShotCreate, ShotSet, ShotRead, ShotFilter]):
 
     async def get_latest_shot_time(self, slot_id: UUID) -> datetime | None:
         """Retrieve the latest shot's created_at timestamp for a given slot."""
-        sql = self.sql_builder.build_select_with_conditions(
-            columns=["created_at"],
-            conditions=["slot_id = $1"],
-            limit=1,
-            is_desc=True,
-        )
         try:
-            row = await self.fetchrow((sql, (slot_id,)))
+            row = await self.fetchrow_named(LATEST_SHOT_TIME_STM, (slot_id,))
             return row["created_at"]
         except DBNotFound:
             return None
@@ -0,0 +1,145 @@
+import asyncio
+from collections.abc import Iterable
+from typing import Any, ClassVar, Final, Self
+from uuid import UUID
+
+from asyncpg import PostgresError
+
+from core.coalescing_queue import SlowConsumerError
+from core.logger import get_logger
+from core.metrics import Metrics
+from core.notification_hub import NotificationHub
+from core.settings import settings
+from core.ttl_cache import TTLCache
+from schema import SlotRead
+
+SLOT_UPDATE_CHANNEL: Final[str] = "slot_update"
+# Payload meaning "drop every cached slot", sent when the ids would not fit and
+# queued by the hub after a reconnect, as invalidations may have been lost.
+INVALIDATE_ALL: Final[str] = "*"
+# NOTIFY payloads are capped at 8000 bytes; each id takes 37 with its separator.
+SLOT_UPDATE_MAX_IDS: Final[int] = 200
+
+
+def _merge_payloads(older: str, newer: str) -> str:
+    if INVALIDATE_ALL in (older, newer):
+        return INVALIDATE_ALL
+    return f"{older},{newer}"
+
+
+class SlotCache:
+    """Borg per-worker cache of `SlotRead` rows keyed by slot_id.
+
+    `SlotModel.update` notifies ``slot_update`` with the ids it changed; every
+    worker listens on that channel and drops those entries, so all workers stay
+    coherent. Rows are only cached while the listener is subscribed, so an
+    update can never slip by unnoticed. Once the LISTEN connection drops, the
+    cache is bypassed until the reconnect clears it; the TTL bounds staleness
+    should a notification still be lost.
+
+    Every invalidation bumps a generation. Readers take `generation` before
+    fetching a row and hand it to `put`, which drops the row if an invalidation
+    arrived in between: the row may predate the update that caused it.
+    """
+
+    _cache: ClassVar[TTLCache[UUID, SlotRead]] = TTLCache(
+        settings.slot_cache_size, settings.slot_cache_ttl
+    )
+    _listener: asyncio.Task[None] | None = None
+    _listening: bool = False
+    _generation: int = 0
+    # NotificationHub generation the cache was last cleared or started in.
+    _hub_generation: int = -1
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        raise TypeError("SlotCache should not be instantiated. Use class methods only.")
+
+    @classmethod
+    def get(cls, slot_id: UUID) -> SlotRead | None:
+        """Return the cached slot, starting the invalidation listener on first use."""
+        if not cls.is_listening():
+            cls._ensure_listener()
+            return None
+        return cls._cache.get(slot_id)
+
+    @classmethod
+    def generation(cls) -> int:
+        """Return the invalidation generation, to pass to `put` after fetching a row."""
+        return cls._generation
+
+    @classmethod
+    def put(cls, slot: SlotRead, generation: int) -> None:
+        """Cache ``slot`` if invalidations are being received and none arrived since ``generation``."""
+        if cls.is_listening() and generation == cls._generation:
+            cls._cache.put(slot.slot_id, slot)
+
+    @classmethod
+    def invalidate(cls, slot_ids: Iterable[UUID]) -> None:
+        """Drop the given slots from this worker's cache."""
+        cls._generation += 1
+        cls._cache.invalidate(slot_ids)
+
+    @classmethod
+    def handle_payload(cls, payload: str) -> None:
+        """Apply a ``slot_update`` notification payload (comma-separated ids or ``*``)."""
+        if payload == INVALIDATE_ALL:
+            cls._generation += 1
+            cls._hub_generation = NotificationHub.generation()
+            cls._cache.clear()
+            return
+        cls.invalidate(UUID(slot_id) for slot_id in payload.split(",") if slot_id)
+
+    @classmethod
+    def _ensure_listener(cls) -> None:
+        if cls._listener is None or cls._listener.done():
+            cls._listener = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def _listen(cls) -> None:
+        """Apply slot_update notifications until cancelled."""
+        logger = get_logger()
+        try:
+            async with NotificationHub.subscribe(
+                SLOT_UPDATE_CHANNEL, _merge_payloads, resync=INVALIDATE_ALL
+            ) as queue:
+                cls._hub_generation = NotificationHub.generation()
+                cls._listening = True
+                while True:
+                    cls.handle_payload(await queue.get())
+        except (SlowConsumerError, OSError, PostgresError) as exc:
+            logger.warning("Slot cache invalidation listener stopped: %s", exc)
+        finally:
+            # Without invalidations the cache can no longer be trusted.
+            cls._listening = False
+            cls._generation += 1
+            cls._cache.clear()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Stop the listener and drop every entry on shutdown."""
+        if cls._listener is not None:
+            cls._listener.cancel()
+            try:
+                await cls._listener
+            except asyncio.CancelledError:
+                pass
+            cls._listener = None
+        cls._listening = False
+        cls._cache.clear()
+
+    @classmethod
+    def is_listening(cls) -> bool:
+        """Return True while invalidations are received (and slots may be cached)."""
+        return cls._listening and cls._hub_generation == NotificationHub.generation()
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Return the cache counters and size."""
+        return cls._cache.stats()
+
+
+for _stat in ("hits", "misses", "evictions", "expirations", "size"):
+    Metrics.register_gauge(
+        f"slot_cache.{_stat}",
+        lambda stat=_stat: SlotCache.stats()[stat],
+    )
@@ -1,12 +1,28 @@
+from typing import Final
 from uuid import UUID
 
 from asyncpg import Pool
 
+from core.settings import settings
+from models.open_participants import (
+    OpenParticipantsRefresher,
+    open_participants_relation,
+    refresh_open_participants,
+)
 from models.parent_model import DBNotFound, ParentModel
+from models.prepared_statements import PreparedStatementRegistry
+from models.slot_cache import (
+    INVALIDATE_ALL,
+    SLOT_UPDATE_CHANNEL,
+    SLOT_UPDATE_MAX_IDS,
+    SlotCache,
+)
+from models.sql_statement_builder import SQLStatementBuilder
 from schema import (
     BowStyleType,
     FaceType,
     FullSlotInfo,
+    OpenParticipantsMode,
     SlotCreate,
     SlotFilter,
     SlotJoinRequest,
@@ -17,26 +33,70 @@ from schema import (
     TargetRead,
 )
 
+# Applies an UPDATE built by ParentModel and tells every worker which slots
+# changed. The notification is delivered on commit; past a few hundred ids the
+# payload would not fit, so workers are told to drop their whole cache instead.
+SLOT_UPDATE_NOTIFY_TEMPLATE: Final[str] = f"""
+    WITH updated AS (
+        {{update}}
+        RETURNING slot_id
+    )
+    SELECT
+        array_agg(slot_id) AS slot_ids,
+        pg_notify(
+            '{SLOT_UPDATE_CHANNEL}',
+            CASE
+                WHEN count(*) > {SLOT_UPDATE_MAX_IDS} THEN '{INVALIDATE_ALL}'
+                ELSE string_agg(slot_id::text, ',')
+            END
+        )
+    FROM updated
+    HAVING count(*) > 0;
+"""
+SLOT_BY_ID_STM: Final[str] = PreparedStatementRegistry.register(
+    "slot_by_id",
+    SQLStatementBuilder("slot").build_select_with_conditions([], ["slot_id = $1"], 1, False),
+)
+
 
 class SlotModel(ParentModel[SlotCreate, SlotSet, SlotRead, SlotFilter]):
     def __init__(self, db_pool: Pool) -> None:
         super().__init__("slot", db_pool, SlotRead)
 
     async def refresh_open_participants(self) -> None:
-        """Refresh the materialized view that backs open participants lists.
+        """Bring open_participants up to date (see `models.open_participants`)."""
+        await refresh_open_participants(self)
 
-        Tries a concurrent refresh first (requires a suitable unique index on the
-        materialized view). Falls back to a regular refresh if concurrent refresh
-        is not supported in the current database state.
+    async def get_by_id(self, slot_id: UUID) -> SlotRead:
+        """Fetch a slot by id, from the per-worker `SlotCache` when possible.
+
+        Raises:
+            DBNotFound: If the slot does not exist.
         """
-        try:
-            await self.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY open_participants;")
-        except Exception as exc:  # DBException or asyncpg errors
-            self.logger.debug(
-                "Concurrent refresh failed for open_participants, falling back. Reason: %s",
-                exc,
-            )
-            await self.execute("REFRESH MATERIALIZED VIEW open_participants;")
+        slot = SlotCache.get(slot_id)
+        if slot is not None:
+            return slot
+        generation = SlotCache.generation()
+        row = await self.fetchrow_named(SLOT_BY_ID_STM, (slot_id,))
+        slot = self.read_schema(**row)
+        SlotCache.put(slot, generation)
+        return slot
+
+    async def update(self, data: SlotSet, where: SlotFilter) -> None:
+        """Update slots and invalidate them in every worker's `SlotCache`.
+
+        Raises:
+            DBNotFound: If no slot matches the filter.
+        """
+        sql_statement, values = self.build_update_sql_stm(data, where)
+        notify_sql = self.statement_cache.get_or_build(
+            ("update_notify", sql_statement),
+            lambda: SLOT_UPDATE_NOTIFY_TEMPLATE.format(update=sql_statement.strip().rstrip(";")),
+        )
+        rows = await self.fetch((notify_sql, values))
+        if not rows:
+            raise DBNotFound(f"{self.name}: No record(s) found")
+        SlotCache.invalidate(rows[0]["slot_ids"])
 
     async def create_one(  # noqa: PLR0913
         self,
@@ -116,6 +176,18 @@ class SlotModel(ParentModel[SlotCreate, SlotSet, SlotRead, SlotFilter]):
             raise DBNotFound(f"{self.name}: No record found")
         return self.read_schema(**row)
 
+    async def get_open_participants(self, session_id: UUID) -> list[FullSlotInfo]:
+        """Return every open_participants row of a session."""
+        sql, params = self.build_select_view_sql_stm(
+            view_name=open_participants_relation(),
+            where=SlotFilter(session_id=session_id),
+            columns=[],
+            limit=0,
+            is_desc=False,
+        )
+        rows = await self.fetch((sql, params))
+        return [FullSlotInfo(**row) for row in rows]
+
     async def get_full_slot_info(
         self, *, slot_id: UUID | None = None, archer_id: UUID | None = None
     ) -> FullSlotInfo:
@@ -144,10 +216,9 @@ class SlotModel(ParentModel[SlotCreate, SlotSet, SlotRead, SlotFilter]):
         else:
             filters = SlotFilter(archer_id=archer_id)
 
-        # Mirror ParentModel.build_select_sql_stm but target the view
         # Mirror ParentModel.build_select_sql_stm but target the view
         sql, params = self.build_select_view_sql_stm(
-            view_name="open_participants",
+            view_name=open_participants_relation(),
             where=filters,
             columns=[],
             limit=1,
@@ -156,8 +227,16 @@ class SlotModel(ParentModel[SlotCreate, SlotSet, SlotRead, SlotFilter]):
         try:
             row = await self.fetchrow((sql, params))
         except DBNotFound:
+            mode = settings.open_participants_mode
+            if mode is OpenParticipantsMode.LIVE:
+                raise
             # The view might be stale, try to refresh it
-            await self.refresh_open_participants()
+            if mode is OpenParticipantsMode.DEBOUNCED:
+                version = OpenParticipantsRefresher.request()
+                if not await OpenParticipantsRefresher.wait_for(version):
+                    raise
+            else:
+                await self.refresh_open_participants()
             row = await self.fetchrow((sql, params))
 
         return FullSlotInfo(**row)
@@ -7,7 +7,7 @@ from the SQL text.
 """
 
 from string import Template
-from typing import Final, cast
+from typing import Final
 
 
 class SQLStatementBuilder:
@@ -26,6 +26,29 @@ class SQLStatementBuilder:
     """
 
     BINARY_OP_PARTS: Final[int] = 2
+    # Allowed WHERE operators, longest first to avoid partial matches.
+    # Example: avoid matching "IS" inside "IS NOT DISTINCT FROM".
+    OPERATORS_LONGEST_FIRST: Final[tuple[str, ...]] = tuple(
+        sorted(
+            {
+                "IS NOT DISTINCT FROM",
+                "IS DISTINCT FROM",
+                "IS NOT",
+                "NOT IN",
+                "LIKE",
+                "IS",
+                "<=",
+                ">=",
+                "<>",
+                "IN",
+                "=",
+                "<",
+                ">",
+            },
+            key=len,
+            reverse=True,
+        )
+    )
 
     def __init__(self, table_name: str) -> None:
         """Initialize a builder for the given table name.
@@ -46,6 +69,16 @@ class SQLStatementBuilder:
                 $limit_clause;
             """
         )
+        self.keyset_template = Template(
+            f"""
+                SELECT $columns
+                FROM {self.table_name}
+                $where_clause
+                $and_clauses
+                ORDER BY created_at $direction, {self.table_name}_id $direction
+                $limit_clause;
+            """
+        )
         self.insert_template = Template(
             f"""
                 INSERT INTO {self.table_name} ($columns)
@@ -53,6 +86,15 @@ class SQLStatementBuilder:
                 RETURNING {self.table_name}_id;
             """
         )
+        self.insert_unnest_template = Template(
+            f"""
+                INSERT INTO {self.table_name} ($columns)
+                SELECT $selected
+                FROM unnest($arrays) WITH ORDINALITY AS u($columns, _ord)
+                ORDER BY u._ord
+                RETURNING {self.table_name}_id;
+            """
+        )
         self.update_template = Template(
             f"""
             UPDATE {self.table_name}
@@ -120,27 +162,7 @@ class SQLStatementBuilder:
         # a condition is a string like "column = $1" or "column >= $2". It MUST be column name
         # followed by operator and then followed by a placeholder or NULL.
         # basic validation to prevent SQL injection
-        allowed_operators = {
-            "IS NOT DISTINCT FROM",
-            "IS DISTINCT FROM",
-            "IS NOT",
-            "NOT IN",
-            "LIKE",
-            "IS",
-            "<=",
-            ">=",
-            "<>",
-            "IN",
-            "=",
-            "<",
-            ">",
-        }
-        # Iterate longest operators first to avoid partial matches.
-        # Example: avoid matching "IS" inside "IS NOT DISTINCT FROM".
-
-        sorted_operators = cast(list[str], sorted(allowed_operators, key=len, reverse=True))
-
-        for operator in sorted_operators:
+        for operator in self.OPERATORS_LONGEST_FIRST:
             if operator not in condition:
                 continue
 
@@ -217,6 +239,56 @@ class SQLStatementBuilder:
             direction="DESC" if is_desc else "ASC",
         )
 
+    def build_select_keyset(
+        self,
+        columns: list[str] | None,
+        conditions: list[str] | None,
+        after_placeholder: int | None,
+        limit: int,
+        is_desc: bool,
+    ) -> str:
+        """Build a keyset-paginated SELECT ordered by ``(created_at, <table>_id)``.
+
+        Conditions are validated like in :py:meth:`build_select_with_conditions`.
+        The keyset predicate itself is generated here, so it never goes through
+        condition validation.
+
+        Args:
+            columns: List of column names to select. If empty, uses ``*``.
+            conditions: List of raw condition strings joined with ``AND``.
+            after_placeholder: Number ``n`` of the placeholder bound to the last
+                seen ``created_at``; ``$n+1`` is bound to the last seen id. None
+                for the first page.
+            limit: If greater than 0, appends ``LIMIT <limit>``.
+            is_desc: Walk the keyset in descending order.
+
+        Returns:
+            A SQL string like:
+            ``SELECT * FROM shot WHERE slot_id = $1 AND (created_at, shot_id) > ($2, $3)
+            ORDER BY created_at ASC, shot_id ASC LIMIT 500;``
+
+        Raises:
+            ValueError: If any condition fails validation.
+        """
+        conditions = list(conditions or [])
+        for condition in conditions:
+            if not self.validate_condition(condition):
+                raise ValueError(f"Invalid SQL condition: {condition}")
+        if after_placeholder is not None:
+            operator = "<" if is_desc else ">"
+            conditions.append(
+                f"(created_at, {self.table_name}_id) {operator} "
+                f"(${after_placeholder}, ${after_placeholder + 1})"
+            )
+
+        return self.keyset_template.substitute(
+            columns=", ".join(columns) if columns else "*",
+            where_clause="WHERE " + conditions[0] if conditions else "",
+            and_clauses=" AND " + " AND ".join(conditions[1:]) if len(conditions) > 1 else "",
+            limit_clause=f"LIMIT {limit}" if limit > 0 else "",
+            direction="DESC" if is_desc else "ASC",
+        )
+
     def build_simple_select(self) -> str:
         """Build ``SELECT * FROM <table> ORDER BY created_at ASC;``.
 
@@ -259,6 +331,41 @@ class SQLStatementBuilder:
             values=values,
         )
 
+    def build_insert_unnest(
+        self, columns: list[str], types: list[str], defaults: list[str | None] | None = None
+    ) -> str:
+        """Build a bulk INSERT that takes one array parameter per column.
+
+        Args:
+            columns: Column names to insert values into.
+            types: Postgres type of each column, e.g. ``uuid`` or ``timestamp with time zone``.
+            defaults: DEFAULT expression of each column, or None for columns
+                without one. A NULL element of a column with a default inserts
+                the default instead.
+
+        Returns:
+            SQL string like ``INSERT INTO table (c1, c2) SELECT u.c1, COALESCE(u.c2, 0)
+            FROM unnest($1::uuid[], $2::integer[]) WITH ORDINALITY AS u(c1, c2, _ord)
+            ORDER BY u._ord RETURNING table_id;``
+
+        Notes:
+            The statement only depends on the columns, not on the number of
+            rows, and binds as many parameters as there are columns. Rows are
+            inserted, and so returned, in array order.
+        """
+        if len(columns) != len(types):
+            raise ValueError("Every column needs a type")
+        if defaults is None:
+            defaults = [None] * len(columns)
+        arrays = ", ".join(f"${i}::{type_}[]" for i, type_ in enumerate(types, start=1))
+        selected = ", ".join(
+            f"u.{column}" if default is None else f"COALESCE(u.{column}, {default})"
+            for column, default in zip(columns, defaults, strict=True)
+        )
+        return self.insert_unnest_template.substitute(
+            columns=", ".join(columns), selected=selected, arrays=arrays
+        )
+
     def build_update(self, set_data: list[tuple[str, str]], conditions: list[str]) -> str:
         """Build an UPDATE statement that always requires a WHERE clause.
 
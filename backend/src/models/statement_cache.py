@@ -0,0 +1,68 @@
+"""Process-wide cache of validated SQL statement text.
+
+`ParentModel` builders always produce the same SQL for the same statement shape
+(relation, filter columns, selected columns, limit and order). Caching the text
+keeps the per-call cost to a dictionary lookup and hands asyncpg byte-identical
+SQL, so its per-connection prepared-statement cache is reused across requests.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+type StatementKey = tuple[Hashable, ...]
+
+
+class StatementCache:
+    """Bounded LRU mapping of statement shapes to already-validated SQL text.
+
+    Only the SQL text is cached; bound values are never stored. Keys must
+    describe everything that influences the generated text.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of statements kept. Least recently used
+                entries are evicted first. A value <= 0 disables caching.
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[StatementKey, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: StatementKey, build: Callable[[], str]) -> str:
+        """Return the cached SQL for ``key``, building and storing it on a miss.
+
+        Args:
+            key: Hashable description of the statement shape.
+            build: Zero-argument callable producing the SQL text. It is only
+                invoked on a miss, so validation errors surface the first time a
+                shape is seen and are never cached.
+
+        Returns:
+            The SQL text for the statement shape.
+        """
+        sql_stm = self._entries.get(key)
+        if sql_stm is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return sql_stm
+
+        self.misses += 1
+        sql_stm = build()
+        if self.max_size > 0:
+            self._entries[key] = sql_stm
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return sql_stm
+
+    def clear(self) -> None:
+        """Drop all cached statements and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current number of cached statements."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -3,13 +3,13 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from starlette.requests import HTTPConnection
 
-from core import decode_token
+from core import decode_claims, is_session_revoked
 
 
 async def require_auth(request: HTTPConnection) -> UUID:
     """Validate JWT from auth cookie and return authenticated archer id.
 
-    Raises 401 if the cookie is missing or invalid.
+    Raises 401 if the cookie is missing or invalid, or its session was revoked.
     """
     token = request.cookies.get("arch_stats_auth")
     if not token:
@@ -18,8 +18,9 @@ async def require_auth(request: HTTPConnection) -> UUID:
             detail="User is not authorized to use this endpoint",
         )
     try:
-        sub = decode_token(token, "sub")
-        if not isinstance(sub, str):
+        claims = decode_claims(token)
+        sub = claims.get("sub")
+        if not isinstance(sub, str) or await is_session_revoked(claims):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User is not authorized to use this endpoint",
@@ -0,0 +1,40 @@
+from typing import Annotated
+
+from fastapi import HTTPException, Query, Response, status
+
+from core.settings import settings
+from models import Page
+from schema import PageCursor, PageRequest
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+async def get_page_request(
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.list_page_max_size, description="Maximum number of rows"),
+    ] = settings.list_page_size,
+    cursor: Annotated[
+        str | None, Query(description=f"Opaque value of a previous {NEXT_CURSOR_HEADER} header")
+    ] = None,
+) -> PageRequest:
+    """Parse the ``limit``/``cursor`` query parameters of a paginated list endpoint.
+
+    Raises 400 if the cursor was not produced by this API.
+    """
+    try:
+        page_cursor = PageCursor.decode(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return PageRequest(limit=limit, cursor=page_cursor)
+
+
+def paginate[T](response: Response, page: Page[T]) -> list[T]:
+    """Return the page items, exposing the next cursor in the response headers.
+
+    The header is omitted on the last page, so clients keep requesting with the
+    returned cursor until it disappears.
+    """
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor.encode()
+    return page.items
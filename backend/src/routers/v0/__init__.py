@@ -2,6 +2,7 @@ from routers.v0.archer_router import router as archer_router
 from routers.v0.auth_router import router as auth_router
 from routers.v0.faces_router import router as faces_router
 from routers.v0.live_stats_router import router as live_stats_router
+from routers.v0.metrics_router import router as metrics_router
 from routers.v0.session_router import router as session_router
 from routers.v0.shot_router import router as shot_router
 from routers.v0.slot_router import router as slot_router
@@ -14,4 +15,5 @@ __all__ = [
     "shot_router",
     "faces_router",
     "live_stats_router",
+    "metrics_router",
 ]
@@ -6,7 +6,15 @@ from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from models import ArcherModel, DBNotFound
 from routers.deps.models import get_archer_model
-from schema import ArcherCreate, ArcherFilter, ArcherId, ArcherRead, ArcherUpdate
+from routers.deps.pagination import get_page_request, paginate
+from schema import (
+    ArcherCreate,
+    ArcherFilter,
+    ArcherId,
+    ArcherRead,
+    ArcherUpdate,
+    PageRequest,
+)
 
 router = APIRouter(prefix="/archer", tags=["Archers"])
 
@@ -14,16 +22,19 @@ router = APIRouter(prefix="/archer", tags=["Archers"])
 @router.get("/", response_model=list[ArcherRead])
 async def list_archers(
     archer_model: Annotated[ArcherModel, Depends(get_archer_model)],
+    page: Annotated[PageRequest, Depends(get_page_request)],
+    response: Response,
 ) -> list[ArcherRead]:
     """
     List archers.
 
-    Returns all archers matching default filter.
+    Returns one page of the archers matching default filter, oldest first. Pass
+    the X-Next-Cursor response header back as `cursor` to get the next page.
 
-    Responses: 200 OK.
+    Responses: 200 OK, 400 Bad Request.
     """
-    archers = await archer_model.get_all(ArcherFilter(), [])
-    return archers
+    archers = await archer_model.get_page(ArcherFilter(), page)
+    return paginate(response, archers)
 
 
 @router.get("/{archer_id:uuid}", response_model=ArcherRead, status_code=status.HTTP_200_OK)
@@ -1,4 +1,3 @@
-import base64
 import logging
 from datetime import UTC, date, datetime
 from typing import Annotated
@@ -11,10 +10,12 @@ from jwt import ExpiredSignatureError, InvalidTokenError
 from core import (
     AuthDeps,
     build_needs_registration_response,
+    decode_claims,
     decode_token,
-    hash_session_token,
+    is_session_revoked,
     login_existing_archer,
     register_archer,
+    session_hash_from_sid,
     settings,
     verify_google_id_token,
 )
@@ -194,15 +195,21 @@ async def get_current_user(
         )
 
     try:
-        archer_id_str = decode_token(token, "sub")
+        claims = decode_claims(token)
+        archer_id_str = claims.get("sub")
         if not isinstance(archer_id_str, str):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token: missing subject",
             )
+        if await is_session_revoked(claims):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session has been revoked",
+            )
 
         # Extract expiration timestamp from JWT
-        exp_timestamp = decode_token(token, "exp")
+        exp_timestamp = claims.get("exp")
         if not isinstance(exp_timestamp, (int, float)):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -266,8 +273,7 @@ async def logout(
         try:
             sid_b64 = decode_token(token, "sid")
             if isinstance(sid_b64, str):
-                raw = base64.urlsafe_b64decode(sid_b64 + "==")
-                token_hash = hash_session_token(raw)
+                token_hash = session_hash_from_sid(sid_b64)
                 await auth_session_model.revoke_by_hash(token_hash, datetime.now(UTC))
         except Exception:
             pass
@@ -1,25 +1,59 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
 
-from core import face_data
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from core import FACE_JSON, FACE_LIST_JSON, SerializedJSON, settings
 from schema import Face, FaceMinimal, FaceType
 
 router = APIRouter(prefix="/faces", tags=["Faces"])
 
+NOT_MODIFIED: dict[int | str, dict[str, str]] = {
+    status.HTTP_304_NOT_MODIFIED: {"description": "The client's cached copy is current"}
+}
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an If-None-Match header matches ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _cached_json(serialized: SerializedJSON, if_none_match: str | None) -> Response:
+    """Return a precomputed body, or 304 if the client already holds it."""
+    headers = {
+        "ETag": serialized.etag,
+        "Cache-Control": f"public, max-age={settings.faces_cache_max_age}",
+    }
+    if _etag_matches(if_none_match, serialized.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=serialized.body, media_type="application/json", headers=headers)
+
 
-@router.get("", status_code=status.HTTP_200_OK, response_model=list[FaceMinimal])
-async def list_faces() -> list[FaceMinimal]:
-    faces: list[FaceMinimal] = []
-    for f in face_data:
-        faces.append(FaceMinimal(face_type=f.face_type, face_name=f.face_name))
-    return faces
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=list[FaceMinimal],
+    responses=NOT_MODIFIED,
+)
+async def list_faces(if_none_match: Annotated[str | None, Header()] = None) -> Response:
+    return _cached_json(FACE_LIST_JSON, if_none_match)
 
 
-@router.get("/{face_type}", status_code=status.HTTP_200_OK, response_model=Face)
-async def get_face(face_type: FaceType) -> Face:
-    for f in face_data:
-        if f.face_type == face_type:
-            return f
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Face with type '{face_type}' not found",
-    )
+@router.get(
+    "/{face_type}",
+    status_code=status.HTTP_200_OK,
+    response_model=Face,
+    responses=NOT_MODIFIED,
+)
+async def get_face(
+    face_type: FaceType, if_none_match: Annotated[str | None, Header()] = None
+) -> Response:
+    serialized = FACE_JSON.get(face_type)
+    if serialized is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Face with type '{face_type}' not found",
+        )
+    return _cached_json(serialized, if_none_match)
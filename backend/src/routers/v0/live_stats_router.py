@@ -3,7 +3,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 
-from core import LiveStatsManager
+from core import LiveStatsManager, Metrics, SlowConsumerError
 from routers.deps.auth import require_auth
 from routers.deps.models import get_live_stats_manager, get_live_stats_manager_ws
 from schema import WebSocketMessage, WSContentType
@@ -44,3 +44,29 @@ async def websocket_stats(
     except WebSocketDisconnect:
         # Client disconnected; the generator will be cancelled and listener removed
         pass
+    except SlowConsumerError:
+        Metrics.increment("live_stats.slow_consumer_disconnects")
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+
+@router.websocket("/ws/session/{session_id:uuid}")
+async def websocket_session_leaderboard(
+    websocket: WebSocket,
+    session_id: UUID,
+    live_stats_manager: Annotated[LiveStatsManager, Depends(get_live_stats_manager_ws)],
+) -> None:
+    """WebSocket endpoint streaming the live leaderboard of a whole session.
+
+    The first frame is a full snapshot of every open participant; later frames
+    only carry the entries whose rank or score changed (and the slots that left).
+    """
+
+    await websocket.accept()
+    try:
+        async for update in live_stats_manager.listen_for_session(session_id):
+            message = WebSocketMessage(
+                content=update, content_type=WSContentType.LEADERBOARD_UPDATED
+            )
+            await websocket.send_json(message.model_dump(mode="json"))
+    except WebSocketDisconnect:
+        pass
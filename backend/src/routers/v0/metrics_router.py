@@ -0,0 +1,17 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from core import Metrics
+from routers.deps.auth import require_auth
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", status_code=status.HTTP_200_OK, response_model=dict[str, float])
+async def get_metrics(
+    _: Annotated[UUID, Depends(require_auth)],
+) -> dict[str, float]:
+    """Return this worker's counters and gauges (values are per process)."""
+    return Metrics.snapshot()
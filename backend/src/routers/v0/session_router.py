@@ -1,12 +1,13 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from core import SessionManager
 from routers.deps.auth import require_auth
 from routers.deps.models import get_session_manager
-from schema import SessionCreate, SessionId, SessionRead
+from routers.deps.pagination import get_page_request, paginate
+from schema import PageRequest, SessionCreate, SessionId, SessionRead
 
 router = APIRouter(prefix="/session", tags=["Sessions"])
 
@@ -37,12 +38,18 @@ async def get_closed_session_for_archer(
     archer_id: UUID,
     current_archer_id: Annotated[UUID, Depends(require_auth)],
     session_manager: Annotated[SessionManager, Depends(get_session_manager)],
+    page: Annotated[PageRequest, Depends(get_page_request)],
+    response: Response,
 ) -> list[SessionRead]:
     """
-    Get the closed session ID owned by the archer.
-    Responses: 200 OK
+    Get the closed sessions owned by the archer, oldest first, one page at a time.
+    Pass the X-Next-Cursor response header back as `cursor` to get the next page.
+    Responses: 200 OK, 400 Bad Request
     """
-    return await session_manager.get_closed_session_for_archer(current_archer_id, archer_id)
+    sessions = await session_manager.get_closed_session_for_archer(
+        current_archer_id, archer_id, page
+    )
+    return paginate(response, sessions)
 
 
 @router.get(
@@ -1,15 +1,22 @@
-from typing import Annotated
+from typing import Annotated, Final
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from core import ShotManager
 from routers.deps.auth import require_auth
 from routers.deps.models import get_shot_manager
-from schema import ShotCreate, ShotId, ShotRead
+from routers.deps.pagination import get_page_request, paginate
+from schema import ExportFormat, PageRequest, ShotCreate, ShotId, ShotRead
 
 router = APIRouter(prefix="/shot", tags=["Shots"])
 
+EXPORT_MEDIA_TYPES: Final[dict[ExportFormat, str]] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
 
 @router.post("", response_model=ShotId | list[ShotId], status_code=status.HTTP_201_CREATED)
 async def create_shot(
@@ -25,8 +32,16 @@ async def get_shots_by_slot(
     slot_id: UUID,
     current_archer_id: Annotated[UUID, Depends(require_auth)],
     shot_manager: Annotated[ShotManager, Depends(get_shot_manager)],
+    page: Annotated[PageRequest, Depends(get_page_request)],
+    response: Response,
 ) -> list[ShotRead]:
-    return await shot_manager.get_shots_by_slot(slot_id, current_archer_id)
+    """
+    List the shots of a slot, oldest first, one page at a time.
+    Pass the X-Next-Cursor response header back as `cursor` to get the next page.
+    Responses: 200 OK, 400 Bad Request, 404 Not Found.
+    """
+    shots = await shot_manager.get_shots_by_slot(slot_id, current_archer_id, page)
+    return paginate(response, shots)
 
 
 @router.get("/count-by-slot/{slot_id:uuid}", response_model=int)
@@ -36,3 +51,24 @@ async def get_shots_count_by_slot(
     shot_manager: Annotated[ShotManager, Depends(get_shot_manager)],
 ) -> int:
     return await shot_manager.get_shots_count_by_slot(slot_id, current_archer_id)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_shots(
+    current_archer_id: Annotated[UUID, Depends(require_auth)],
+    shot_manager: Annotated[ShotManager, Depends(get_shot_manager)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    slot_id: UUID | None = None,
+    session_id: UUID | None = None,
+) -> StreamingResponse:
+    """
+    Stream every shot of the authenticated archer as NDJSON or CSV, oldest first.
+    Narrow the export with `slot_id` and/or `session_id`.
+    Responses: 200 OK, 403 Forbidden, 404 Not Found.
+    """
+    chunks = await shot_manager.export_shots(current_archer_id, export_format, slot_id, session_id)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="shots.{export_format}"'},
+    )
@@ -21,13 +21,23 @@ from schema.auth_schema import (
 from schema.enums import (
     AuthStatus,
     BowStyleType,
+    ExportFormat,
     GenderType,
     JWTAlgorithm,
+    OpenParticipantsMode,
     SlotLetterType,
     WSContentType,
 )
 from schema.face_schema import Face, FaceMinimal, FaceType, Ring, Spot
-from schema.live_stats_schema import LiveStat, ShotScore, Stats
+from schema.live_stats_schema import (
+    LeaderboardEntry,
+    LeaderboardUpdate,
+    LiveStat,
+    ShotScore,
+    Stats,
+)
+from schema.pagination_schema import PageCursor, PageRequest
+from schema.sensor_schema import BowEvent, SensorEvent, TargetEvent
 from schema.session_schema import (
     SessionCreate,
     SessionFilter,
@@ -76,7 +86,9 @@ __all__ = [
     "AuthSet",
     "AuthStatus",
     "AuthUpdate",
+    "BowEvent",
     "BowStyleType",
+    "ExportFormat",
     "Face",
     "FaceMinimal",
     "FaceType",
@@ -84,9 +96,15 @@ __all__ = [
     "GenderType",
     "GoogleOneTapRequest",
     "JWTAlgorithm",
+    "LeaderboardEntry",
+    "LeaderboardUpdate",
     "LiveStat",
+    "PageCursor",
+    "PageRequest",
     "LogoutResponse",
+    "OpenParticipantsMode",
     "Ring",
+    "SensorEvent",
     "SessionCreate",
     "SessionFilter",
     "SessionId",
@@ -114,6 +132,7 @@ __all__ = [
     "Spot",
     "Stats",
     "TargetCreate",
+    "TargetEvent",
     "TargetFilter",
     "TargetRead",
     "TargetSet",
@@ -52,6 +52,25 @@ class WSContentType(StrEnum):
     SHOT_DELETED = "shot.deleted"
     ARROW_CREATED = "arrow.created"
     ARROW_DELETED = "arrow.deleted"
+    LEADERBOARD_UPDATED = "leaderboard.updated"
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class OpenParticipantsMode(StrEnum):
+    """How the open_participants relation is kept current.
+
+    VIEW: read the materialized view and refresh it after every join/leave.
+    DEBOUNCED: read the materialized view; refreshes are coalesced in the background.
+    LIVE: read the same columns straight from the base tables; nothing to refresh.
+    """
+
+    VIEW = "view"
+    DEBOUNCED = "debounced"
+    LIVE = "live"
 
 
 class FaceType(StrEnum):
@@ -6,7 +6,9 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class ShotScore(BaseModel):
     shot_id: UUID = Field(..., description="Shot identifier (UUID)")
-    score: int = Field(..., description="Shot score", ge=0, le=10)
+    score: int | None = Field(
+        default=None, description="Shot score; None for a miss with no landing", ge=0, le=10
+    )
     is_x: bool = Field(default=False, description="Is X")
     created_at: datetime = Field(..., description="Creation timestamp")
 
@@ -19,6 +21,11 @@ class Stats(BaseModel):
     total_score: int = Field(..., description="Sum of all shot scores", ge=0)
     max_score: int = Field(..., description="Maximum possible score (number of shots * 10)", ge=0)
     mean: float = Field(..., description="Average score")
+    x_count: int = Field(default=0, description="Number of X shots", ge=0)
+    end_totals: list[int] = Field(
+        default_factory=list,
+        description="Score of each end of `shot_per_round` shots, oldest first",
+    )
 
     model_config = ConfigDict(title="Stats", extra="forbid")
 
@@ -28,3 +35,29 @@ class LiveStat(BaseModel):
     stats: Stats = Field(..., description="Aggregated live statistics")
 
     model_config = ConfigDict(title="Live Stat", extra="forbid")
+
+
+class LeaderboardEntry(BaseModel):
+    slot_id: UUID = Field(..., description="Slot identifier (UUID)")
+    slot: str = Field(..., description="Slot code combining lane and letter (e.g., '1A')")
+    rank: int = Field(..., description="Competition rank (ties share a rank)", ge=1)
+    total_score: int = Field(..., description="Running total score", ge=0)
+    x_count: int = Field(..., description="Number of X shots", ge=0)
+    number_of_shots: int = Field(..., description="Arrows shot so far", ge=0)
+
+    model_config = ConfigDict(title="Leaderboard Entry", extra="forbid")
+
+
+class LeaderboardUpdate(BaseModel):
+    session_id: UUID = Field(..., description="Session identifier (UUID)")
+    is_snapshot: bool = Field(
+        ..., description="True when `entries` is the whole board, False for a delta"
+    )
+    entries: list[LeaderboardEntry] = Field(
+        ..., description="Entries whose rank or score changed since the previous frame"
+    )
+    removed: list[UUID] = Field(
+        default_factory=list, description="Slots that left the session since the previous frame"
+    )
+
+    model_config = ConfigDict(title="Leaderboard Update", extra="forbid")
@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+
+class PageCursor(BaseModel):
+    """Position after the last row of a page, in ``(created_at, id)`` keyset order."""
+
+    created_at: datetime = Field(..., description="created_at of the last row returned")
+    id: UUID = Field(..., description="Primary key of the last row returned")
+
+    model_config = ConfigDict(title="Page Cursor", extra="forbid", frozen=True)
+
+    def encode(self) -> str:
+        """Return the cursor as an opaque URL-safe token."""
+        raw = self.model_dump_json().encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> PageCursor:
+        """Parse a token produced by :py:meth:`encode`.
+
+        Raises:
+            ValueError: If the token is not a valid cursor.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return cls.model_validate(json.loads(raw))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, ValidationError) as e:
+            raise ValueError("Invalid page cursor") from e
+
+
+class PageRequest(BaseModel):
+    limit: int = Field(..., ge=1, description="Maximum number of rows to return")
+    cursor: PageCursor | None = Field(
+        default=None, description="Resume after this position; None for the first page"
+    )
+
+    model_config = ConfigDict(title="Page Request", extra="forbid")
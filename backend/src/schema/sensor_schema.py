@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BowEvent(BaseModel):
+    kind: Literal["bow"] = Field(..., description="Event discriminator")
+    slot_id: UUID = Field(..., description="Slot the bow sensor is paired with")
+    arrow_id: UUID | None = Field(
+        default=None, description="Arrow read from the RFID tag, if the read succeeded"
+    )
+    engaged_at: datetime | None = Field(default=None, description="UTC time the arrow was nocked")
+    released_at: datetime | None = Field(
+        default=None, description="UTC time the arrow left the string; receipt time if omitted"
+    )
+
+    model_config = ConfigDict(title="Bow Sensor Event", extra="forbid")
+
+
+class TargetEvent(BaseModel):
+    kind: Literal["target"] = Field(..., description="Event discriminator")
+    slot_id: UUID = Field(..., description="Slot the target sensor is paired with")
+    arrow_id: UUID | None = Field(
+        default=None, description="Arrow read by the target sensor, if it has a reader"
+    )
+    x: float = Field(..., description="X coordinate in millimeters (face SVG frame)")
+    y: float = Field(..., description="Y coordinate in millimeters (face SVG frame)")
+    landed_at: datetime | None = Field(
+        default=None, description="UTC time the arrow landed; receipt time if omitted"
+    )
+
+    model_config = ConfigDict(title="Target Sensor Event", extra="forbid")
+
+
+type SensorEvent = Annotated[BowEvent | TargetEvent, Field(discriminator="kind")]
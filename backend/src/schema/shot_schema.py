@@ -6,7 +6,7 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 from schema.base import BaseUpdateValidation
 
 
-class ShotCreate(BaseModel):
+class ShotBase(BaseModel):
     slot_id: UUID = Field(..., description="Slot identifier (UUID) this shot belongs to")
     x: float | None = Field(default=None, description="X coordinate in millimeters")
     y: float | None = Field(default=None, description="Y coordinate in millimeters")
@@ -24,20 +24,41 @@ class ShotCreate(BaseModel):
         default=None, description="Optional creation timestamp for explicitly setting the time."
     )
 
-    model_config = ConfigDict(title="Shot Create", extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(title="Shot Base", extra="forbid", populate_by_name=True)
 
     @model_validator(mode="after")
-    def _validate_all_or_none(self) -> ShotCreate:
-        """Enforce that all three values (x, y, score) are either all NULL or all present."""
-
-        if not (
-            (self.x is None and self.y is None and self.score is None)
-            or (self.x is not None and self.y is not None and self.score is not None)
-        ):
-            raise ValueError("x, y, and score must all be provided together or all be None")
+    def _validate_all_or_none(self) -> ShotBase:
+        """Enforce that x and y come together, and that a score comes with them.
+
+        Coordinates without a score are allowed: the server scores them from the
+        slot's target face.
+        """
+
+        if (self.x is None) != (self.y is None) or (self.x is None and self.score is not None):
+            raise ValueError("x and y must be provided together, and score requires them")
         return self
 
 
+class ShotCreate(ShotBase):
+    idempotency_key: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=128,
+        exclude=True,
+        description=(
+            "Client-chosen key identifying this shot; resubmitting it returns the original "
+            "shot_id instead of recording the shot again"
+        ),
+    )
+
+    model_config = ConfigDict(title="Shot Create", extra="forbid", populate_by_name=True)
+
+    @property
+    def needs_scoring(self) -> bool:
+        """True if the shot has coordinates but no score yet."""
+        return self.x is not None and self.score is None
+
+
 class ShotSet(BaseModel):
     """This is just a placeholder. We don't want to allow updating shot fields."""
 
@@ -70,7 +91,7 @@ class ShotUpdate(BaseUpdateValidation):
     model_config = ConfigDict(title="Shot Update", extra="forbid")
 
 
-class ShotRead(ShotCreate):
+class ShotRead(ShotBase):
     shot_id: UUID = Field(
         ...,
         description="Shot identifier (UUID)",
@@ -1,3 +1,4 @@
+import json
 import logging
 import time
 from collections.abc import AsyncGenerator, Callable, Iterator
@@ -9,11 +10,29 @@ import pytest
 import pytest_asyncio
 from app import run
 from asyncpg import Pool
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-
-from core import AuthDeps, DBPool, settings
-from models import ArcherModel, AuthModel
+from jwt.algorithms import RSAAlgorithm
+
+from core import (
+    AuthDeps,
+    DBPool,
+    GoogleVerifier,
+    NotificationHub,
+    SensorGateway,
+    ShotJournal,
+    StaticKeySet,
+    settings,
+)
+from models import (
+    ArcherModel,
+    AuthModel,
+    OpenParticipantsRefresher,
+    OpenSessionCache,
+    RevokedSessionCache,
+    SlotCache,
+)
 from routers.v0.auth_router import get_deps
 
 
@@ -26,6 +45,14 @@ async def app() -> AsyncGenerator[FastAPI]:
     try:
         yield application
     finally:
+        await SensorGateway.close()
+        await ShotJournal.close()
+        await SlotCache.close()
+        await OpenSessionCache.close()
+        await RevokedSessionCache.close()
+        await GoogleVerifier.close()
+        await NotificationHub.close()
+        await OpenParticipantsRefresher.close()
         await DBPool.close_db_pool()
 
 
@@ -81,6 +108,30 @@ def jwt_for() -> Callable[[UUID], str]:
     return _jwt_for
 
 
+@pytest.fixture
+def google_id_token() -> Iterator[Callable[..., str]]:
+    """Verify Google ID tokens against a local stand-in key and sign them with it."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    GoogleVerifier.use(StaticKeySet({"keys": [{**jwk, "kid": "test-key", "alg": "RS256"}]}))
+
+    def _google_id_token(**claims: object) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": settings.arch_stats_google_oauth_client_id,
+            "sub": "google-subject",
+            "email": "archer@example.com",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": "test-key"})
+
+    yield _google_id_token
+    GoogleVerifier.use(None)
+
+
 # Mock Fixtures for individual dependencies
 @pytest.fixture
 def mock_archers() -> AsyncMock:
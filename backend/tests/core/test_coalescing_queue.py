@@ -0,0 +1,41 @@
+import pytest
+
+from core import CoalescingQueue, Metrics, SlowConsumerError
+
+
+@pytest.mark.asyncio
+async def test_full_queue_merges_into_newest_item() -> None:
+    queue = CoalescingQueue[list[int]](maxsize=2, max_pending=10, merge=lambda a, b: a + b)
+
+    for item in ([1], [2], [3], [4]):
+        queue.put_nowait(item)
+
+    assert queue.qsize() == 2  # noqa: PLR2004
+    assert await queue.get() == [1]
+    assert await queue.get() == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_without_merge_keeps_latest() -> None:
+    queue = CoalescingQueue[str](maxsize=1, max_pending=10)
+
+    queue.put_nowait("old")
+    queue.put_nowait("new")
+
+    assert await queue.get() == "new"
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_cut_off() -> None:
+    Metrics.reset_counters()
+    queue = CoalescingQueue[str](maxsize=1, max_pending=2, metrics_prefix="test_queue")
+
+    for item in ("a", "b", "c", "d"):
+        queue.put_nowait(item)
+
+    with pytest.raises(SlowConsumerError):
+        await queue.get()
+    assert queue.qsize() == 0
+    snapshot = Metrics.snapshot()
+    assert snapshot["test_queue.slow_consumers"] == 1
+    assert snapshot["test_queue.dropped"] == 1
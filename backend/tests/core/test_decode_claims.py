@@ -0,0 +1,48 @@
+import time
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from core import Metrics, decode_claims, settings
+
+
+def _token(**claims: object) -> str:
+    now = int(time.time())
+    payload = {"sub": str(uuid4()), "iat": now, "exp": now + 3600, **claims}
+    return jwt.encode(
+        payload, settings.arch_stats_jwt_secret, algorithm=settings.arch_stats_jwt_algorithm
+    )
+
+
+def test_decode_claims_returns_every_claim_in_one_pass() -> None:
+    token = _token(sid="abc")
+
+    claims = decode_claims(token)
+
+    assert set(claims) >= {"sub", "iat", "exp", "sid"}
+    assert claims["sid"] == "abc"
+
+
+def test_repeated_token_skips_signature_verification(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = _token()
+    first = decode_claims(token)
+    hits = Metrics.snapshot()["jwt_claims_cache.hits"]
+
+    def fail(*_: object, **__: object) -> None:
+        raise AssertionError("cached token was verified again")
+
+    monkeypatch.setattr(jwt, "decode", fail)
+    assert decode_claims(token) == first
+    assert Metrics.snapshot()["jwt_claims_cache.hits"] == hits + 1
+
+
+def test_invalid_and_expired_tokens_are_rejected_and_not_cached() -> None:
+    size = Metrics.snapshot()["jwt_claims_cache.size"]
+
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_claims(_token() + "x")
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_claims(_token(exp=int(time.time()) - 1))
+
+    assert Metrics.snapshot()["jwt_claims_cache.size"] == size
@@ -0,0 +1,87 @@
+import asyncio
+import json
+from collections.abc import Callable
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from core import GoogleKeySet, GoogleVerifier, settings
+from core.google_verifier import cache_control_max_age
+
+
+def _jwks(kid: str) -> dict[str, object]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    return {"keys": [{**jwk, "kid": kid, "alg": "RS256"}]}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_control_max_age() -> None:
+    max_age = 19870
+    assert cache_control_max_age(f"public, max-age={max_age}, must-revalidate") == max_age
+    assert cache_control_max_age("no-cache") is None
+    assert cache_control_max_age(None) is None
+
+
+@pytest.mark.asyncio
+async def test_verify_checks_signature_audience_and_issuer(
+    google_id_token: Callable[..., str],
+) -> None:
+    claims = await GoogleVerifier.verify(google_id_token(sub="abc"))
+    assert claims["sub"] == "abc"
+
+    with pytest.raises(jwt.InvalidAudienceError):
+        await GoogleVerifier.verify(google_id_token(aud="someone-else"))
+    with pytest.raises(jwt.InvalidIssuerError):
+        await GoogleVerifier.verify(google_id_token(iss="https://evil.example.com"))
+    with pytest.raises(jwt.PyJWKError):
+        await GoogleVerifier.verify(
+            jwt.encode({"sub": "abc"}, "s" * 32, algorithm="HS256", headers={"kid": "unknown"})
+        )
+
+
+@pytest.mark.asyncio
+async def test_google_key_set_honours_max_age_and_keeps_keys_on_failure() -> None:
+    max_age = settings.google_certs_refresh_margin * 4
+    responses = [
+        httpx.Response(200, json=_jwks("k1"), headers={"Cache-Control": f"max-age={max_age:.0f}"}),
+        httpx.Response(503),
+        httpx.Response(200, json=_jwks("k2")),
+    ]
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    clock = _Clock()
+    key_set = GoogleKeySet(
+        "https://certs.test/", transport=httpx.MockTransport(handler), clock=clock
+    )
+
+    key = await key_set.get_key("k1")
+    assert await key_set.get_key("k1") is key
+    assert len(requests) == 1
+
+    # Close to expiry: current keys are served while a refresh runs behind them.
+    clock.now += max_age - settings.google_certs_refresh_margin / 2
+    assert await key_set.get_key("k1") is key
+    await asyncio.sleep(0.01)
+    first_and_background_fetches = 2
+    assert len(requests) == first_and_background_fetches
+
+    # The failed refresh kept the old keys for one retry interval, then refetched.
+    clock.now += settings.google_certs_retry_interval
+    assert (await key_set.get_key("k2")).key_id == "k2"
+    assert len(requests) == len(responses)
+    await key_set.close()
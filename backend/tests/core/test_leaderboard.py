@@ -0,0 +1,52 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from core.leaderboard import SessionLeaderboard
+from schema import ShotScore
+
+
+def _shot(score: int, is_x: bool = False) -> ShotScore:
+    return ShotScore(shot_id=uuid4(), score=score, is_x=is_x, created_at=datetime.now(UTC))
+
+
+def test_leaderboard_first_frame_is_a_ranked_snapshot() -> None:
+    board = SessionLeaderboard(uuid4())
+    first, second, third = uuid4(), uuid4(), uuid4()
+    board.track(first, "1A")
+    board.track(second, "1B")
+    board.track(third, "2A")
+
+    board.add(first, [_shot(9), _shot(9)])
+    board.add(second, [_shot(10, is_x=True), _shot(8)])
+    board.add(third, [_shot(10), _shot(8)])
+
+    update = board.flush()
+
+    assert update is not None
+    assert update.is_snapshot
+    assert [(e.slot, e.rank) for e in update.entries] == [("1B", 1), ("1A", 2), ("2A", 2)]
+
+
+def test_leaderboard_later_frames_only_carry_changes() -> None:
+    board = SessionLeaderboard(uuid4())
+    leader, trailer = uuid4(), uuid4()
+    board.track(leader, "1A")
+    board.track(trailer, "1B")
+    board.add(leader, [_shot(10)])
+    board.flush()
+
+    assert board.flush() is None
+
+    board.add(trailer, [_shot(5)])
+    update = board.flush()
+
+    assert update is not None
+    assert not update.is_snapshot
+    assert [e.slot_id for e in update.entries] == [trailer]
+
+    board.untrack(trailer)
+    update = board.flush()
+
+    assert update is not None
+    assert update.entries == []
+    assert update.removed == [trailer]
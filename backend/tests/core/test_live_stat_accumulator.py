@@ -0,0 +1,56 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from core.live_stat_accumulator import LiveStatAccumulator
+from schema import ShotScore
+
+
+def _shot(score: int | None, is_x: bool = False) -> ShotScore:
+    return ShotScore(shot_id=uuid4(), score=score, is_x=is_x, created_at=datetime.now(UTC))
+
+
+def test_accumulator_tracks_totals_x_count_and_ends() -> None:
+    slot_id = uuid4()
+    accumulator = LiveStatAccumulator(slot_id, end_size=3)
+
+    accumulator.add([_shot(10, is_x=True), _shot(9), _shot(8)])
+    accumulator.add([_shot(7)])
+    stats = accumulator.snapshot()
+
+    assert stats.slot_id == slot_id
+    assert stats.number_of_shots == 4  # noqa: PLR2004
+    assert stats.total_score == 34  # noqa: PLR2004
+    assert stats.max_score == 40  # noqa: PLR2004
+    assert stats.mean == 8.5  # noqa: PLR2004
+    assert stats.x_count == 1
+    assert stats.end_totals == [27, 7]
+
+
+def test_accumulator_ignores_shots_already_counted() -> None:
+    accumulator = LiveStatAccumulator(uuid4())
+    shot = _shot(5)
+
+    assert accumulator.add([shot]) == [shot]
+    assert accumulator.add([shot]) == []
+
+    stats = accumulator.snapshot()
+    assert stats.number_of_shots == 1
+    assert stats.end_totals == []
+
+
+def test_accumulator_empty_snapshot_is_zero() -> None:
+    stats = LiveStatAccumulator(uuid4(), end_size=6).snapshot()
+
+    assert stats.number_of_shots == 0
+    assert stats.mean == 0.0
+
+
+def test_accumulator_counts_a_miss_without_score_as_zero() -> None:
+    accumulator = LiveStatAccumulator(uuid4(), end_size=2)
+
+    accumulator.add([_shot(None), _shot(6)])
+    stats = accumulator.snapshot()
+
+    assert stats.number_of_shots == 2  # noqa: PLR2004
+    assert stats.total_score == 6  # noqa: PLR2004
+    assert stats.end_totals == [6]
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from asyncpg import Pool
+
+from core import NotificationHub
+
+
+@pytest.mark.asyncio
+async def test_hub_fans_out_one_channel_to_every_subscriber(db_pool: Pool) -> None:
+    channel = "hub_test_channel"
+
+    async with NotificationHub.subscribe(channel) as first:
+        async with NotificationHub.subscribe(channel) as second:
+            assert NotificationHub.channel_count() == 1
+
+            await db_pool.execute("SELECT pg_notify($1, $2);", channel, "hello")
+
+            assert await asyncio.wait_for(first.get(), timeout=5) == "hello"
+            assert await asyncio.wait_for(second.get(), timeout=5) == "hello"
+
+        assert NotificationHub.channel_count() == 1
+
+    assert NotificationHub.channel_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_resync_payload_is_queued_after_a_reconnect(db_pool: Pool) -> None:
+    channel = "hub_test_channel"
+
+    async with NotificationHub.subscribe(channel, resync="*") as queue:
+        generation = NotificationHub.generation()
+        assert NotificationHub._conn is not None
+        pid = NotificationHub._conn.get_server_pid()
+        await db_pool.execute("SELECT pg_terminate_backend($1);", pid)
+
+        assert await asyncio.wait_for(queue.get(), timeout=10) == "*"
+        assert NotificationHub.generation() == generation + 1
+        await db_pool.execute("SELECT pg_notify($1, $2);", channel, "hello")
+        assert await asyncio.wait_for(queue.get(), timeout=5) == "hello"
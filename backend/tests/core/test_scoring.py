@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from core import settings
+from core.scoring import MISS, score_arrows
+from schema import FaceType
+
+# WA 122cm face: viewBox 1342, center (671, 671), X ring r=30.5, 10 ring r=61, 9 ring r=122.
+CENTER = 671.0
+
+
+def test_scores_by_ring_with_x_ring() -> None:
+    x = CENTER + np.array([0.0, 40.0, 200.0, 700.0])
+    scores, is_x = score_arrows(FaceType.WA_122_FULL, x, np.full(4, CENTER), arrow_diameter=5.0)
+
+    assert scores.tolist() == [10, 10, 7, MISS]
+    assert is_x.tolist() == [True, False, False, False]
+
+
+def test_line_cutter_scores_the_higher_ring() -> None:
+    arrow_radius = 2.5
+    touching = CENTER + 61.0 + arrow_radius - 0.01
+    clear = CENTER + 61.0 + arrow_radius + 0.01
+
+    scores, _ = score_arrows(
+        FaceType.WA_122_FULL, [touching, clear], [CENTER, CENTER], arrow_diameter=5.0
+    )
+
+    assert scores.tolist() == [10, 9]
+
+
+def test_six_ring_face_misses_outside_the_five_ring() -> None:
+    # WA 80cm 6-ring: viewBox 560, 5 ring r=240.
+    center = 280.0
+    scores, _ = score_arrows(
+        FaceType.WA_80_6RINGS, [center + 230.0, center + 260.0], [center, center]
+    )
+
+    assert scores.tolist() == [5, MISS]
+
+
+def test_default_arrow_diameter_comes_from_settings() -> None:
+    edge = CENTER + 30.5 + settings.shot_arrow_diameter / 2
+    _, is_x = score_arrows(FaceType.WA_122_FULL, [edge - 0.01, edge + 0.01], [CENTER, CENTER])
+
+    assert is_x.tolist() == [True, False]
+
+
+def test_face_without_rings_cannot_be_scored() -> None:
+    with pytest.raises(ValueError, match="no scoring zones"):
+        score_arrows(FaceType.NONE, [0.0], [0.0])
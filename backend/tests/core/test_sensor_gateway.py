@@ -0,0 +1,150 @@
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from asyncpg import CheckViolationError, ConnectionDoesNotExistError, Pool
+
+from core import SensorGateway, ShotCorrelator, settings
+from factories.archer_factory import create_archers
+from factories.session_factory import create_sessions
+from factories.slot_factory import create_slot_assignments
+from factories.target_factory import create_targets
+from models import DBException, ShotModel
+from schema import BowEvent, ShotCreate, TargetEvent
+
+WINDOW = timedelta(seconds=2)
+TICK = 0.05
+T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_landing_is_paired_with_the_release_of_its_slot() -> None:
+    correlator = ShotCorrelator(WINDOW, TICK)
+    slot_id, arrow_id = uuid4(), uuid4()
+
+    bow = BowEvent(kind="bow", slot_id=slot_id, arrow_id=arrow_id, released_at=T0)
+    assert correlator.add(bow, T0) is None
+    target = TargetEvent(kind="target", slot_id=slot_id, x=1.0, y=2.0)
+    shot = correlator.add(target, T0 + timedelta(seconds=1))
+
+    assert shot is not None
+    assert (shot.arrow_id, shot.x, shot.y) == (arrow_id, 1.0, 2.0)
+    assert shot.created_at == T0 + timedelta(seconds=1)
+    assert correlator.pending_count() == 0
+
+
+def test_naive_sensor_timestamps_are_read_as_utc() -> None:
+    correlator = ShotCorrelator(WINDOW, TICK)
+    slot_id = uuid4()
+    naive = T0.replace(tzinfo=None)
+
+    correlator.add(BowEvent(kind="bow", slot_id=slot_id, released_at=naive), T0)
+    target = TargetEvent(
+        kind="target", slot_id=slot_id, x=1.0, y=2.0, landed_at=naive + timedelta(seconds=1)
+    )
+    shot = correlator.add(target, T0 + timedelta(seconds=1))
+
+    assert shot is not None
+    assert shot.created_at == T0 + timedelta(seconds=1)
+    assert correlator.pending_count() == 0
+
+
+def test_unclaimed_release_becomes_a_miss() -> None:
+    correlator = ShotCorrelator(WINDOW, TICK)
+    slot_id, arrow_id = uuid4(), uuid4()
+    correlator.add(BowEvent(kind="bow", slot_id=slot_id, arrow_id=arrow_id), T0)
+
+    assert correlator.expire(T0 + WINDOW) == []
+    (miss,) = correlator.expire(T0 + WINDOW * 2)
+
+    assert miss.arrow_id == arrow_id
+    assert (miss.x, miss.y, miss.score) == (None, None, None)
+    assert miss.created_at == T0
+
+
+def test_expired_release_reports_its_timeout_lag() -> None:
+    correlator = ShotCorrelator(WINDOW, TICK)
+    lag = timedelta(seconds=3)
+    correlator.add(BowEvent(kind="bow", slot_id=uuid4()), T0)
+
+    (_,) = correlator.expire(T0 + WINDOW + lag)
+
+    assert correlator.timeout_lag == lag.total_seconds()
+    assert correlator.pending_count() == 0
+
+
+def test_landing_prefers_the_release_of_the_same_arrow() -> None:
+    correlator = ShotCorrelator(WINDOW, TICK)
+    slot_id, first, second = uuid4(), uuid4(), uuid4()
+    correlator.add(BowEvent(kind="bow", slot_id=slot_id, arrow_id=first), T0)
+    correlator.add(BowEvent(kind="bow", slot_id=slot_id, arrow_id=second), T0)
+
+    target = TargetEvent(kind="target", slot_id=slot_id, arrow_id=second, x=0.0, y=0.0)
+    correlator.add(target, T0 + timedelta(seconds=1))
+    (miss,) = correlator.expire(T0 + WINDOW * 2)
+
+    assert miss.arrow_id == first
+
+
+@pytest.mark.asyncio
+async def test_udp_events_are_written_as_scored_shots(
+    db_pool: Pool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    await db_pool.execute(
+        "UPDATE slot SET face_type = 'wa_122cm_full' WHERE slot_id = $1;", slot_id
+    )
+    monkeypatch.setattr(settings, "sensor_gateway_enabled", True)
+    monkeypatch.setattr(settings, "sensor_gateway_port", 0)
+    await SensorGateway.start()
+
+    arrow_id = str(uuid4())
+    events = [
+        {"kind": "bow", "slot_id": str(slot_id), "arrow_id": arrow_id},
+        {"kind": "target", "slot_id": str(slot_id), "x": 671.0, "y": 671.0},
+    ]
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=SensorGateway.address()
+    )
+    transport.sendto(b"\n".join(json.dumps(event).encode() for event in events))
+    transport.close()
+
+    for _ in range(100):
+        await asyncio.sleep(0.05)
+        row = await db_pool.fetchrow(
+            "SELECT score, is_x, arrow_id::text FROM shot WHERE slot_id = $1;", slot_id
+        )
+        if row is not None:
+            break
+    assert row is not None
+    assert (row["score"], row["is_x"], row["arrow_id"]) == (10, True, arrow_id)
+    await SensorGateway.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_shots_are_dropped_and_unwritten_ones_kept(
+    db_pool: Pool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    good, bad, unwritten = (ShotCreate(slot_id=uuid4()) for _ in range(3))
+
+    async def copy_shots(shots: list[ShotCreate]) -> int:
+        (shot,) = shots
+        if shot is bad:
+            raise DBException("rejected") from CheckViolationError("score out of range")
+        if shot is unwritten:
+            raise DBException("unreachable") from ConnectionDoesNotExistError("closed")
+        return 1
+
+    model = ShotModel(db_pool)
+    monkeypatch.setattr(model, "copy_shots", copy_shots)
+    monkeypatch.setattr(SensorGateway, "_ready", [])
+
+    assert await SensorGateway._write_one_by_one(model, [good, bad, unwritten]) == 1
+    assert SensorGateway._ready == [unwritten]
@@ -0,0 +1,152 @@
+import asyncio
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+from asyncpg import Pool
+
+from core import ShotJournal, settings
+from core.shot_journal import decode_records, encode_record
+from factories.archer_factory import create_archers
+from factories.session_factory import create_sessions
+from factories.slot_factory import create_slot_assignments
+from factories.target_factory import create_targets
+from schema import ShotCreate
+
+
+def test_records_decode_up_to_a_torn_tail() -> None:
+    first = (uuid4(), ShotCreate(slot_id=uuid4(), x=1.0, y=2.0, score=9))
+    second = (uuid4(), ShotCreate(slot_id=uuid4()))
+    data = encode_record(*first) + encode_record(*second)
+    torn = encode_record(uuid4(), ShotCreate(slot_id=uuid4()))[:-1]
+
+    entries, valid = decode_records(data + torn)
+
+    assert entries == [first, second]
+    assert valid == len(data)
+
+
+def test_corrupt_record_ends_the_journal() -> None:
+    data = bytearray(encode_record(uuid4(), ShotCreate(slot_id=uuid4())))
+    data[-2] ^= 0xFF
+
+    assert decode_records(bytes(data)) == ([], 0)
+
+
+async def _slot_id(db_pool: Pool) -> UUID:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    return slot_id
+
+
+async def _stored(db_pool: Pool, shot_ids: list[UUID]) -> int:
+    for _ in range(100):
+        count = await db_pool.fetchval(
+            "SELECT count(*) FROM shot WHERE shot_id = ANY($1::uuid[]);", shot_ids
+        )
+        if count == len(shot_ids):
+            break
+        await asyncio.sleep(0.05)
+    return count
+
+
+@pytest.mark.asyncio
+async def test_appended_shots_are_stored_and_the_journal_emptied(
+    db_pool: Pool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slot_id = await _slot_id(db_pool)
+    monkeypatch.setattr(settings, "shot_journal_dir", str(tmp_path))
+    ShotJournal.start()
+    try:
+        shot_ids = await ShotJournal.append([ShotCreate(slot_id=slot_id) for _ in range(3)])
+
+        assert await _stored(db_pool, shot_ids) == len(shot_ids)
+        await ShotJournal.drain()
+        assert (tmp_path / "shots-0.journal").stat().st_size == 0
+    finally:
+        await ShotJournal.close()
+
+
+@pytest.mark.asyncio
+async def test_journal_left_by_a_crash_is_replayed_once(
+    db_pool: Pool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slot_id = await _slot_id(db_pool)
+    stored = (uuid4(), ShotCreate(slot_id=slot_id, x=0.0, y=0.0, score=10, is_x=True))
+    pending = (uuid4(), ShotCreate(slot_id=slot_id))
+    await db_pool.execute(
+        "INSERT INTO shot (shot_id, slot_id, x, y, score, is_x) VALUES ($1, $2, 0, 0, 10, TRUE);",
+        stored[0],
+        slot_id,
+    )
+    torn = encode_record(uuid4(), ShotCreate(slot_id=slot_id))[:5]
+    (tmp_path / "shots-0.journal").write_bytes(
+        encode_record(*stored) + encode_record(*pending) + torn
+    )
+    monkeypatch.setattr(settings, "shot_journal_dir", str(tmp_path))
+
+    ShotJournal.start()
+    try:
+        assert await _stored(db_pool, [stored[0], pending[0]]) == len([stored, pending])
+    finally:
+        await ShotJournal.close()
+    assert (tmp_path / "shots-0.journal").stat().st_size == 0
+
+
+@pytest.mark.asyncio
+async def test_journals_left_by_other_workers_are_adopted(
+    db_pool: Pool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slot_id = await _slot_id(db_pool)
+    orphan = (uuid4(), ShotCreate(slot_id=slot_id))
+    (tmp_path / "shots-3.journal").write_bytes(encode_record(*orphan))
+    monkeypatch.setattr(settings, "shot_journal_dir", str(tmp_path))
+
+    ShotJournal.start()
+    try:
+        assert await _stored(db_pool, [orphan[0]]) == 1
+        assert (tmp_path / "shots-3.journal").stat().st_size == 0
+    finally:
+        await ShotJournal.close()
+
+
+@pytest.mark.asyncio
+async def test_shot_rejected_too_often_is_quarantined(
+    db_pool: Pool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slot_id = await _slot_id(db_pool)
+    monkeypatch.setattr(settings, "shot_journal_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "shot_journal_max_attempts", 1)
+    ShotJournal.start()
+    try:
+        # No such slot: the foreign key rejects the first shot, not the second.
+        rejected = ShotCreate(slot_id=uuid4())
+        shot_ids = await ShotJournal.append([rejected, ShotCreate(slot_id=slot_id)])
+
+        assert await _stored(db_pool, shot_ids[1:]) == 1
+        assert ShotJournal.pending_count() == 0
+        quarantined, _ = decode_records((tmp_path / "shots-0.quarantine").read_bytes())
+        assert quarantined == [(shot_ids[0], rejected)]
+    finally:
+        await ShotJournal.close()
+
+
+@pytest.mark.asyncio
+async def test_latest_journaled_shot_time_is_known_without_the_database(
+    db_pool: Pool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    slot_id = await _slot_id(db_pool)
+    monkeypatch.setattr(settings, "shot_journal_dir", str(tmp_path))
+    ShotJournal.start()
+    try:
+        assert ShotJournal.latest_shot_time(slot_id) is None
+        shot = ShotCreate(slot_id=slot_id)
+        await ShotJournal.append([shot])
+
+        assert ShotJournal.latest_shot_time(slot_id) == shot.created_at
+    finally:
+        await ShotJournal.close()
@@ -0,0 +1,50 @@
+from core.timer_wheel import TimerWheel
+
+
+def test_timers_expire_once_past_due_in_deadline_order() -> None:
+    wheel = TimerWheel[str](tick=1.0, size=8)
+    wheel.advance(0.0)
+    wheel.schedule("b", 3.5)
+    wheel.schedule("a", 2.0)
+
+    assert wheel.advance(1.9) == []
+    assert wheel.advance(3.5) == [("a", 2.0)]
+    assert wheel.advance(3.6) == [("b", 3.5)]
+    assert len(wheel) == 0
+
+
+def test_cancelled_timer_never_expires() -> None:
+    wheel = TimerWheel[str](tick=1.0, size=8)
+    wheel.schedule("a", 2.0)
+
+    assert wheel.cancel("a")
+    assert not wheel.cancel("a")
+    assert wheel.advance(10.0) == []
+
+
+def test_deadline_beyond_one_turn_waits_for_its_round() -> None:
+    wheel = TimerWheel[str](tick=1.0, size=4)
+    wheel.advance(0.0)
+    far = 9.0
+    wheel.schedule("far", far)
+
+    assert wheel.advance(5.0) == []
+    assert wheel.advance(far) == []
+    assert wheel.advance(far + 0.1) == [("far", far)]
+
+
+def test_overdue_timer_expires_on_next_advance() -> None:
+    wheel = TimerWheel[str](tick=1.0, size=4)
+    wheel.advance(50.0)
+    wheel.schedule("late", 10.0)
+
+    assert wheel.advance(50.0) == [("late", 10.0)]
+
+
+def test_long_gap_visits_every_bucket() -> None:
+    wheel = TimerWheel[int](tick=1.0, size=4)
+    wheel.advance(0.0)
+    for key in range(4):
+        wheel.schedule(key, key + 1.0)
+
+    assert [key for key, _ in wheel.advance(100.0)] == [0, 1, 2, 3]
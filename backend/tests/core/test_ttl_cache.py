@@ -0,0 +1,52 @@
+from core.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = TTLCache[str, int](max_size=4, ttl=10.0, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert cache.get("a") is None
+
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 1,
+        "size": 0,
+    }
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = TTLCache[str, int](max_size=2, ttl=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+    assert cache.evictions == 1
+
+
+def test_invalidate_and_disabled_cache() -> None:
+    cache = TTLCache[str, int](max_size=2, ttl=60.0)
+    cache.put("a", 1)
+    cache.invalidate(["a", "unknown"])
+    assert cache.get("a") is None
+
+    disabled = TTLCache[str, int](max_size=0, ttl=60.0)
+    disabled.put("a", 1)
+    assert len(disabled) == 0
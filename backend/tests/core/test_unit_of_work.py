@@ -0,0 +1,63 @@
+import pytest
+from asyncpg import Pool
+
+from core.base_manager import BaseManager
+from factories.session_factory import create_sessions
+from schema import SessionFilter, SessionSet
+
+
+class _Boom(Exception):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_pins_one_connection(db_pool: Pool) -> None:
+    manager = BaseManager(db_pool)
+
+    async with manager.unit_of_work():
+        conn = manager.session.connection
+        assert conn is not None
+        assert manager.slot.connection is conn
+        assert manager.shot.connection is conn
+        async with manager.unit_of_work():
+            assert manager.target.connection is conn
+
+    assert manager.session.connection is None
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(db_pool: Pool) -> None:
+    (session_id,) = await create_sessions(db_pool, 1)
+    manager = BaseManager(db_pool)
+
+    with pytest.raises(_Boom):
+        async with manager.unit_of_work():
+            await manager.session.update(
+                SessionSet(is_opened=False), SessionFilter(session_id=session_id)
+            )
+            raise _Boom
+
+    is_opened = await db_pool.fetchval(
+        "SELECT is_opened FROM session WHERE session_id = $1;", session_id
+    )
+    assert is_opened is True
+
+
+@pytest.mark.asyncio
+async def test_on_commit_callbacks_run_only_after_commit(db_pool: Pool) -> None:
+    manager = BaseManager(db_pool)
+    calls: list[str] = []
+
+    async with manager.unit_of_work():
+        manager.slot.on_commit(lambda: calls.append("committed"))
+        assert calls == []
+    assert calls == ["committed"]
+
+    with pytest.raises(_Boom):
+        async with manager.unit_of_work():
+            manager.slot.on_commit(lambda: calls.append("rolled back"))
+            raise _Boom
+    assert calls == ["committed"]
+
+    manager.slot.on_commit(lambda: calls.append("no transaction"))
+    assert calls == ["committed", "no transaction"]
@@ -183,6 +183,18 @@ async def test_google_one_tap_login_invalid_credential(client: AsyncClient) -> N
     assert response.status_code == HTTPStatus.UNAUTHORIZED
 
 
+@pytest.mark.asyncio
+async def test_google_one_tap_login_unknown_subject_needs_registration(
+    client: AsyncClient, google_id_token: Callable[..., str]
+) -> None:
+    credential = google_id_token(sub=f"new-{uuid4()}", email="new.archer@example.com")
+    response = await client.post("/api/v0/auth/google", json={"credential": credential})
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["status"] == "needs_registration"
+    assert body["google_email"] == "new.archer@example.com"
+
+
 @pytest.mark.asyncio
 async def test_register_invalid_credential(client: AsyncClient, setup_auth_deps: None) -> None:
     payload = {
@@ -36,3 +36,22 @@ async def test_get_face_success(client: AsyncClient) -> None:
 async def test_get_face_not_found(client: AsyncClient) -> None:
     response = await client.get("/api/v0/faces/non_existent_face")
     assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_face_responses_are_cacheable_and_revalidated(client: AsyncClient) -> None:
+    face_type = face_data[1].face_type.value
+    response = await client.get(f"/api/v0/faces/{face_type}")
+    assert response.status_code == HTTPStatus.OK
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    response = await client.get(f"/api/v0/faces/{face_type}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    listing = await client.get("/api/v0/faces")
+    assert listing.headers["etag"] != etag
+    response = await client.get("/api/v0/faces", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == HTTPStatus.OK
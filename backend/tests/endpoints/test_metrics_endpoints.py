@@ -0,0 +1,30 @@
+from collections.abc import Callable
+from http import HTTPStatus
+from uuid import UUID
+
+import pytest
+from asyncpg import Pool
+from httpx import AsyncClient
+
+from factories.archer_factory import create_archers
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_auth(client: AsyncClient) -> None:
+    resp = await client.get("/api/v0/metrics")
+    assert resp.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_metrics_reports_registered_gauges(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    client.cookies.set("arch_stats_auth", jwt_for(archer_id), path="/")
+
+    resp = await client.get("/api/v0/metrics")
+
+    assert resp.status_code == HTTPStatus.OK
+    data = resp.json()
+    assert "sql_statement_cache.hits" in data
+    assert "notification_hub.channels" in data
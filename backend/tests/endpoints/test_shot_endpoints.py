@@ -1,18 +1,23 @@
 import asyncio
+import csv
+import io
+import json
 from collections.abc import Callable
 from datetime import datetime
 from http import HTTPStatus
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from asyncpg import Pool
 from httpx import AsyncClient
 
+from core import shot_manager
 from factories.archer_factory import create_archers
 from factories.session_factory import create_sessions
 from factories.slot_factory import create_slot_assignments
 from factories.target_factory import create_targets
+from models import ShotModel
 
 MIN_SCORE = 0
 MAX_SCORE = 10
@@ -109,6 +114,82 @@ async def test_get_shots_by_slot_returns_only_expected(
     assert resp.json()["detail"] == "Forbidden"
 
 
+@pytest.mark.asyncio
+async def test_get_shots_by_slot_paginates_with_cursor(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    """Walking GET /shot/by-slot/{slot_id} page by page returns every shot exactly once."""
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    shots = [await _create_shot_for_test(client, jwt_for, slot_id, archer_id, v) for v in range(5)]
+
+    client.cookies.set("arch_stats_auth", jwt_for(archer_id), path="/")
+    first = await client.get(f"/api/v0/shot/by-slot/{slot_id}", params={"limit": 3})
+    assert first.status_code == HTTPStatus.OK
+    assert len(first.json()) == 3  # noqa: PLR2004
+    cursor = first.headers["x-next-cursor"]
+
+    second = await client.get(
+        f"/api/v0/shot/by-slot/{slot_id}", params={"limit": 3, "cursor": cursor}
+    )
+    assert second.status_code == HTTPStatus.OK
+    assert len(second.json()) == 2  # noqa: PLR2004
+    assert "x-next-cursor" not in second.headers
+
+    got_ids = [UUID(s["shot_id"]) for s in first.json() + second.json()]
+    assert len(set(got_ids)) == len(got_ids)
+    assert set(got_ids) == {UUID(s["shot_id"]) for s in shots}
+
+    bad = await client.get(f"/api/v0/shot/by-slot/{slot_id}", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_export_shots_streams_ndjson_and_csv(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    """GET /shot/export streams only the caller's shots, scoped by slot or session."""
+    archer1_id, archer2_id = await create_archers(db_pool, 2)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    slot1_id, slot2_id = await create_slot_assignments(
+        db_pool,
+        2,
+        archer_ids=[archer1_id, archer2_id],
+        target_id=target_id,
+        session_id=session_id,
+    )
+    shots = [
+        await _create_shot_for_test(client, jwt_for, slot1_id, archer1_id, v) for v in range(3)
+    ]
+    await _create_shot_for_test(client, jwt_for, slot2_id, archer2_id, 7)
+
+    client.cookies.set("arch_stats_auth", jwt_for(archer1_id), path="/")
+    resp = await client.get("/api/v0/shot/export", params={"session_id": str(session_id)})
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert {row["shot_id"] for row in rows} == {s["shot_id"] for s in shots}
+
+    resp = await client.get(
+        "/api/v0/shot/export", params={"format": "csv", "slot_id": str(slot1_id)}
+    )
+    assert resp.status_code == HTTPStatus.OK
+    header, *lines = csv.reader(io.StringIO(resp.text))
+    assert "idempotency_key" not in header
+    assert all(len(line) == len(header) for line in lines)
+    records = list(csv.DictReader(io.StringIO(resp.text)))
+    assert {r["shot_id"] for r in records} == {s["shot_id"] for s in shots}
+    assert sorted(int(r["score"]) for r in records) == [0, 1, 2]
+
+    resp = await client.get("/api/v0/shot/export", params={"slot_id": str(slot2_id)})
+    assert resp.status_code == HTTPStatus.FORBIDDEN
+
+
 @pytest.mark.asyncio
 async def test_create_shot_happy_path_from_schema(
     client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
@@ -225,7 +306,7 @@ async def test_create_shot_rejects_score_out_of_range(
 async def test_create_shot_rejects_incomplete_coordinates_set(
     client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
 ) -> None:
-    """All-or-none validation: (x,y,score) must be all present or all None."""
+    """Coordinates come as a pair, and a score only with them; a pair alone is scored."""
 
     (archer_id,) = await create_archers(db_pool, 1)
     (session_id,) = await create_sessions(db_pool, 1)
@@ -233,6 +314,9 @@ async def test_create_shot_rejects_incomplete_coordinates_set(
     (slot_id,) = await create_slot_assignments(
         db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
     )
+    await db_pool.execute(
+        "UPDATE slot SET face_type = 'wa_122cm_full' WHERE slot_id = $1;", slot_id
+    )
 
     client.cookies.set("arch_stats_auth", jwt_for(archer_id), path="/")
 
@@ -240,9 +324,13 @@ async def test_create_shot_rejects_incomplete_coordinates_set(
     r1 = await client.post("/api/v0/shot", json={"slot_id": str(slot_id), "x": 0.1})
     assert r1.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
-    # x and y provided, missing score
+    # x and y provided, missing score: scored by the server, a corner of the face is a miss
     r2 = await client.post("/api/v0/shot", json={"slot_id": str(slot_id), "x": 0.1, "y": 0.2})
-    assert r2.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert r2.status_code == HTTPStatus.CREATED
+    score = await db_pool.fetchval(
+        "SELECT score FROM shot WHERE shot_id = $1;", UUID(r2.json()["shot_id"])
+    )
+    assert score == 0
 
     # Only score provided
     r3 = await client.post("/api/v0/shot", json={"slot_id": str(slot_id), "score": 5})
@@ -609,3 +697,126 @@ async def test_count_by_slot_returns_correct_count_for_multiple_shots(
 
     assert response.status_code == HTTPStatus.OK
     assert response.json() == len(shots)
+
+
+@pytest.mark.asyncio
+async def test_create_multiple_shots_rejections_insert_nothing(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    """POST /shot batch keeps 404/403/422 semantics and never inserts a rejected batch."""
+    # Arrange
+    archer1_id, archer2_id = await create_archers(db_pool, 2)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer1_id], target_id=target_id, session_id=session_id
+    )
+
+    def payload(for_slot: UUID) -> list[dict[str, Any]]:
+        return [{"slot_id": str(for_slot), "x": 1.0, "y": 1.0, "score": 7} for _ in range(3)]
+
+    # Act / Assert: unknown slot
+    client.cookies.set("arch_stats_auth", jwt_for(archer1_id), path="/")
+    resp = await client.post("/api/v0/shot", json=payload(uuid4()))
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+
+    # Act / Assert: slot owned by another archer
+    client.cookies.set("arch_stats_auth", jwt_for(archer2_id), path="/")
+    resp = await client.post("/api/v0/shot", json=payload(slot_id))
+    assert resp.status_code == HTTPStatus.FORBIDDEN
+    assert resp.json()["detail"] == "Forbidden"
+
+    # Act / Assert: closed session
+    await db_pool.execute("UPDATE session SET is_opened = false WHERE session_id = $1;", session_id)
+    client.cookies.set("arch_stats_auth", jwt_for(archer1_id), path="/")
+    resp = await client.post("/api/v0/shot", json=payload(slot_id))
+    assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert resp.json()["detail"] == "Cannot add shots to a closed session"
+
+    count = await db_pool.fetchval("SELECT COUNT(*) FROM shot WHERE slot_id = $1;", slot_id)
+    assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_shot_with_coordinates_only_is_scored_from_the_face(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    await db_pool.execute(
+        "UPDATE slot SET face_type = 'wa_122cm_full' WHERE slot_id = $1;", slot_id
+    )
+    client.cookies.set("arch_stats_auth", jwt_for(archer_id), path="/")
+
+    # WA 122cm face centered at (671, 671): dead center is an X, 200mm out is a 7.
+    for x in (671.0, 871.0):
+        r = await client.post("/api/v0/shot", json={"slot_id": str(slot_id), "x": x, "y": 671.0})
+        assert r.status_code == HTTPStatus.CREATED
+
+    resp = await client.get(f"/api/v0/shot/by-slot/{slot_id}")
+    assert resp.status_code == HTTPStatus.OK
+    scored = sorted((s["score"], s["is_x"]) for s in resp.json())
+    assert scored == [(7, False), (10, True)]
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_idempotency_key_returns_the_original_shot(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    client.cookies.set("arch_stats_auth", jwt_for(archer_id), path="/")
+    body = {"slot_id": str(slot_id), "x": 1.0, "y": 1.0, "score": 9, "idempotency_key": "a-1"}
+
+    first = await client.post("/api/v0/shot", json=body)
+    retry = await client.post("/api/v0/shot", json=body)
+    # A retry reaching another worker, whose cache has never seen the key.
+    shot_manager._recent_shot_ids.clear()
+    other_worker = await client.post("/api/v0/shot", json=body)
+
+    assert first.status_code == retry.status_code == other_worker.status_code == HTTPStatus.CREATED
+    assert first.json() == retry.json() == other_worker.json()
+    count = await db_pool.fetchval("SELECT count(*) FROM shot WHERE slot_id = $1;", slot_id)
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_keyed_batch_is_submitted_in_one_round_trip(
+    client: AsyncClient,
+    db_pool: Pool,
+    jwt_for: Callable[[UUID], str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    client.cookies.set("arch_stats_auth", jwt_for(archer_id), path="/")
+
+    async def step_by_step(*args: object) -> list[UUID]:
+        raise AssertionError("keyed shots left the single round trip")
+
+    monkeypatch.setattr(ShotModel, "insert_with_ids", step_by_step)
+    body = [
+        {"slot_id": str(slot_id), "x": 1.0, "y": 1.0, "score": i, "idempotency_key": f"b-{i}"}
+        for i in range(SHOT_BATCH_SIZE)
+    ]
+
+    first = await client.post("/api/v0/shot", json=body)
+    shot_manager._recent_shot_ids.clear()
+    retry = await client.post("/api/v0/shot", json=body)
+
+    assert first.status_code == retry.status_code == HTTPStatus.CREATED
+    assert first.json() == retry.json()
+    count = await db_pool.fetchval("SELECT count(*) FROM shot WHERE slot_id = $1;", slot_id)
+    assert count == SHOT_BATCH_SIZE
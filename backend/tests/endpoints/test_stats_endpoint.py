@@ -133,3 +133,28 @@ async def test_get_stats_empty_slot(
     assert stats["total_score"] == 0
     assert stats["max_score"] == 0
     assert stats["mean"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_get_stats_counts_a_miss_as_zero(
+    client: AsyncClient, db_pool: Pool, jwt_for: Callable[[UUID], str]
+) -> None:
+    """A miss is stored without coordinates or score and counts as a 0."""
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    await _create_shot_for_test(client, jwt_for, slot_id, archer_id, TEST_SCORE)
+    r = await client.post("/api/v0/shot", json={"slot_id": str(slot_id)})
+    assert r.status_code == HTTPStatus.CREATED
+
+    resp = await client.get(f"/api/v0/stats/{slot_id}")
+
+    assert resp.status_code == HTTPStatus.OK
+    data = resp.json()
+    assert {s["score"] for s in data["scores"]} == {None, TEST_SCORE}
+    stats = data["stats"]
+    assert stats["number_of_shots"] == len(data["scores"])
+    assert stats["total_score"] == TEST_SCORE
@@ -0,0 +1,100 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from asyncpg import Pool
+
+from factories.archer_factory import create_archers
+from factories.session_factory import create_sessions
+from factories.slot_factory import create_slot_assignments
+from factories.target_factory import create_targets
+from models import ShotModel
+from models.parent_model import Column
+from schema import ShotCreate
+
+SHOT_COLUMNS = {
+    "slot_id": Column("uuid", None),
+    "x": Column("double precision", None),
+    "y": Column("double precision", None),
+    "created_at": Column("timestamp with time zone", "now()"),
+}
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_sql_does_not_depend_on_batch_size(db_pool: Pool) -> None:
+    model = ShotModel(db_pool)
+    slot_id = uuid4()
+
+    small_sql, small_values = model.build_bulk_insert_sql_stm(
+        [ShotCreate(slot_id=slot_id)], SHOT_COLUMNS
+    )
+    large_sql, large_values = model.build_bulk_insert_sql_stm(
+        [ShotCreate(slot_id=slot_id, x=1.0, y=2.0), ShotCreate(slot_id=slot_id)] * 50,
+        SHOT_COLUMNS,
+    )
+
+    assert "unnest($1::uuid[]) WITH ORDINALITY" in small_sql
+    assert "unnest($1::uuid[], $2::double precision[], $3::double precision[])" in large_sql
+    assert "ORDER BY u._ord" in large_sql
+    assert small_values == ([slot_id],)
+    assert large_values[1] == [1.0, None] * 50
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_rejects_unknown_columns(db_pool: Pool) -> None:
+    with pytest.raises(ValueError, match="no column"):
+        ShotModel(db_pool).build_bulk_insert_sql_stm(
+            [ShotCreate(slot_id=uuid4(), score=None, is_x=True)], SHOT_COLUMNS
+        )
+
+
+@pytest.mark.asyncio
+async def test_insert_many_goes_past_the_parameter_limit(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    # 10,000 rows of 4 columns would need 40,000 parameters as a VALUES list.
+    qty = 10_000
+    shots = [ShotCreate(slot_id=slot_id, x=0.0, y=0.0, score=i % 11) for i in range(qty)]
+
+    shot_ids = await ShotModel(db_pool).insert_many(shots)
+
+    assert len(set(shot_ids)) == qty
+    scores = await db_pool.fetch("SELECT shot_id, score FROM shot WHERE slot_id = $1;", slot_id)
+    by_id = {row["shot_id"]: row["score"] for row in scores}
+    assert [by_id[shot_id] for shot_id in shot_ids] == [shot.score for shot in shots]
+
+
+@pytest.mark.asyncio
+async def test_column_set_on_some_items_only_gets_its_default_elsewhere(db_pool: Pool) -> None:
+    model = ShotModel(db_pool)
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    sql, values = model.build_bulk_insert_sql_stm(
+        [ShotCreate(slot_id=uuid4(), created_at=created_at), ShotCreate(slot_id=uuid4())],
+        SHOT_COLUMNS,
+    )
+
+    assert "COALESCE(u.created_at, now())" in sql
+    assert values[1] == [created_at, None]
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_ids_in_input_order_when_timestamps_tie(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    # No created_at and no windowing: every row gets the same now().
+    shots = [ShotCreate(slot_id=slot_id, x=0.0, y=0.0, score=score) for score in range(11)]
+
+    submission = await ShotModel(db_pool).submit(shots, archer_id, assign_timestamps=False)
+
+    rows = await db_pool.fetch("SELECT shot_id, score FROM shot WHERE slot_id = $1;", slot_id)
+    by_id = {row["shot_id"]: row["score"] for row in rows}
+    assert [by_id[shot_id] for shot_id in submission.shot_ids] == [shot.score for shot in shots]
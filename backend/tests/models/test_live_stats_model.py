@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+from asyncpg import Pool
+
+from core import NotificationHub
+from factories.archer_factory import create_archers
+from factories.session_factory import create_sessions
+from factories.slot_factory import create_slot_assignments
+from factories.target_factory import create_targets
+from models import LiveStatsModel
+from models.live_stats_model import RESYNC
+
+
+def test_resync_absorbs_pending_shot_payloads() -> None:
+    shot = '{"shot_id": "00000000-0000-0000-0000-000000000001"}'
+
+    assert LiveStatsModel._merge_payloads(RESYNC, shot) == RESYNC
+    assert LiveStatsModel._merge_payloads(shot, RESYNC) == RESYNC
+
+
+@pytest.mark.asyncio
+async def test_stored_shots_are_re_read_after_a_reconnect(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    shot_id = await db_pool.fetchval(
+        "INSERT INTO shot (slot_id, x, y, score) VALUES ($1, 0, 0, 8) RETURNING shot_id;", slot_id
+    )
+    listening = asyncio.Event()
+
+    async def on_listen() -> None:
+        listening.set()
+
+    shots = LiveStatsModel(db_pool).listen_for_shots(slot_id, on_listen=on_listen)
+    first = asyncio.ensure_future(anext(shots))
+    await asyncio.wait_for(listening.wait(), timeout=5)
+    # What the hub queues once it has reconnected.
+    for queue, payload in NotificationHub._resync.items():
+        queue.put_nowait(payload)
+
+    batch = await asyncio.wait_for(first, timeout=5)
+    assert [(shot.shot_id, shot.score) for shot in batch] == [(shot_id, 8)]
+    await shots.aclose()
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+import pytest
+from asyncpg import Pool
+
+from core.settings import settings
+from models import OpenParticipantsRefresher, SlotModel, open_participants
+from models.open_participants import (
+    OPEN_PARTICIPANTS_LIVE,
+    OPEN_PARTICIPANTS_VIEW,
+    REFRESH_QUEUE_LOCK,
+    _refresh_view,
+    open_participants_relation,
+    refresh_open_participants,
+)
+from models.prepared_statements import AnyConnection
+from schema import FullSlotInfo, OpenParticipantsMode
+
+
+def test_live_relation_exposes_every_full_slot_info_column() -> None:
+    for field in FullSlotInfo.model_fields:
+        assert f"{field}," in OPEN_PARTICIPANTS_LIVE or f"AS {field}" in OPEN_PARTICIPANTS_LIVE
+
+
+def test_relation_follows_configured_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "open_participants_mode", OpenParticipantsMode.VIEW)
+    assert open_participants_relation() == OPEN_PARTICIPANTS_VIEW
+
+    monkeypatch.setattr(settings, "open_participants_mode", OpenParticipantsMode.LIVE)
+    assert open_participants_relation() == OPEN_PARTICIPANTS_LIVE
+
+
+@pytest.mark.asyncio
+async def test_live_mode_never_touches_the_database(
+    db_pool: Pool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "open_participants_mode", OpenParticipantsMode.LIVE)
+    model = SlotModel(db_pool)
+
+    def acquire() -> None:
+        raise AssertionError("refresh should not acquire a connection in live mode")
+
+    monkeypatch.setattr(model, "acquire", acquire)
+    await refresh_open_participants(model)
+
+
+@pytest.mark.asyncio
+async def test_debounced_refresher_coalesces_a_burst(
+    db_pool: Pool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    refreshes: list[AnyConnection] = []
+
+    async def fake_refresh(conn: AnyConnection, _: logging.Logger) -> None:
+        refreshes.append(conn)
+
+    monkeypatch.setattr(open_participants, "_refresh_view", fake_refresh)
+    monkeypatch.setattr(settings, "open_participants_refresh_window", 0.05)
+    try:
+        versions = [OpenParticipantsRefresher.request() for _ in range(30)]
+        assert await OpenParticipantsRefresher.wait_for(versions[-1])
+        assert len(refreshes) == 1
+
+        assert await OpenParticipantsRefresher.wait_for(OpenParticipantsRefresher.request())
+        assert len(refreshes) == 2  # noqa: PLR2004
+    finally:
+        await OpenParticipantsRefresher.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_defers_to_the_queued_generation(db_pool: Pool) -> None:
+    async with db_pool.acquire() as leader, db_pool.acquire() as follower:
+        assert await leader.fetchval("SELECT pg_try_advisory_lock($1);", REFRESH_QUEUE_LOCK)
+        waiting = asyncio.create_task(_refresh_view(follower, logging.getLogger("test")))
+
+        await asyncio.sleep(0.2)
+        assert not waiting.done()
+
+        await leader.execute("SELECT pg_advisory_unlock($1);", REFRESH_QUEUE_LOCK)
+        assert await asyncio.wait_for(waiting, timeout=5) is False
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+from asyncpg import Pool
+
+from core import NotificationHub
+from factories.archer_factory import create_archers
+from factories.session_factory import create_sessions
+from models import OpenSessionCache, SessionModel
+from models.open_session_cache import session_update_payload
+from schema import SessionId
+
+
+async def _wait_until(predicate: object) -> None:
+    assert callable(predicate)
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_open_sessions_are_loaded_and_kept_current(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+
+    OpenSessionCache.start()
+    await _wait_until(OpenSessionCache.is_listening)
+    assert OpenSessionCache.contains(session_id)
+
+    model = SessionModel(db_pool)
+    await model.close_session(SessionId(session_id=session_id), archer_id)
+    assert not OpenSessionCache.contains(session_id)
+    assert not await model.does_open_session_exist(session_id)
+
+    # A session opened by another worker arrives through the notification only.
+    await db_pool.execute(
+        "SELECT pg_notify('session_update', $1);", session_update_payload(session_id, True)
+    )
+    await _wait_until(lambda: OpenSessionCache.contains(session_id))
+
+
+@pytest.mark.asyncio
+async def test_set_is_reloaded_after_the_listener_reconnects(db_pool: Pool) -> None:
+    (session_id,) = await create_sessions(db_pool, 1)
+    OpenSessionCache.start()
+    await _wait_until(OpenSessionCache.is_listening)
+    assert OpenSessionCache.contains(session_id)
+
+    # Closed without a notification, as if it was sent while the LISTEN
+    # connection was down: only the reload after the reconnect can tell.
+    await db_pool.execute("UPDATE session SET is_opened = FALSE WHERE session_id = $1;", session_id)
+    assert OpenSessionCache.contains(session_id)
+    generation = NotificationHub.generation()
+    assert NotificationHub._conn is not None
+    pid = NotificationHub._conn.get_server_pid()
+    await db_pool.execute("SELECT pg_terminate_backend($1);", pid)
+    await _wait_until(lambda: NotificationHub.generation() > generation)
+
+    await _wait_until(OpenSessionCache.is_listening)
+    assert not OpenSessionCache.contains(session_id)
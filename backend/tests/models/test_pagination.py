@@ -0,0 +1,49 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from asyncpg import Pool
+
+from models import ShotModel
+from schema import PageCursor, PageRequest, ShotFilter
+
+
+def test_page_cursor_round_trips_through_token() -> None:
+    cursor = PageCursor(created_at=datetime.now(UTC), id=uuid4())
+
+    assert PageCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "eyJmb28iOiAxfQ"])
+def test_page_cursor_rejects_foreign_tokens(token: str) -> None:
+    with pytest.raises(ValueError, match="Invalid page cursor"):
+        PageCursor.decode(token)
+
+
+@pytest.mark.asyncio
+async def test_keyset_select_binds_cursor_after_filter_values(db_pool: Pool) -> None:
+    model = ShotModel(db_pool)
+    slot_id = uuid4()
+    cursor = PageCursor(created_at=datetime.now(UTC), id=uuid4())
+
+    sql, values = model.build_select_sql_stm(
+        ShotFilter(slot_id=slot_id), [], page=PageRequest(limit=11, cursor=cursor)
+    )
+
+    assert "(created_at, shot_id) > ($2, $3)" in sql
+    assert "ORDER BY created_at ASC, shot_id ASC" in sql
+    assert "LIMIT 11" in sql
+    assert values == (slot_id, cursor.created_at, cursor.id)
+
+
+@pytest.mark.asyncio
+async def test_first_keyset_page_has_no_cursor_predicate(db_pool: Pool) -> None:
+    model = ShotModel(db_pool)
+
+    sql, values = model.build_select_sql_stm(
+        ShotFilter(), [], is_desc=True, page=PageRequest(limit=5)
+    )
+
+    assert "WHERE" not in sql
+    assert "ORDER BY created_at DESC, shot_id DESC" in sql
+    assert values == ()
@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from uuid import uuid4
+
+import pytest
+from asyncpg import Pool
+
+from models import SlotModel
+from models.prepared_statements import PreparedStatementRegistry
+from models.slot_model import SLOT_BY_ID_STM
+
+
+@pytest.fixture
+def registry_snapshot() -> Iterator[None]:
+    """Restore the process-wide registry, so test statements never reach pooled connections."""
+    statements = dict(PreparedStatementRegistry._statements)
+    try:
+        yield
+    finally:
+        PreparedStatementRegistry._statements.clear()
+        PreparedStatementRegistry._statements.update(statements)
+
+
+@pytest.mark.usefixtures("registry_snapshot")
+def test_registry_rejects_conflicting_sql() -> None:
+    name = PreparedStatementRegistry.register("test_select_one", "SELECT 1;")
+
+    assert PreparedStatementRegistry.register(name, "SELECT 1;") == name
+    with pytest.raises(ValueError, match="already registered"):
+        PreparedStatementRegistry.register(name, "SELECT 2;")
+
+
+def test_hot_path_statements_are_registered() -> None:
+    names = PreparedStatementRegistry.names()
+
+    for name in (
+        "slot_by_id",
+        "open_session_by_id",
+        "live_stat_by_slot_id",
+        "latest_shot_time",
+        "shot_insert",
+    ):
+        assert name in names
+
+
+@pytest.mark.asyncio
+async def test_pooled_connections_are_prepared_on_init(db_pool: Pool) -> None:
+    async with db_pool.acquire() as conn:
+        named_statements = getattr(conn, "named_statements", {})
+        assert SLOT_BY_ID_STM in named_statements
+
+    model = SlotModel(db_pool)
+    assert await model.fetch_named(SLOT_BY_ID_STM, (uuid4(),)) == []
@@ -0,0 +1,111 @@
+import asyncio
+import hashlib
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from asyncpg import Pool
+
+from core import NotificationHub
+from factories.archer_factory import create_archers
+from models import AuthModel, RevokedSessionCache
+from schema import AuthCreate
+
+
+async def _wait_until(predicate: object) -> None:
+    assert callable(predicate)
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_revocations_are_loaded_and_kept_current(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    now = datetime.now(UTC)
+    model = AuthModel(db_pool)
+    revoked_hash, live_hash = hashlib.sha256(b"revoked").digest(), hashlib.sha256(b"live").digest()
+    for token_hash in (revoked_hash, live_hash):
+        await model.insert_one(
+            AuthCreate(
+                archer_id=archer_id,
+                session_token_hash=token_hash,
+                created_at=now,
+                expires_at=now + timedelta(hours=1),
+            )
+        )
+    await model.revoke_by_hash(revoked_hash, now)
+    await RevokedSessionCache.close()
+
+    # Not listening yet: answered by the database.
+    assert await RevokedSessionCache.is_revoked(revoked_hash)
+    assert not await RevokedSessionCache.is_revoked(live_hash)
+
+    RevokedSessionCache.start()
+    await _wait_until(RevokedSessionCache.is_listening)
+    assert RevokedSessionCache.size() == 1
+    assert await RevokedSessionCache.is_revoked(revoked_hash)
+    assert not await RevokedSessionCache.is_revoked(live_hash)
+
+    # A logout handled by another worker arrives through the notification only.
+    other_hash = hashlib.sha256(b"other").digest()
+    expected_size = RevokedSessionCache.size() + 1
+    await db_pool.execute("SELECT pg_notify('auth_revoked', $1);", other_hash.hex())
+    await _wait_until(lambda: RevokedSessionCache.size() == expected_size)
+    assert await RevokedSessionCache.is_revoked(other_hash)
+
+    await RevokedSessionCache.close()
+    assert RevokedSessionCache.size() == 0
+
+
+@pytest.mark.asyncio
+async def test_set_is_reloaded_after_the_listener_reconnects(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    now = datetime.now(UTC)
+    token_hash = hashlib.sha256(b"missed").digest()
+    await AuthModel(db_pool).insert_one(
+        AuthCreate(
+            archer_id=archer_id,
+            session_token_hash=token_hash,
+            created_at=now,
+            expires_at=now + timedelta(hours=1),
+        )
+    )
+    RevokedSessionCache.start()
+    await _wait_until(RevokedSessionCache.is_listening)
+
+    # Revoked without a notification, as if it was sent while the LISTEN
+    # connection was down: only the reload after the reconnect can tell.
+    await db_pool.execute(
+        "UPDATE auth SET revoked_at = now() WHERE session_token_hash = $1;", token_hash
+    )
+    assert not await RevokedSessionCache.is_revoked(token_hash)
+    generation = NotificationHub.generation()
+    assert NotificationHub._conn is not None
+    await db_pool.execute(
+        "SELECT pg_terminate_backend($1);", NotificationHub._conn.get_server_pid()
+    )
+    await _wait_until(lambda: NotificationHub.generation() > generation)
+
+    # Answered by the database until the set is reloaded, then by the set.
+    assert await RevokedSessionCache.is_revoked(token_hash)
+    await _wait_until(RevokedSessionCache.is_listening)
+    assert await RevokedSessionCache.is_revoked(token_hash)
+
+
+@pytest.mark.asyncio
+async def test_hashes_of_expired_sessions_are_pruned(monkeypatch: pytest.MonkeyPatch) -> None:
+    expired_hash, live_hash = hashlib.sha256(b"expired").digest(), hashlib.sha256(b"live").digest()
+    now = datetime.now(UTC)
+    monkeypatch.setattr(
+        RevokedSessionCache,
+        "_hashes",
+        {expired_hash: now - timedelta(seconds=1), live_hash: now + timedelta(hours=1)},
+    )
+    monkeypatch.setattr(RevokedSessionCache, "_next_prune", now)
+
+    new_hash = hashlib.sha256(b"new").digest()
+    RevokedSessionCache.mark(new_hash)
+
+    assert set(RevokedSessionCache._hashes) == {live_hash, new_hash}
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from asyncpg import Pool
+
+from core import NotificationHub
+from factories.archer_factory import create_archers
+from factories.session_factory import create_sessions
+from factories.slot_factory import create_slot_assignments
+from factories.target_factory import create_targets
+from models import SlotCache, SlotModel
+from schema import SlotFilter, SlotSet
+
+
+async def _wait_until_listening() -> None:
+    for _ in range(50):
+        if SlotCache.is_listening():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("slot cache listener did not start")
+
+
+@pytest.mark.asyncio
+async def test_slot_update_invalidates_every_cached_copy(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    model = SlotModel(db_pool)
+
+    await model.get_by_id(slot_id)
+    await _wait_until_listening()
+    assert (await model.get_by_id(slot_id)).is_shooting is True
+    assert (await model.get_by_id(slot_id)) is SlotCache.get(slot_id)
+
+    # Simulate another worker: a peer's update only reaches us through NOTIFY.
+    await db_pool.execute("SELECT pg_notify('slot_update', $1);", str(slot_id))
+    for _ in range(50):
+        if SlotCache.get(slot_id) is None:
+            break
+        await asyncio.sleep(0.05)
+    assert SlotCache.get(slot_id) is None
+
+    await model.get_by_id(slot_id)
+    await model.update(SlotSet(is_shooting=False), SlotFilter(slot_id=slot_id))
+    assert (await model.get_by_id(slot_id)).is_shooting is False
+
+
+@pytest.mark.asyncio
+async def test_row_read_before_an_invalidation_is_not_cached(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    model = SlotModel(db_pool)
+    await model.get_by_id(slot_id)
+    await _wait_until_listening()
+    SlotCache.invalidate([slot_id])
+
+    # A reader fetched the row, then a concurrent update's invalidation landed.
+    generation = SlotCache.generation()
+    stale = await model.get_by_id(slot_id)
+    SlotCache.invalidate([slot_id])
+    SlotCache.put(stale, generation)
+
+    assert SlotCache.get(slot_id) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bypassed_then_cleared_across_a_reconnect(db_pool: Pool) -> None:
+    (archer_id,) = await create_archers(db_pool, 1)
+    (session_id,) = await create_sessions(db_pool, 1)
+    (target_id,) = await create_targets(db_pool, 1, session_id=session_id)
+    (slot_id,) = await create_slot_assignments(
+        db_pool, 1, archer_ids=[archer_id], target_id=target_id, session_id=session_id
+    )
+    model = SlotModel(db_pool)
+    await model.get_by_id(slot_id)
+    await _wait_until_listening()
+    await model.get_by_id(slot_id)
+    assert SlotCache.get(slot_id) is not None
+
+    generation = NotificationHub.generation()
+    assert NotificationHub._conn is not None
+    await db_pool.execute(
+        "SELECT pg_terminate_backend($1);", NotificationHub._conn.get_server_pid()
+    )
+    for _ in range(100):
+        if NotificationHub.generation() > generation:
+            break
+        await asyncio.sleep(0.05)
+    # Updated without a notification, as if it was sent while the connection was down.
+    await db_pool.execute("UPDATE slot SET is_shooting = FALSE WHERE slot_id = $1;", slot_id)
+
+    assert (await model.get_by_id(slot_id)).is_shooting is False
+    await _wait_until_listening()
+    assert (await model.get_by_id(slot_id)).is_shooting is False
@@ -0,0 +1,62 @@
+from uuid import uuid4
+
+import pytest
+from asyncpg import Pool
+
+from models import SessionModel, SlotModel
+from models.statement_cache import StatementCache
+from schema import SessionFilter, SlotFilter
+
+
+def test_statement_cache_counts_hits_and_misses() -> None:
+    cache = StatementCache(max_size=2)
+    builds: list[str] = []
+
+    def build() -> str:
+        builds.append("built")
+        return "SELECT 1;"
+
+    assert cache.get_or_build(("a",), build) == "SELECT 1;"
+    assert cache.get_or_build(("a",), build) == "SELECT 1;"
+
+    assert builds == ["built"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_statement_cache_evicts_least_recently_used() -> None:
+    cache = StatementCache(max_size=2)
+    cache.get_or_build(("a",), lambda: "A")
+    cache.get_or_build(("b",), lambda: "B")
+    cache.get_or_build(("a",), lambda: "A")
+    cache.get_or_build(("c",), lambda: "C")
+
+    assert cache.get_or_build(("b",), lambda: "B2") == "B2"
+    assert cache.get_or_build(("a",), lambda: "A2") == "A"
+
+
+@pytest.mark.asyncio
+async def test_same_filter_shape_reuses_sql_text(db_pool: Pool) -> None:
+    model = SlotModel(db_pool)
+    first_id, second_id = uuid4(), uuid4()
+
+    sql_1, values_1 = model.build_select_sql_stm(SlotFilter(slot_id=first_id), [])
+    misses = model.statement_cache.misses
+    sql_2, values_2 = model.build_select_sql_stm(SlotFilter(slot_id=second_id), [])
+
+    assert sql_1 is sql_2
+    assert model.statement_cache.misses == misses
+    assert values_1 == (first_id,)
+    assert values_2 == (second_id,)
+
+
+@pytest.mark.asyncio
+async def test_filter_values_follow_sorted_keys(db_pool: Pool) -> None:
+    model = SessionModel(db_pool)
+    session_id = uuid4()
+
+    sql, values = model.build_select_sql_stm(
+        SessionFilter(session_id=session_id, is_opened=True), []
+    )
+
+    assert sql.index("is_opened = $1") < sql.index("session_id = $2")
+    assert values == (True, session_id)